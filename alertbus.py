@@ -0,0 +1,256 @@
+"""Alert bus: detectors publish alert events, sinks consume them off the detection path."""
+import json
+import socket
+import threading
+import time
+from collections import deque, namedtuple
+
+from eventstore import event_row
+
+
+# One alert (or incident recovery, with alert None) as every sink sees it
+AlertEvent = namedtuple('AlertEvent', ['alert', 'log_entry', 'log_line', 'resource', 'created'])
+
+# What a sink does when its queue is full
+BACKPRESSURE_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+
+
+class PolledSink:
+    """Bounded queue of events that a consumer drains from its own thread (e.g. the Tk loop)."""
+
+    def __init__(self, name, max_pending=1024, policy='drop_oldest'):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"backpressure policy must be one of {', '.join(BACKPRESSURE_POLICIES)}")
+        self.name = name
+        self.max_pending = max_pending
+        self.policy = policy
+        self.dropped = 0
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._stopping = False
+
+    def offer(self, event):
+        """Queue an event, applying the backpressure policy if the queue is full."""
+        with self._cond:
+            if len(self._pending) >= self.max_pending:
+                if self.policy == 'block':
+                    self._cond.wait_for(lambda: len(self._pending) < self.max_pending or self._stopping)
+                elif self.policy == 'drop_newest':
+                    self.dropped += 1
+                    return False
+                else:
+                    self._pending.popleft()
+                    self.dropped += 1
+            self._pending.append(event)
+            self.queued()
+            return True
+
+    def queued(self):
+        """Called with the lock held after each offer()."""
+
+    def drain(self, limit=None):
+        """Remove and return up to limit queued events (all of them by default)."""
+        with self._cond:
+            count = len(self._pending) if limit is None else min(limit, len(self._pending))
+            events = [self._pending.popleft() for _ in range(count)]
+            self._cond.notify_all()  # wake publishers blocked on a full queue
+            return events
+
+    def sync(self, timeout=None):
+        """Nothing to wait for: the consumer drains on its own schedule."""
+
+    def stop(self):
+        """Release publishers blocked on a full queue."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+
+class AlertSink(PolledSink, threading.Thread):
+    """A sink with its own worker thread that writes events in batches.
+
+    The worker wakes once `batch_size` events are queued (or on the timer)
+    and write(events) gets at most `max_batch` (default batch_size) at a
+    time, so a sink can react to every event yet still batch a backlog.
+    flush() runs
+    every `flush_interval` seconds while there is unflushed output, on
+    sync(), and on stop(), which drains the queue before the thread exits.
+    A slow sink only backs up its own queue.
+    """
+
+    def __init__(self, name, batch_size=64, max_pending=10000, policy='drop_oldest', flush_interval=1.0,
+                 max_batch=None):
+        threading.Thread.__init__(self, name=name, daemon=True)
+        PolledSink.__init__(self, name, max_pending, policy)
+        self.batch_size = batch_size
+        self.max_batch = max_batch or batch_size
+        self.flush_interval = flush_interval
+        self._requested = 0  # sync() generations asked for ...
+        self._flushed = 0  # ... and completed
+
+    def write(self, events):
+        """Handle one batch of events."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Make written events durable/visible; called from the worker thread."""
+
+    def close(self):
+        """Release resources once the worker has drained its queue."""
+
+    def queued(self):
+        # Wake the worker once a full batch is waiting; smaller ones go out on the timer
+        if len(self._pending) >= self.batch_size:
+            self._cond.notify_all()
+
+    def sync(self, timeout=None):
+        """Block until everything queued so far has been written and flushed."""
+        if not self.is_alive():
+            return
+        with self._cond:
+            self._requested += 1
+            generation = self._requested
+            self._cond.notify_all()
+            self._cond.wait_for(lambda: self._flushed >= generation or not self.is_alive(), timeout)
+
+    def stop(self):
+        """Drain and flush the queue, then stop the worker thread."""
+        PolledSink.stop(self)
+        if self.is_alive():
+            self.join()
+
+    def run(self):
+        dirty = False
+        last_flush = time.monotonic()
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: len(self._pending) >= self.batch_size or self._stopping
+                    or self._requested > self._flushed,
+                    self.flush_interval
+                )
+                count = min(self.max_batch, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(count)]
+                requested = self._requested
+                idle = not self._pending
+                # Flush after the last batch, and only then
+                finishing = not self._pending and (self._stopping or requested > self._flushed)
+                self._cond.notify_all()  # wake publishers blocked on a full queue
+
+            if batch:
+                try:
+                    self.write(batch)
+                except Exception as e:
+                    print(f"Error in alert sink {self.name}: {e}")
+                dirty = True
+
+            now = time.monotonic()
+            if finishing or (dirty and idle and now - last_flush >= self.flush_interval):
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"Error flushing alert sink {self.name}: {e}")
+                dirty = False
+                last_flush = now
+            if finishing:
+                with self._cond:
+                    self._flushed = max(self._flushed, requested)
+                    self._cond.notify_all()
+                    if self._stopping and not self._pending:
+                        break
+
+        try:
+            self.close()
+        except Exception as e:
+            print(f"Error closing alert sink {self.name}: {e}")
+
+
+class EventStoreSink(AlertSink):
+    """Insert events into the EventStore, one transaction per batch.
+
+    Events written are then offered to `downstream` (e.g. the UI listeners'
+    sink), so whoever reacts to them can already query them from the store.
+    """
+
+    def __init__(self, store, downstream=None, **options):
+        super().__init__('events', **options)
+        self.store = store
+        self.downstream = downstream
+
+    def write(self, events):
+        self.store.insert([event_row(event.created, event.resource, event.alert, event.log_entry)
+                           for event in events])
+        if self.downstream is not None:
+            for event in events:
+                self.downstream.offer(event)
+
+    def close(self):
+        self.store.close()  # this worker thread's connection
+
+
+class LogFileSink(AlertSink):
+    """Write the CSV line of each event to a BufferedLogWriter (system_logs.txt)."""
+
+    def __init__(self, log_writer, **options):
+        super().__init__('log_file', **options)
+        self.log_writer = log_writer
+
+    def write(self, events):
+        for event in events:
+            self.log_writer.write(event.log_line)
+
+    def flush(self):
+        self.log_writer.flush()
+
+
+class SocketSink(AlertSink):
+    """Send each event as one JSON datagram to a local UDP listener (host:port)."""
+
+    def __init__(self, address, **options):
+        super().__init__('socket', **options)
+        host, port = address.rsplit(':', 1)
+        self.address = (host, int(port))
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def write(self, events):
+        for event in events:
+            message = {
+                'alert': event.alert._asdict() if event.alert is not None else None,
+                'log': event.log_entry._asdict(),
+            }
+            try:
+                self.socket.sendto(json.dumps(message).encode(), self.address)
+            except OSError:
+                self.dropped += 1  # nobody listening, or the receiver is full
+
+    def close(self):
+        self.socket.close()
+
+
+class AlertBus:
+    """Fan published alert events out to every registered sink."""
+
+    def __init__(self):
+        self.sinks = []
+
+    def add(self, sink):
+        """Register a sink, starting its worker thread if it has one; returns it."""
+        self.sinks.append(sink)
+        if isinstance(sink, threading.Thread):
+            sink.start()
+        return sink
+
+    def publish(self, event):
+        """Hand an event to every sink; only a full 'block' sink can make this wait."""
+        for sink in self.sinks:
+            sink.offer(event)
+
+    def sync(self):
+        """Wait until every sink has written and flushed what was published so far."""
+        for sink in self.sinks:
+            sink.sync()
+
+    def close(self):
+        """Drain, flush and stop every sink."""
+        for sink in self.sinks:
+            sink.stop()
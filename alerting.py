@@ -0,0 +1,320 @@
+"""Alert and log storage for the monitoring engine."""
+import os
+import threading
+import time
+from collections import namedtuple
+
+
+# Compact records instead of one dict per entry
+Alert = namedtuple('Alert', ['priority', 'message', 'details', 'time', 'process_name'])
+LogEntry = namedtuple('LogEntry', [
+    'timestamp', 'source_ip', 'event', 'severity', 'status', 'action', 'user', 'process'
+])
+
+
+def alert_from_dict(data):
+    """Build an Alert from its JSON form (older files have no process_name)."""
+    return Alert(
+        data.get('priority', 'High'),
+        data.get('message', ''),
+        data.get('details', ''),
+        data.get('time', ''),
+        data.get('process_name', 'System')
+    )
+
+
+def log_from_dict(data):
+    """Build a LogEntry from its JSON form (older files have no process)."""
+    return LogEntry(
+        data.get('timestamp', ''),
+        data.get('source_ip', 'localhost'),
+        data.get('event', ''),
+        data.get('severity', 'High'),
+        data.get('status', 'Alert'),
+        data.get('action', ''),
+        data.get('user', 'system'),
+        data.get('process', 'System')
+    )
+
+
+class RingBuffer:
+    """Fixed-capacity store with O(1) append that reads newest first.
+
+    Once full, each append overwrites the oldest entry. Indexing, slicing
+    and iteration all start from the newest entry, like the lists with
+    insert(0, ...) that this replaces.
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        # Grown on demand up to capacity, so an empty store costs nothing
+        self._items = []
+        self._next = 0  # slot the next append writes to once full
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def append(self, item):
+        """Add an entry as the newest, dropping the oldest if full."""
+        if len(self._items) < self.capacity:
+            self._items.append(item)
+        else:
+            self._items[self._next] = item
+            self._next = (self._next + 1) % self.capacity
+
+    def extend_oldest_first(self, items):
+        """Append entries given in oldest-to-newest order."""
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        """Remove every entry."""
+        self._items = []
+        self._next = 0
+
+    def _slot(self, i):
+        """Map a newest-first index to its position in _items."""
+        size = len(self._items)
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError("ring buffer index out of range")
+        newest = (self._next - 1) % size if size == self.capacity else size - 1
+        return (newest - i) % size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        return self._items[self._slot(index)]
+
+    def __iter__(self):
+        """Iterate newest first."""
+        items = self._items
+        size = len(items)
+        if size < self.capacity:
+            return reversed(items)
+        newest = (self._next - 1) % size
+        return (items[(newest - i) % size] for i in range(size))
+
+
+class Incident:
+    """One sustained breach of a (resource, process) key, however many samples it spans.
+
+    An incident starts out 'pending' and only becomes 'open' (and alerts)
+    once the breach has lasted long enough.
+    """
+
+    def __init__(self, key, value, now):
+        self.key = key
+        self.state = 'pending'
+        self.first_seen = now
+        self.last_seen = now
+        self.count = 1  # samples above the raise threshold
+        self.peak = value
+        self.below = 0  # consecutive samples under the clear threshold
+        self.alerted = False  # False if its alert was rate limited
+
+    @property
+    def resource(self):
+        return self.key[0]
+
+    @property
+    def process_name(self):
+        return self.key[1]
+
+    @property
+    def duration(self):
+        return self.last_seen - self.first_seen
+
+    def update(self, value, now):
+        """Fold another breaching sample into the incident."""
+        self.last_seen = now
+        self.count += 1
+        self.peak = max(self.peak, value)
+
+
+class IncidentTracker:
+    """Per-key alert state machine with hysteresis and a minimum duration.
+
+    A key goes pending on its first sample above the raise threshold and
+    opens once it has stayed above it for `raise_samples` samples spanning
+    at least `raise_seconds`; a dip back to the threshold before then
+    drops it silently. An open incident only closes after `clear_samples`
+    consecutive samples below the (lower) clear threshold, so a metric
+    hovering at its limit stays one incident instead of flapping.
+
+    Each tick, sample() every breaching or tracked key, then close_unseen()
+    the tracked keys that were not sampled.
+    """
+
+    def __init__(self, raise_samples=3, raise_seconds=0.0, clear_samples=3):
+        self.raise_samples = raise_samples
+        self.raise_seconds = raise_seconds
+        self.clear_samples = clear_samples
+        self.incidents = {}  # (resource, process_name) -> pending or open Incident
+        self._seen = set()
+
+    def tracked(self):
+        """Return the keys of every pending or open incident."""
+        return list(self.incidents)
+
+    def sample(self, key, value, now, raise_at, clear_at):
+        """Feed one sample; return ('opened' | 'closed', incident) on a transition, else None."""
+        self._seen.add(key)
+        incident = self.incidents.get(key)
+        if incident is None:
+            if value <= raise_at:
+                return None
+            incident = self.incidents[key] = Incident(key, value, now)
+        elif incident.state == 'pending':
+            if value <= raise_at:
+                del self.incidents[key]  # too short to count as an incident
+                return None
+            incident.update(value, now)
+        else:
+            if value < clear_at:
+                incident.below += 1
+                incident.last_seen = now
+                if incident.below >= self.clear_samples:
+                    del self.incidents[key]
+                    return 'closed', incident
+                return None
+            incident.below = 0
+            if value > raise_at:
+                incident.update(value, now)
+            else:
+                incident.last_seen = now
+            return None
+
+        if incident.count >= self.raise_samples and incident.duration >= self.raise_seconds:
+            incident.state = 'open'
+            return 'opened', incident
+        return None
+
+    def close_unseen(self, keep=None):
+        """Drop the keys not sampled this tick and return the open incidents among them.
+
+        keep(key) may hold an incident anyway (e.g. its process was not
+        sampled this tick, so whether it recovered is unknown).
+        """
+        closed = []
+        for key in list(self.incidents):
+            if key in self._seen or (keep is not None and keep(key)):
+                continue
+            incident = self.incidents.pop(key)
+            if incident.state == 'open':
+                closed.append(incident)
+        self._seen = set()
+        return closed
+
+
+class AlertRateLimiter:
+    """Per-key token buckets in front of alert emission.
+
+    Each key may raise `burst` alerts at once, then one more every
+    `refill_seconds`. Suppressed alerts are counted per key (and in total)
+    so the next alert let through, and the UI, can report them.
+    """
+
+    def __init__(self, burst=3, refill_seconds=60.0, max_keys=4096):
+        self.burst = burst
+        self.refill_seconds = refill_seconds
+        self.max_keys = max_keys
+        self.buckets = {}  # key -> [tokens, time of last refill]
+        self.suppressed = {}  # key -> alerts suppressed since the last one let through
+        self.total_suppressed = 0
+
+    def allow(self, key, now=None):
+        """Take a token for key; return False (and count it) if the bucket is empty."""
+        if now is None:
+            now = time.monotonic()
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_keys:
+                self.prune(now)
+            bucket = self.buckets[key] = [float(self.burst), now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) / self.refill_seconds)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+        self.suppressed[key] = self.suppressed.get(key, 0) + 1
+        self.total_suppressed += 1
+        return False
+
+    def take_suppressed(self, key):
+        """Return and reset the number of alerts suppressed for key."""
+        return self.suppressed.pop(key, 0)
+
+    def prune(self, now):
+        """Forget buckets that have refilled completely (they behave like new ones)."""
+        for key, (tokens, last) in list(self.buckets.items()):
+            if tokens + (now - last) / self.refill_seconds >= self.burst and key not in self.suppressed:
+                del self.buckets[key]
+
+
+class BufferedLogWriter:
+    """Long-lived, buffered appender for a text log such as system_logs.txt.
+
+    Lines are collected in memory and written with one call when
+    `buffer_size` bytes are pending or flush() is called. The fsync policy
+    decides when written data is forced to disk:
+
+        'none'      never; the OS writes it back in its own time
+        'interval'  on every flush() (the caller's periodic flush)
+        'always'    after every line, which also flushes every line
+    """
+
+    FSYNC_POLICIES = ('none', 'interval', 'always')
+
+    def __init__(self, path, header=None, buffer_size=64 * 1024, fsync='interval'):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"fsync policy must be one of {', '.join(self.FSYNC_POLICIES)}")
+        self.path = path
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self._pending = []
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._file = open(path, 'a')
+        if header is not None and self._file.tell() == 0:  # Only write header if file is empty
+            self._file.write(header)
+            self._file.flush()
+
+    def write(self, line):
+        """Append one line (including its newline)."""
+        with self._lock:
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if self.fsync == 'always':
+                self._write_pending(sync=True)
+            elif self._pending_bytes >= self.buffer_size:
+                self._write_pending(sync=False)
+
+    def flush(self):
+        """Write pending lines, and fsync them under the 'interval' policy."""
+        with self._lock:
+            self._write_pending(sync=self.fsync != 'none')
+
+    def close(self):
+        """Write anything pending and close the file."""
+        with self._lock:
+            self._write_pending(sync=self.fsync != 'none')
+            self._file.close()
+
+    def _write_pending(self, sync):
+        """Write the pending lines in one call (the caller holds the lock)."""
+        if self._pending:
+            self._file.write(''.join(self._pending))
+            self._pending = []
+            self._pending_bytes = 0
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
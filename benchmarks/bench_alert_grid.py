@@ -0,0 +1,112 @@
+"""Render time of the Alerts grid (CanvasTable) for 1k, 10k and 100k alerts.
+
+For each size it times loading the alerts and drawing the first screen,
+sorting by Priority, jumping to the middle of the grid, and adding 10 new
+alerts. The old frame-and-label-per-cell table is timed alongside for
+sizes it can manage. Needs a display.
+
+    python benchmarks/bench_alert_grid.py [sizes...]
+"""
+import os
+import random
+import sys
+import time
+
+import customtkinter as ctk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alerting import Alert  # noqa: E402
+from tables import CanvasTable  # noqa: E402
+
+COLUMNS = [("Time", 100), ("Priority", 80), ("Process", 150), ("Alert Type", 200), ("Resource Usage", 300)]
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+WIDGET_TABLE_MAX = 1000  # the per-cell widget table takes minutes beyond this
+
+
+def make_alerts(count):
+    """(id, Alert) pairs, newest first."""
+    random.seed(count)
+    alerts = []
+    for i in range(count, 0, -1):
+        process = random.choice(["python", "chrome", "postgres", "node", "java"])
+        alerts.append((i, Alert(
+            priority=random.choice(list(PRIORITY_RANK)),
+            message=f"Process {process} exceeded limits",
+            details=f"Resource Usage - CPU: {random.uniform(0, 100):.1f}%, Memory: {random.uniform(0, 100):.1f}%",
+            time=f"{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+            process_name=process
+        )))
+    return alerts
+
+
+def cells(alert):
+    color = {"High": "#FF4444", "Medium": "#FFA500"}.get(alert.priority)
+    return [(alert.time, None), (alert.priority, color), (alert.process_name, None),
+            (alert.message, None), (alert.details.split("- ")[1], None)]
+
+
+def timed(root, func):
+    """Run func, let Tk draw the result, and return the seconds taken."""
+    started = time.perf_counter()
+    func()
+    root.update()
+    return time.perf_counter() - started
+
+
+def canvas_grid(root, alerts):
+    """Time each stage of the CanvasTable; returns {stage: seconds}."""
+    frame = ctk.CTkFrame(root)
+    frame.pack(fill="both", expand=True)
+    newer = []
+    table = CanvasTable(
+        frame, COLUMNS, cells,
+        sort_keys=[None, lambda alert: PRIORITY_RANK[alert.priority], None, None, None],
+        fetch_newer=lambda after: newer
+    )
+    root.update()  # size the canvas, so the pool of drawn rows exists
+    results = {
+        'load': timed(root, lambda: table.load(alerts)),
+        'sort': timed(root, lambda: table.sort_by(1)),
+        'scroll': timed(root, lambda: table.on_scrollbar('moveto', '0.5')),
+    }
+    newer.extend(make_alerts(10))
+    newer[:] = [(len(alerts) + record_id, alert) for record_id, alert in newer]
+    results['add 10'] = timed(root, table.refresh)
+    frame.destroy()
+    return results
+
+
+def widget_table(root, alerts):
+    """Time the previous approach: one frame and label per cell, for every row."""
+    def build():
+        for i, (_, alert) in enumerate(alerts):
+            row = ctk.CTkFrame(frame, fg_color=("gray17", "gray20")[i % 2], height=26)
+            row.pack(fill="x", pady=1)
+            row.pack_propagate(False)
+            for (text, text_color), (_, width) in zip(cells(alert), COLUMNS):
+                cell = ctk.CTkFrame(row, width=width, fg_color="transparent")
+                cell.pack(side="left", padx=3)
+                cell.pack_propagate(False)
+                ctk.CTkLabel(cell, text=text, font=("Helvetica", 11), text_color=text_color).pack(expand=True)
+
+    frame = ctk.CTkScrollableFrame(root)
+    frame.pack(fill="both", expand=True)
+    seconds = timed(root, build)
+    frame.destroy()
+    return seconds
+
+
+def main(sizes):
+    root = ctk.CTk()
+    root.geometry("900x700")
+    print(f"{'alerts':>8} {'load':>9} {'sort':>9} {'scroll':>9} {'add 10':>9} {'widgets':>9}")
+    for size in sizes:
+        alerts = make_alerts(size)
+        grid = canvas_grid(root, alerts)
+        widgets = f"{widget_table(root, alerts) * 1000:7.1f}ms" if size <= WIDGET_TABLE_MAX else "-"
+        print(f"{size:>8} " + " ".join(f"{grid[stage] * 1000:7.1f}ms" for stage in grid) + f" {widgets:>9}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [1000, 10000, 100000])
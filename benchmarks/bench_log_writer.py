@@ -0,0 +1,64 @@
+"""Events/second written to system_logs.txt: open/append/close per event vs. BufferedLogWriter.
+
+The buffered writer is measured under each fsync policy. 'interval' and
+'none' are given one flush() at the end, as the engine's background
+flush would do; 'always' fsyncs every line, so it runs fewer events.
+
+    python benchmarks/bench_log_writer.py [events]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alerting import BufferedLogWriter  # noqa: E402
+
+LINE = "2024-01-01 12:00:00,Process,Process python exceeded limits,High,Alert,Process Monitoring,system\n"
+
+
+def open_per_event(path, events):
+    """The old approach: one open/write/close per event."""
+    for _ in range(events):
+        with open(path, 'a') as f:
+            f.write(LINE)
+
+
+def buffered(path, events, fsync):
+    """One long-lived writer, flushed once at the end."""
+    writer = BufferedLogWriter(path, fsync=fsync)
+    for _ in range(events):
+        writer.write(LINE)
+    writer.close()
+
+
+def rate(func, *args, events, repeat=3):
+    """Return the best events/second of func(path, *args) over a fresh file each run."""
+    best = float('inf')
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'system_logs.txt')
+            started = time.perf_counter()
+            func(path, *args)
+            best = min(best, time.perf_counter() - started)
+    return events / best
+
+
+def main(events):
+    synced = max(1, events // 100)
+    cases = [
+        ("open/append/close", open_per_event, (events,), events),
+        ("buffered, fsync=none", buffered, (events, 'none'), events),
+        ("buffered, fsync=interval", buffered, (events, 'interval'), events),
+        ("buffered, fsync=always", buffered, (synced, 'always'), synced),
+    ]
+    print(f"{'writer':<26} {'events':>8} {'events/s':>12} {'speedup':>8}")
+    baseline = None
+    for label, func, args, count in cases:
+        result = rate(func, *args, events=count)
+        baseline = baseline or result
+        print(f"{label:<26} {count:>8} {result:>12,.0f} {result / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,57 @@
+"""Tick latency of the /proc process scan vs. number of collector worker processes.
+
+A synthetic PID set of the requested size is built by cycling through the
+PIDs that are actually running, so every read still hits /proc. Worker
+count 0 is the in-thread scan; the speedup depends on the host's cores.
+
+    python benchmarks/bench_sharded.py [size] [workers...]
+"""
+import itertools
+import os
+import sys
+import time
+
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import procfs  # noqa: E402
+from monitoring import ResourceSampler  # noqa: E402
+
+
+def timed(func, *args, repeat=3):
+    """Return the best wall time of func(*args) in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main(size, worker_counts):
+    if not procfs.available():
+        print("/proc is not available on this host; sharded collection needs it")
+        return
+
+    memory_total = psutil.virtual_memory().total
+    pids = procfs.ProcfsReader().list_pids()
+    sample = list(itertools.islice(itertools.cycle(pids), size))
+    print(f"{size} synthetic PIDs ({len(pids)} real), {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'ms/tick':>10} {'speedup':>8}")
+
+    baseline = None
+    for workers in worker_counts:
+        sampler = ResourceSampler(settings={'collector_workers': workers})
+        if workers == 0:
+            elapsed = timed(sampler.read_procfs, memory_total, sample)
+        else:
+            sampler.read_sharded(memory_total, sample)  # start the pool outside the timing
+            elapsed = timed(sampler.read_sharded, memory_total, sample)
+        sampler.close()
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.1f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 50000, args[1:] or [0, 1, 2, 4, 8])
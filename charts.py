@@ -0,0 +1,138 @@
+"""Fixed-memory time-series charts for the Home and System pages."""
+from array import array
+from collections import deque
+
+import customtkinter as ctk
+
+
+class MetricHistory:
+    """The last `capacity` samples of each metric, in fixed-size float rings.
+
+    Each series is an array('f') written round-robin plus the number of
+    samples ever appended, so memory per metric is constant however long
+    the app runs.
+    """
+
+    def __init__(self, capacity=300):
+        self.capacity = capacity
+        self.series = {}  # key -> [array('f'), total appended]
+
+    def append(self, key, value):
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [array('f', bytes(4 * self.capacity)), 0]
+        series[0][series[1] % self.capacity] = value
+        series[1] += 1
+
+    def total(self, key):
+        """Return how many samples of key have been appended so far."""
+        series = self.series.get(key)
+        return series[1] if series is not None else 0
+
+    def value(self, key, n):
+        """Return the n-th sample of key (one of the last `capacity`)."""
+        return self.series[key][0][n % self.capacity]
+
+
+class Sparkline:
+    """Scrolling line chart of one MetricHistory series on a Canvas.
+
+    Sample n is drawn at x = (n - base) * STEP. update() adds one line
+    segment per new sample, deletes the one that scrolled out and moves the
+    view one STEP to the right, so a tick costs the same however long the
+    history. Everything is redrawn from the ring only on resize, after more
+    samples were missed than fit on screen, or every REBASE_AT pixels to
+    keep the coordinates small. With max_value None the chart scales to its
+    peak, doubling the scale (one canvas.scale call) when a sample exceeds it.
+    """
+
+    STEP = 3  # pixels per sample
+    REBASE_AT = 100000  # pixels scrolled before the coordinates are reset
+
+    def __init__(self, parent, history, key, max_value=None, color="#1f6aa5", height=40):
+        self.history = history
+        self.key = key
+        self.fixed_max = max_value
+        self.max_value = max_value or 1.0
+        self.color = color
+        self.width = 1
+        self.height = height
+        self.base = 0  # sample drawn at x = 0
+        self.drawn = 0  # samples drawn so far
+        self.segments = deque()  # line ids, oldest first
+
+        self.canvas = ctk.CTkCanvas(
+            parent, height=height, bg="gray17", highlightthickness=0,
+            confine=False, xscrollincrement=self.STEP
+        )
+        self.canvas.bind("<Configure>", self.on_resize)
+
+    def pack(self, **options):
+        self.canvas.pack(**options)
+
+    def on_resize(self, event):
+        self.width = max(1, event.width)
+        self.height = max(4, event.height)
+        self.redraw()
+
+    def visible_samples(self):
+        return min(self.history.capacity, self.width // self.STEP + 2)
+
+    def y(self, value):
+        return self.height - 2 - min(value / self.max_value, 1.0) * (self.height - 4)
+
+    def update(self):
+        """Draw the samples appended since the last update."""
+        total = self.history.total(self.key)
+        missed = total - self.drawn
+        if missed <= 0:
+            return
+        if missed >= self.visible_samples() or (total - self.base) * self.STEP > self.REBASE_AT:
+            self.redraw()
+            return
+        for n in range(self.drawn, total):
+            self.add_segment(n)
+        self.drawn = total
+
+    def add_segment(self, n):
+        """Draw the line from sample n-1 to sample n and scroll it into view."""
+        if n - 1 < self.base:
+            return
+        value = self.history.value(self.key, n)
+        if self.fixed_max is None and value > self.max_value:
+            old_max = self.max_value
+            while value > self.max_value:
+                self.max_value *= 2
+            self.canvas.scale("segment", 0, self.height - 2, 1.0, old_max / self.max_value)
+        self.draw_segment(n)
+        while len(self.segments) > self.visible_samples():
+            self.canvas.delete(self.segments.popleft())
+        self.canvas.xview_scroll(1, "units")
+
+    def draw_segment(self, n):
+        x = (n - self.base) * self.STEP
+        self.segments.append(self.canvas.create_line(
+            x - self.STEP, self.y(self.history.value(self.key, n - 1)), x, self.y(self.history.value(self.key, n)),
+            fill=self.color, width=2, tags="segment"
+        ))
+
+    def redraw(self):
+        """Draw the visible window of the series from scratch."""
+        self.canvas.delete("segment")
+        self.segments.clear()
+        total = self.history.total(self.key)
+        count = min(total, self.visible_samples())
+        self.base = total - count
+        if self.fixed_max is None:
+            peak = max((self.history.value(self.key, n) for n in range(self.base, total)), default=0.0)
+            self.max_value = 1.0
+            while peak > self.max_value:
+                self.max_value *= 2
+        for n in range(self.base + 1, total):
+            self.draw_segment(n)
+        self.drawn = total
+
+        # Put the newest sample at the right edge
+        right = max(0, count - 1) * self.STEP
+        self.canvas.configure(scrollregion=(right - self.width, 0, right, self.height))
+        self.canvas.xview_moveto(0)
@@ -0,0 +1,657 @@
+"""GUI-free monitoring engine: sampling, limit checks, alerting and persistence.
+
+Run it without a window (no Tk import at all) with:
+
+    python -m engine --headless
+"""
+import argparse
+import json
+import os
+import queue
+import signal
+import time
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+
+from alertbus import AlertBus, AlertEvent, EventStoreSink, LogFileSink, PolledSink, SocketSink
+from alerting import (
+    Alert, AlertRateLimiter, BufferedLogWriter, IncidentTracker, LogEntry, RingBuffer,
+    alert_from_dict, log_from_dict
+)
+from eventstore import EventStore, event_row
+from monitoring import AdaptiveInterval, ResourceCollector
+
+
+def legacy_resource(event):
+    """Return the resource an old alert message or log event is about (None if unknown)."""
+    if event.startswith("Process "):
+        return "Process"
+    if " usage " in event:
+        return event.split(" usage ")[0].replace("System ", "", 1)
+    return None
+
+
+def legacy_event_rows(alerts, logs):
+    """Turn old alerts and logs (each oldest first) into event rows in time order.
+
+    The old app raised every alert together with a log entry for the same
+    event in the same second, so each alert is stored on the row of its log
+    and takes the log's timestamp. An alert whose log is gone goes right
+    after the log that preceded it.
+    """
+    def created(log):
+        try:
+            return datetime.strptime(log.timestamp, "%Y-%m-%d %H:%M:%S").timestamp()
+        except ValueError:
+            return time.time()
+
+    unpaired = {}  # (event, HH:MM:SS) -> indices of logs not yet given an alert, oldest first
+    for i, log in enumerate(logs):
+        unpaired.setdefault((log.event, log.timestamp[-8:]), deque()).append(i)
+    paired = {}  # log index -> its alert
+    orphans = []  # (index of the log before it, alert)
+    last = -1
+    for alert in alerts:
+        candidates = unpaired.get((alert.message, alert.time), ())
+        while candidates and candidates[0] <= last:
+            candidates.popleft()  # keep alerts in the same order as their logs
+        if candidates:
+            last = candidates.popleft()
+            paired[last] = alert
+        else:
+            orphans.append((last, alert))
+
+    rows = []
+    k = 0
+    when = created(logs[0]) if logs else time.time()
+    for i in range(-1, len(logs)):
+        if i >= 0:
+            log = logs[i]
+            when = created(log)
+            rows.append(event_row(when, legacy_resource(log.event), paired.get(i), log))
+        while k < len(orphans) and orphans[k][0] == i:
+            alert = orphans[k][1]
+            rows.append(event_row(when, legacy_resource(alert.message), alert, None))
+            k += 1
+    return rows
+
+
+class MonitoringEngine:
+    """Own the collector, the configured limits and the alert/log history."""
+
+    def __init__(self, verbose=True):
+        # Print per-tick status and per-process details
+        self.verbose = verbose
+
+        # Load process whitelist, resource limits and sampling settings
+        self.process_whitelist = self.load_process_whitelist()
+        self.resource_limits = self.load_resource_limits()
+        self.monitor_settings = self.load_monitor_settings()
+
+        # Newest-first ring buffers for alerts and logs
+        capacity = int(self.monitor_settings['history_capacity'])
+        self.alerts = RingBuffer(capacity)
+        self.logs = RingBuffer(capacity)
+
+        # SQLite is the system of record; the ring buffers hold only the newest entries
+        self.events = EventStore('events.db')
+
+        # Load alerts and logs from a file
+        self.load_alerts_and_logs()
+
+        # Create a log file if it doesn't exist; it stays open, buffering writes
+        self.log_file = 'system_logs.txt'
+        self.log_writer = BufferedLogWriter(
+            self.log_file,
+            header="Timestamp,Resource,Event,Severity,Status,Action,User\n",
+            buffer_size=int(self.monitor_settings['log_buffer_size']),
+            fsync=self.monitor_settings['log_fsync']
+        )
+
+        # Alerts are published once; each sink writes them on its own thread, in batches
+        self.bus = AlertBus()
+        sink_options = {
+            'batch_size': int(self.monitor_settings['persist_batch_size']),
+            'flush_interval': self.monitor_settings['persist_interval'],
+        }
+        # Drained by poll(), so listeners run on the thread that polls (the Tk loop in the GUI);
+        # fed by the store sink, so listeners can already query what they are told about
+        self.listener_sink = PolledSink('listeners', policy='drop_oldest')
+        # Wakes on every event but inserts a backlog in one transaction
+        self.bus.add(EventStoreSink(
+            self.events, downstream=self.listener_sink, policy='block', batch_size=1,
+            max_batch=max(1, int(self.monitor_settings['persist_batch_size'])),
+            flush_interval=self.monitor_settings['persist_interval']
+        ))
+        self.bus.add(LogFileSink(self.log_writer, policy='block', **sink_options))
+        if self.monitor_settings['alert_socket']:
+            self.bus.add(SocketSink(self.monitor_settings['alert_socket'], policy='drop_oldest', **sink_options))
+
+        self.collector = None
+        self.latest_snapshot = None
+        # Callables run as listener(alert, log_entry) from poll() after every new alert
+        # (alert is None when an incident closes and only a log entry is added)
+        self.alert_listeners = []
+
+        # Repeated breaches of the same (resource, process) only alert once, after
+        # lasting a while, and only clear once usage drops clear_margin below the limit
+        self.incidents = IncidentTracker(
+            raise_samples=int(self.monitor_settings['raise_samples']),
+            raise_seconds=self.monitor_settings['raise_seconds'],
+            clear_samples=int(self.monitor_settings['clear_samples'])
+        )
+
+        # Bound the alert rate per process (and per system resource), counting what is dropped
+        self.alert_limiter = AlertRateLimiter(
+            burst=int(self.monitor_settings['alert_burst']),
+            refill_seconds=self.monitor_settings['alert_refill_seconds']
+        )
+
+    def debug(self, *args):
+        """Print monitoring details when running verbosely."""
+        if self.verbose:
+            print(*args)
+
+    def notify(self, alert, log_entry):
+        """Pass a new alert to every registered listener."""
+        for listener in self.alert_listeners:
+            try:
+                listener(alert, log_entry)
+            except Exception as e:
+                print(f"Error in alert listener: {e}")
+
+    def start(self):
+        """Start the collector thread if it is not already running."""
+        if self.collector is None or self.collector.stopped():
+            # Back off while the host is idle, tighten as any metric nears its limit
+            scheduler = AdaptiveInterval(
+                min_interval=self.monitor_settings['min_interval'],
+                max_interval=self.monitor_settings['max_interval']
+            )
+            self.collector = ResourceCollector(
+                scheduler=scheduler,
+                limits=self.resource_limits,
+                settings=self.monitor_settings
+            )
+            self.collector.start()
+
+    def stop(self):
+        """Stop the collector thread and write out any unsaved alerts."""
+        if self.collector is not None:
+            self.collector.stop()
+            self.collector = None
+        self.bus.sync()
+
+    def close(self):
+        """Stop monitoring and the alert sinks (call once, on exit)."""
+        self.stop()
+        self.bus.close()
+        self.log_writer.close()
+        self.events.close()
+
+    def running(self):
+        """Return True while the collector is running."""
+        return self.collector is not None and not self.collector.stopped()
+
+    def poll(self, timeout=None):
+        """Check every pending snapshot; return the newest one, or None if there was none.
+
+        With a timeout, wait up to that many seconds for the first snapshot.
+        """
+        latest = None
+        block = timeout is not None
+        while self.collector is not None:
+            try:
+                snapshot = self.collector.snapshots.get(block=block, timeout=timeout)
+            except queue.Empty:
+                break
+            block = False
+            self.latest_snapshot = latest = snapshot
+            self.check_snapshot(snapshot)
+
+        for event in self.listener_sink.drain():
+            self.notify(event.alert, event.log_entry)
+        return latest
+
+    def run_forever(self):
+        """Run detection on the calling thread until stopped (headless mode)."""
+        self.start()
+        try:
+            while self.running():
+                self.poll(timeout=1.0)
+        finally:
+            self.stop()
+
+    def load_alerts_and_logs(self):
+        """Load the most recent alerts and logs from the event store."""
+        try:
+            if self.events.empty():
+                self.import_alerts_and_logs()
+
+            # Only the newest entries are read, so startup doesn't slow down as history grows
+            limit = int(self.monitor_settings['history_load'])
+            self.alerts.extend_oldest_first(alert for _, alert in reversed(self.events.alerts(limit)))
+            self.logs.extend_oldest_first(log for _, log in reversed(self.events.logs(limit)))
+        except Exception as e:
+            print(f"Error loading alerts and logs: {e}")
+
+    def import_alerts_and_logs(self):
+        """Copy history from the older alerts_logs.json file into the store."""
+        if not os.path.exists('alerts_logs.json'):
+            return
+        with open('alerts_logs.json', 'r') as f:
+            data = json.load(f)
+        # The file is newest first; insert oldest first so ids follow time
+        alerts = [alert_from_dict(alert) for alert in reversed(data.get('alerts', []))]
+        logs = [log_from_dict(log) for log in reversed(data.get('logs', []))]
+        self.events.insert(legacy_event_rows(alerts, logs))
+
+    def load_process_whitelist(self):
+        """Load process whitelist from file."""
+        try:
+            whitelist = []
+            with open('process_whitelist.txt', 'r') as f:
+                for line in f:
+                    process = line.strip()
+                    if process:  # Skip empty lines
+                        whitelist.append(process)
+            print(f"Loaded {len(whitelist)} processes in whitelist")
+            return whitelist
+        except FileNotFoundError:
+            print("Whitelist file not found, creating default whitelist")
+            # Create default whitelist
+            default_whitelist = [
+                "chrome.exe",
+                "code.exe",
+                "python.exe",
+                "explorer.exe",
+                "discord.exe",
+                "whatsapp.exe"
+            ]
+            # Save default whitelist
+            with open('process_whitelist.txt', 'w') as f:
+                for process in default_whitelist:
+                    f.write(f"{process}\n")
+            return default_whitelist
+        except Exception as e:
+            print(f"Error loading whitelist: {e}")
+            return []
+
+    def load_resource_limits(self):
+        """Load resource limits from file."""
+        try:
+            with open('resource_limits.txt', 'r') as f:
+                limits = {}
+                for line in f:
+                    resource, limit = line.strip().split(',')
+                    limits[resource] = float(limit)
+                return limits
+        except FileNotFoundError:
+            # Return default limits
+            return {'cpu': 50, 'memory': 70}
+
+    def load_monitor_settings(self):
+        """Load monitoring loop settings from file."""
+        settings = {
+            'min_interval': 0.5,  # seconds between samples near a limit
+            'max_interval': 10.0,  # seconds between samples on an idle host
+            'page_refresh_interval': 1.0,  # longest gap while a live page is shown
+            'hot_set_size': 50,  # top CPU and top memory processes re-read every tick
+            'full_scan_every': 10,  # ticks between scans of every process
+            'spike_threshold': 10.0,  # system CPU/memory jump (points) that forces a full scan
+            'collector_workers': 0,  # processes sharing a full /proc scan; 0 or 1 scans in-thread
+            'history_capacity': 100000,  # alerts and logs kept before the oldest are dropped
+            'persist_interval': 2.0,  # longest delay before new alerts are flushed to disk
+            'persist_batch_size': 50,  # pending alerts that trigger an early write
+            'history_load': 1000,  # alerts and logs read back from the event store at startup
+            'log_buffer_size': 65536,  # bytes of system_logs.txt lines buffered before a write
+            'log_fsync': 'interval',  # none, interval (each background flush) or always (each line)
+            'raise_samples': 3,  # consecutive samples over a limit before it alerts
+            'raise_seconds': 0.0,  # and the least time those samples must span
+            'clear_samples': 3,  # consecutive samples under limit - clear_margin before it clears
+            'clear_margin': 5.0,  # points below the limit a metric must fall to clear
+            'alert_burst': 3,  # alerts a process or resource may raise back to back
+            'alert_refill_seconds': 60.0,  # then at most one more per this many seconds
+            'alert_socket': '',  # host:port to also send alerts to as UDP JSON datagrams
+        }
+        try:
+            with open('monitor_settings.txt', 'r') as f:
+                for line in f:
+                    if line.strip():
+                        key, value = line.strip().split(',')
+                        try:
+                            settings[key] = float(value)
+                        except ValueError:
+                            settings[key] = value  # e.g. log_fsync
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading monitor settings: {e}")
+        return settings
+
+    def check_snapshot(self, snapshot):
+        """Check a resource snapshot against the configured limits."""
+        cpu_total = snapshot.cpu_percent
+        memory = snapshot.memory
+        memory_percent = memory.percent  # Get actual memory percentage
+        
+        self.debug("\n=== Current System Status ===")
+        self.debug(f"Current Usage - CPU: {cpu_total:.1f}%, Memory: {memory_percent:.1f}%")
+        self.debug(f"Current Limits - CPU: {self.resource_limits['cpu']}%, Memory: {self.resource_limits['memory']}%")
+        if self.verbose:
+            self.debug("\nWhitelisted Processes:", [p.lower() for p in self.process_whitelist])
+        
+        self.debug("\n=== Running Processes ===")
+        processes = snapshot.processes
+        cpu_limit = float(self.resource_limits['cpu'])
+        memory_limit = float(self.resource_limits['memory'])
+
+        # Evaluate every process at once; only the selected rows are visited below
+        whitelisted = processes.whitelisted(self.process_whitelist)
+        exceeded = processes.exceeding(cpu_limit, memory_limit)
+
+        # Print all processes with significant resource usage (above 1%); skipped
+        # entirely when quiet, so a headless tick has no per-row Python loop
+        if self.verbose:
+            significant = (processes.cpu_percent > 1) | (processes.memory_percent > 1)
+            for i in np.flatnonzero(significant):
+                proc = processes.row(i)
+                self.debug(f"\nProcess: {proc.name}")
+                self.debug(f"  PID: {proc.pid}")
+                self.debug(f"  CPU: {proc.cpu_percent:.1f}%")
+                self.debug(f"  Memory: {proc.memory_percent:.1f}%")
+                self.debug(f"  In Whitelist: {bool(whitelisted[i])}")
+
+        # Track if any non-whitelisted process is causing high usage
+        violations = np.flatnonzero(exceeded & ~whitelisted)
+        high_usage_detected = len(violations) > 0
+
+        if self.verbose:
+            for i in np.flatnonzero(exceeded & whitelisted):
+                self.debug(f"\n=== High Usage Process Detected ===")
+                self.debug(f"Process: {processes.name(i)}")
+                self.debug(f"  Status: Ignoring (whitelisted)")
+
+        now = snapshot.timestamp
+        limits = {'CPU': cpu_limit, 'Memory': memory_limit}
+        margin = float(self.monitor_settings['clear_margin'])
+
+        # Peak usage per offending process name, plus every process with a pending or open incident
+        offenders = {}
+        for i in violations:
+            proc = processes.row(i)
+            self.debug(f"\n=== High Usage Process Detected ===")
+            self.debug(f"Process: {proc.name}")
+            self.debug(f"  CPU: {proc.cpu_percent:.1f}% (Limit: {self.resource_limits['cpu']}%)")
+            self.debug(f"  Memory: {proc.memory_percent:.1f}% (Limit: {self.resource_limits['memory']}%)")
+            usage = offenders.setdefault(proc.name, {'CPU': 0.0, 'Memory': 0.0})
+            usage['CPU'] = max(usage['CPU'], proc.cpu_percent)
+            usage['Memory'] = max(usage['Memory'], proc.memory_percent)
+
+        for resource, process_name in self.incidents.tracked():
+            if process_name is None or process_name in offenders:
+                continue
+            rows = processes.named(process_name) & ~whitelisted
+            if rows.any():
+                offenders[process_name] = {
+                    'CPU': float(processes.cpu_percent[rows].max()),
+                    'Memory': float(processes.memory_percent[rows].max())
+                }
+
+        # Only state transitions alert or log; samples in between just update the incident
+        for process_name, usage in offenders.items():
+            opened = []
+            for resource, value in usage.items():
+                transition = self.incidents.sample(
+                    (resource, process_name), value, now, limits[resource], limits[resource] - margin
+                )
+                if transition is None:
+                    continue
+                event, incident = transition
+                if event == 'opened':
+                    opened.append(incident)
+                else:
+                    self.handle_recovery(incident)
+            if opened:
+                alerted = self.handle_process_alert(
+                    process_name,
+                    usage['CPU'],
+                    usage['Memory'],
+                    "Process exceeding resource limits"
+                )
+                for incident in opened:
+                    incident.alerted = bool(alerted)
+
+        # Only generate system-wide alerts if no specific process was identified as the cause
+        if not high_usage_detected:
+            for resource, value in (('CPU', cpu_total), ('Memory', memory_percent)):
+                if value > limits[resource]:
+                    self.debug(f"\nSystem {resource} Alert: {value:.1f}% > {self.resource_limits[resource.lower()]}%")
+                transition = self.incidents.sample(
+                    (resource, None), value, now, limits[resource], limits[resource] - margin
+                )
+                if transition is None:
+                    continue
+                event, incident = transition
+                if event == 'opened':
+                    incident.alerted = bool(self.handle_alert(resource, value))
+                else:
+                    self.handle_recovery(incident)
+
+        # Close the incidents whose metric has recovered
+        sampled = None if processes.full_scan else {processes.name(i) for i in range(len(processes))}
+
+        def still_unknown(key):
+            resource, process_name = key
+            if process_name is None:
+                return high_usage_detected  # system checks were skipped this tick
+            return sampled is not None and process_name not in sampled
+
+        for incident in self.incidents.close_unseen(keep=still_unknown):
+            self.handle_recovery(incident)
+
+    def handle_alert(self, resource_type, value):
+        """Handle alerts and log events when resource limits are exceeded; return True if one was raised."""
+        try:
+            # Strictly check if the value exceeds the limit
+            threshold = float(self.resource_limits.get(resource_type.lower(), 90))
+            if value <= threshold:
+                return False  # Exit if limit is not exceeded
+
+            key = (resource_type, None)
+            if not self.alert_limiter.allow(key):
+                self.debug(f"Alert for {resource_type} suppressed (rate limited)")
+                return False
+            suppressed = self.alert_limiter.take_suppressed(key)
+            
+            self.debug(f"Generating alert for {resource_type}: {value}% > {threshold}%")
+            
+            current_time = datetime.now()
+            formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            alert_message = f"System {resource_type} usage exceeded"
+
+            # Create alert entry
+            alert = Alert(
+                priority="High",
+                message=alert_message,
+                details=(f"System {resource_type} usage is {value:.1f}%, which is above the threshold of {threshold}%."
+                         + (f" {suppressed} earlier alerts were suppressed." if suppressed else "")),
+                time=current_time.strftime("%H:%M:%S"),
+                process_name="System"  # Mark as system alert
+            )
+
+            # Create log entry
+            log_entry = LogEntry(
+                timestamp=formatted_time,
+                source_ip="localhost",
+                event=alert_message,
+                severity="High",
+                status="Alert",
+                action="System Monitoring",
+                user="system",
+                process="System"  # Mark as system alert
+            )
+
+            # O(1) append; the oldest entry is dropped once the buffer is full
+            self.alerts.append(alert)
+            self.logs.append(log_entry)
+
+            # The event store, log file, UI and any other sinks pick it up off this thread
+            self.bus.publish(AlertEvent(
+                alert,
+                log_entry,
+                f"{formatted_time},{resource_type},{alert_message},High,Alert,System Monitoring,system\n",
+                resource_type,
+                current_time.timestamp()
+            ))
+            return True
+
+        except Exception as e:
+            print(f"Error in handle_alert: {e}")
+            return False
+
+    def handle_process_alert(self, process_name, cpu_usage, memory_usage, reason):
+        """Handle alerts for suspicious process activity; return True if one was raised."""
+        try:
+            # Strictly check if either CPU or memory usage exceeds limits
+            if (cpu_usage <= float(self.resource_limits['cpu']) and 
+                memory_usage <= float(self.resource_limits['memory'])):
+                return False  # Exit if no limits are exceeded
+
+            key = ('Process', process_name)
+            if not self.alert_limiter.allow(key):
+                self.debug(f"Alert for {process_name} suppressed (rate limited)")
+                return False
+            suppressed = self.alert_limiter.take_suppressed(key)
+            
+            self.debug(f"Generating process alert for {process_name}")
+            self.debug(f"CPU: {cpu_usage}% > {self.resource_limits['cpu']}%")
+            self.debug(f"Memory: {memory_usage}% > {self.resource_limits['memory']}%")
+            
+            current_time = datetime.now()
+            formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Create more specific alert message
+            exceeded_resources = []
+            if cpu_usage > float(self.resource_limits['cpu']):
+                exceeded_resources.append(f"CPU: {cpu_usage:.1f}% > {self.resource_limits['cpu']}%")
+            if memory_usage > float(self.resource_limits['memory']):
+                exceeded_resources.append(f"Memory: {memory_usage:.1f}% > {self.resource_limits['memory']}%")
+            
+            alert_message = f"Process {process_name} exceeded limits"
+            
+            # Create detailed alert
+            alert = Alert(
+                priority="High",
+                message=alert_message,
+                details=(f"Process: {process_name}\n"
+                         f"Resource Usage - {', '.join(exceeded_resources)}\n"
+                         f"Reason: {reason}"
+                         + (f"\nSuppressed: {suppressed} earlier alerts" if suppressed else "")),
+                time=current_time.strftime("%H:%M:%S"),
+                process_name=process_name  # Add process name for filtering
+            )
+
+            # Create log entry
+            log_entry = LogEntry(
+                timestamp=formatted_time,
+                source_ip="localhost",
+                event=alert_message,
+                severity="High",
+                status="Alert",
+                action="Process Monitoring",
+                user="system",
+                process=process_name  # Add process name for filtering
+            )
+
+            # O(1) append; the oldest entry is dropped once the buffer is full
+            self.alerts.append(alert)
+            self.logs.append(log_entry)
+
+            # The event store, log file, UI and any other sinks pick it up off this thread
+            self.bus.publish(AlertEvent(
+                alert,
+                log_entry,
+                f"{formatted_time},Process,{alert_message},High,Alert,Process Monitoring,system\n",
+                "Process",
+                current_time.timestamp()
+            ))
+            return True
+
+        except Exception as e:
+            print(f"Error in handle_process_alert: {e}")
+            return False
+
+    def handle_recovery(self, incident):
+        """Log that an incident is over, with how long it lasted and how bad it got."""
+        if not incident.alerted:
+            return  # its alert was rate limited, so its end goes unreported too
+        try:
+            current_time = datetime.now()
+            formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
+            if incident.process_name is None:
+                subject, source, action = f"System {incident.resource}", incident.resource, "System Monitoring"
+            else:
+                subject, source, action = f"Process {incident.process_name} {incident.resource}", "Process", "Process Monitoring"
+            event = (f"{subject} usage recovered after {incident.count} samples "
+                     f"over {incident.duration:.0f}s (peak {incident.peak:.1f}%)")
+
+            log_entry = LogEntry(
+                timestamp=formatted_time,
+                source_ip="localhost",
+                event=event,
+                severity="Low",
+                status="Resolved",
+                action=action,
+                user="system",
+                process=incident.process_name or "System"
+            )
+            self.logs.append(log_entry)
+            self.bus.publish(AlertEvent(
+                None,
+                log_entry,
+                f"{formatted_time},{source},{event},Low,Resolved,{action},system\n",
+                incident.resource,
+                current_time.timestamp()
+            ))
+
+        except Exception as e:
+            print(f"Error in handle_recovery: {e}")
+
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Intrusion detection resource monitor")
+    parser.add_argument('--headless', action='store_true',
+                        help="run the monitoring engine without a window")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print per-tick status and per-process details")
+    args = parser.parse_args(argv)
+
+    if not args.headless:
+        # The window is only imported when asked for, so headless never loads Tk
+        from hi import IntrusionDetectionApp
+        app = IntrusionDetectionApp()
+        app.mainloop()
+        return
+
+    engine = MonitoringEngine(verbose=args.verbose)
+
+    def handle_signal(signum, frame):
+        engine.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    print("Monitoring in headless mode, press Ctrl+C to stop")
+    try:
+        engine.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.close()
+    print("Monitoring stopped")
+
+
+if __name__ == "__main__":
+    main()
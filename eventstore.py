@@ -0,0 +1,150 @@
+"""SQLite store of alerts and log entries: the system of record for alert history."""
+import sqlite3
+import threading
+
+from alerting import Alert, LogEntry
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,      -- unix time the event was raised
+    resource TEXT,              -- CPU, Memory, Process, ...
+    process TEXT,
+    priority TEXT,              -- alert columns, NULL for log-only rows
+    message TEXT,
+    details TEXT,
+    alert_time TEXT,
+    timestamp TEXT,             -- log columns, NULL for alert-only rows
+    source_ip TEXT,
+    event TEXT,
+    severity TEXT,
+    status TEXT,
+    action TEXT,
+    user TEXT
+);
+CREATE INDEX IF NOT EXISTS events_created ON events(created);
+CREATE INDEX IF NOT EXISTS events_resource ON events(resource, id);
+CREATE INDEX IF NOT EXISTS events_process ON events(process, id);
+CREATE INDEX IF NOT EXISTS events_alerts ON events(id) WHERE message IS NOT NULL;
+CREATE INDEX IF NOT EXISTS events_logs ON events(id) WHERE event IS NOT NULL;
+"""
+
+INSERT = """
+INSERT INTO events (created, resource, process, priority, message, details, alert_time,
+                    timestamp, source_ip, event, severity, status, action, user)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+ALERT_COLUMNS = "id, priority, message, details, alert_time, process"
+LOG_COLUMNS = "id, timestamp, source_ip, event, severity, status, action, user, process"
+
+
+def event_row(created, resource, alert, log_entry):
+    """Flatten an alert and/or log entry into one events row."""
+    process = alert.process_name if alert is not None else log_entry.process
+    row = [created, resource, process]
+    row += [alert.priority, alert.message, alert.details, alert.time] if alert is not None else [None] * 4
+    row += ([log_entry.timestamp, log_entry.source_ip, log_entry.event, log_entry.severity,
+             log_entry.status, log_entry.action, log_entry.user]
+            if log_entry is not None else [None] * 7)
+    return row
+
+
+class EventStore:
+    """Alerts and log entries in one WAL-mode SQLite table.
+
+    Every thread gets its own connection, so the alert sink can insert
+    while the UI pages through history. Pages are fetched newest first with
+    keyset pagination: pass the last id of one page as `before` to get the
+    next, which costs the same however deep into the history it is.
+    """
+
+    def __init__(self, path='events.db'):
+        self.path = path
+        self._local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # durable at each WAL checkpoint, no fsync per commit
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def insert(self, rows):
+        """Insert event_row() rows in one transaction."""
+        conn = self.connection()
+        with conn:
+            conn.executemany(INSERT, rows)
+
+    def empty(self):
+        """Return True if no event has been stored yet."""
+        return self.connection().execute("SELECT 1 FROM events LIMIT 1").fetchone() is None
+
+    def count(self, kind='logs', after=0):
+        """Return (how many, newest id) of the alerts (or logs) newer than `after`."""
+        column = 'message' if kind == 'alerts' else 'event'
+        conn = self.connection()
+        # MAX(id) alone is an index lookup; counting up to it keeps the pair consistent
+        newest = conn.execute(f"SELECT MAX(id) FROM events WHERE {column} IS NOT NULL").fetchone()[0]
+        if newest is None or newest <= after:
+            return 0, after
+        count = conn.execute(
+            f"SELECT COUNT(*) FROM events WHERE {column} IS NOT NULL AND id > ? AND id <= ?", (after, newest)
+        ).fetchone()[0]
+        return count, newest
+
+    def _page(self, columns, kind_column, limit, before, after, process, resource,
+              offset=0, oldest_first=False):
+        """Run a page query (newest first unless oldest_first); returns the matching rows."""
+        where = [f"{kind_column} IS NOT NULL"]
+        params = []
+        if before is not None:
+            where.append("id < ?")
+            params.append(before)
+        if after is not None:
+            where.append("id > ?")
+            params.append(after)
+        if process is not None:
+            where.append("process = ?")
+            params.append(process)
+        if resource is not None:
+            where.append("resource = ?")
+            params.append(resource)
+        params += [limit, offset]
+        return self.connection().execute(
+            f"SELECT {columns} FROM events WHERE {' AND '.join(where)} "
+            f"ORDER BY id {'ASC' if oldest_first else 'DESC'} LIMIT ? OFFSET ?",
+            params
+        ).fetchall()
+
+    def alerts(self, limit=100, before=None, after=None, process=None, resource=None,
+               offset=0, oldest_first=False):
+        """Return up to limit (id, Alert) pairs, newest first, with before > id > after.
+
+        offset skips that many matches first; oldest_first reverses the order.
+        """
+        return [(row[0], Alert(*row[1:])) for row in self._page(
+            ALERT_COLUMNS, 'message', limit, before, after, process, resource, offset, oldest_first
+        )]
+
+    def logs(self, limit=100, before=None, after=None, process=None, resource=None,
+             offset=0, oldest_first=False):
+        """Return up to limit (id, LogEntry) pairs, newest first, with before > id > after.
+
+        offset skips that many matches first; oldest_first reverses the order.
+        """
+        return [(row[0], LogEntry(*row[1:])) for row in self._page(
+            LOG_COLUMNS, 'event', limit, before, after, process, resource, offset, oldest_first
+        )]
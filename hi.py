@@ -1,50 +1,61 @@
 from tkinter import messagebox
 import customtkinter as ctk
+import re
 import sqlite3
-import psutil
-import GPUtil
-from datetime import datetime
 from PIL import Image
-import json
+from engine import MonitoringEngine
+from tables import CanvasTable, VirtualTable
+from widgets import WidgetWriter
+from charts import MetricHistory, Sparkline
 
 
 class IntrusionDetectionApp(ctk.CTk):
+    # Newest alerts loaded into the Alerts grid
+    ALERT_GRID_LIMIT = 100000
+
+    # Sort order of the Priority column, most severe first
+    PRIORITY_RANK = {"High": 0, "Medium": 1, "Med": 1, "Low": 2}
+
+    # Pages kept alive between visits (their data refreshes through
+    # resource_updater / live_refresh), with the attributes each one binds
+    # its widgets and updaters to. Only the shown page's are set at a time.
+    LIVE_BINDINGS = ("current_frame", "charts", "resource_updater", "live_refresh")
+    RESOURCE_WIDGETS = ("cpu_percent_label", "cpu_progress", "cpu_freq_label",
+                        "memory_percent_label", "memory_progress", "memory_label")
+    PAGE_BINDINGS = {
+        "_show_home": LIVE_BINDINGS + RESOURCE_WIDGETS + ("home_alerts_body", "home_logs_body"),
+        "_show_system_resources": LIVE_BINDINGS + RESOURCE_WIDGETS + (
+            "disk_frames", "network_frames", "gpu_frames", "system_layout"
+        ),
+        "_show_alerts": LIVE_BINDINGS + ("suppressed_label",),
+        "_show_logs": LIVE_BINDINGS,
+    }
+
+    # Samples kept per charted metric (one per snapshot)
+    CHART_SAMPLES = 300
+
     def __init__(self):
         super().__init__()
 
-        # Move resource limits and monitoring setup to the beginning
-        # Define resource limits (in percentage)
-        self.resource_limits = {
-            'cpu': 50,  # CPU usage threshold
-            'memory': 70,  # Memory usage threshold
-            'disk': 90,  # Disk usage threshold
-        }
-
-        # Initialize empty process whitelist
-        self.process_whitelist = []
-        
-        # Load process whitelist
-        self.process_whitelist = self.load_process_whitelist()
-        
-        # Load resource limits
-        self.resource_limits = self.load_resource_limits()
-
-        # Initialize empty lists for alerts and logs
-        self.alerts = []
-        self.logs = []
+        # Sampling, limit checks, alerting and persistence live in the GUI-free engine
+        self.engine = MonitoringEngine()
+        self.engine.alert_listeners.append(self.on_engine_alert)
 
-        # Load alerts and logs from a file
-        self.load_alerts_and_logs()
-
-        # Create a log file if it doesn't exist
-        self.log_file = 'system_logs.txt'
-        with open(self.log_file, 'a') as f:
-            if f.tell() == 0:  # Only write header if file is empty
-                f.write("Timestamp,Resource,Event,Severity,Status,Action,User\n")
+        # Shared with the engine: edits made in the admin panel apply to monitoring directly
+        self.process_whitelist = self.engine.process_whitelist
+        self.resource_limits = self.engine.resource_limits
+        self.monitor_settings = self.engine.monitor_settings
 
         # Initialize monitoring flag and monitoring task ID
         self.monitoring_active = False
         self.monitoring_task = None
+        self.resource_updater = None
+        self.displays_stale = False
+        self.suppressed_seen = 0  # rate-limiter count the displays last reflected
+        self.live_refresh = None  # updates the visible Alerts/Logs table in place
+        self.widgets = WidgetWriter(self)  # live resource labels and bars, written once per tick
+        self.metric_history = MetricHistory(self.CHART_SAMPLES)  # what the resource charts draw
+        self.charts = []  # charts on the current page
 
         # CustomTkinter global appearance settings
         ctk.set_appearance_mode("Dark")  # Options: "Dark", "Light", "System"
@@ -78,6 +89,9 @@ class IntrusionDetectionApp(ctk.CTk):
 
         # Add window resize binding
         self.bind("<Configure>", self.on_window_resize)
+
+        # Flush unsaved alerts before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         # Set threshold width for responsive design
         self.RESPONSIVE_THRESHOLD = 1200  # Adjust this value as needed
@@ -87,25 +101,17 @@ class IntrusionDetectionApp(ctk.CTk):
         self.page_history = []
         self.current_page = None
 
+        # Built pages by name: [holder frame, {attribute: value} of its PAGE_BINDINGS]
+        self.page_cache = {}
+
         # Initialize the login page
         self.show_login_page()
 
-    def load_alerts_and_logs(self):
-        """Load alerts and logs from a file."""
-        try:
-            with open('alerts_logs.json', 'r') as f:
-                data = json.load(f)
-                self.alerts = data.get('alerts', [])
-                self.logs = data.get('logs', [])
-        except FileNotFoundError:
-            # If the file doesn't exist, start with empty lists
-            self.alerts = []
-            self.logs = []
-
     def clear_window(self):
         """Clear all widgets from the window."""
         for widget in self.winfo_children():
             widget.destroy()
+        self.page_cache.clear()  # the cached pages went with main_frame
 
     def clear_main_frame(self):
         """Clear the current frame from the main frame."""
@@ -115,13 +121,24 @@ class IntrusionDetectionApp(ctk.CTk):
                 self.after_cancel(self.after_id)
                 delattr(self, 'after_id')
 
-            # Destroy all widgets in main_frame
+            # Hide cached pages, destroy everything else in main_frame
             if hasattr(self, 'main_frame'):
+                cached = [holder for holder, _ in self.page_cache.values()]
                 for widget in self.main_frame.winfo_children():
-                    widget.destroy()
+                    if widget in cached:
+                        widget.pack_forget()
+                    else:
+                        widget.destroy()
             
-            # Reset current_frame reference
+            # Unbind the previous page, so no update writes into a hidden page's widgets
+            for bindings in self.PAGE_BINDINGS.values():
+                for attribute in bindings:
+                    self.__dict__.pop(attribute, None)
             self.current_frame = None
+            self.charts = []
+            self.resource_updater = None
+            self.live_refresh = None
+            self.set_live_updates(False)
 
         except Exception as e:
             print(f"Error in clear_main_frame: {e}")
@@ -188,14 +205,57 @@ class IntrusionDetectionApp(ctk.CTk):
         if self.current_page:
             self.page_history.append(self.current_page)
         self.current_page = page_func
-        page_func()
+        self.show_page(page_func)
 
     def go_back(self):
         """Navigate to previous page."""
         if self.page_history:
             previous_page = self.page_history.pop()
             self.current_page = previous_page
-            previous_page()
+            self.show_page(previous_page)
+
+    def show_page(self, page_func):
+        """Show a page, reusing its widgets if it is in the page cache."""
+        name = page_func.__name__
+        entry = self.page_cache.get(name)
+        if entry is not None and entry[0].winfo_exists():
+            self.clear_main_frame()
+            holder, bindings = entry
+            # Point the update methods back at this page's widgets and refresh only the data
+            self.__dict__.update(bindings)
+            holder.pack(fill="both", expand=True)
+            if self.resource_updater:
+                self.set_live_updates(True)
+                self.resource_updater()
+            if self.live_refresh:
+                self.live_refresh()
+            return
+
+        self.page_cache.pop(name, None)
+        if name not in self.PAGE_BINDINGS:
+            page_func()
+            return
+
+        # Build the page inside its own holder frame, then keep the attributes it bound
+        self.clear_main_frame()
+        main_frame = self.main_frame
+        holder = ctk.CTkFrame(main_frame, fg_color="transparent")
+        holder.pack(fill="both", expand=True)
+        self.main_frame = holder
+        try:
+            page_func()
+        finally:
+            self.main_frame = main_frame
+        bindings = {attribute: self.__dict__[attribute]
+                    for attribute in self.PAGE_BINDINGS[name] if attribute in self.__dict__}
+        self.page_cache[name] = [holder, bindings]
+
+    def rebuild_page(self, page_func):
+        """Build a page afresh, discarding any cached copy."""
+        entry = self.page_cache.pop(page_func.__name__, None)
+        if entry is not None:
+            entry[0].destroy()
+        self.show_page(page_func)
 
     def show_intrusion_detection_page(self):
         """Display the intrusion detection main page."""
@@ -316,7 +376,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_home(self):
         """Display the home/dashboard page."""
-        self.navigate_to(lambda: self._show_home())
+        self.navigate_to(self._show_home)
 
     def _show_home(self):
         """Internal method to show home page."""
@@ -326,6 +386,7 @@ class IntrusionDetectionApp(ctk.CTk):
         container = ctk.CTkScrollableFrame(self.main_frame)
         container.pack(fill="both", expand=True, padx=20, pady=20)
         self.current_frame = container
+        self.charts = []
 
         # Set minimum window size
         self.minsize(800, 600)
@@ -387,6 +448,7 @@ class IntrusionDetectionApp(ctk.CTk):
         self.cpu_progress = ctk.CTkProgressBar(cpu_frame, height=6)
         self.cpu_progress.pack(fill="x", pady=(5, 2))
         self.cpu_progress.set(0)
+        self.add_chart(cpu_frame, 'cpu', 100.0, "#1f6aa5")
         
         self.cpu_freq_label = ctk.CTkLabel(
             cpu_frame,
@@ -417,6 +479,7 @@ class IntrusionDetectionApp(ctk.CTk):
         self.memory_progress = ctk.CTkProgressBar(memory_frame, height=6)
         self.memory_progress.pack(fill="x", pady=(5, 2))
         self.memory_progress.set(0)
+        self.add_chart(memory_frame, 'memory', 100.0, "#2fa572")
         
         self.memory_label = ctk.CTkLabel(
             memory_frame,
@@ -449,67 +512,96 @@ class IntrusionDetectionApp(ctk.CTk):
         )
         view_alerts_btn.pack(side="right")
 
-        # Display recent alerts
-        if not self.alerts:
+        # Recent alerts, redrawn by refresh_home_lists
+        self.home_alerts_body = ctk.CTkFrame(alerts_frame, fg_color="transparent")
+        self.home_alerts_body.pack(fill="x")
+
+        # Logs Section
+        logs_frame = ctk.CTkFrame(container)
+        logs_frame.pack(fill="x", pady=(0, 20))
+
+        # Title with view details button
+        header_frame = ctk.CTkFrame(logs_frame, fg_color="transparent")
+        header_frame.pack(fill="x", padx=15, pady=(15, 5))
+        
+        ctk.CTkLabel(
+            header_frame,
+            text="Recent Logs",
+            font=("Helvetica", 16, "bold")
+        ).pack(side="left")
+        
+        view_logs_btn = ctk.CTkButton(
+            header_frame,
+            text="View details",
+            command=self.show_logs,
+            font=("Helvetica", 12),
+            height=32
+        )
+        view_logs_btn.pack(side="right")
+
+        # Recent logs, redrawn by refresh_home_lists
+        self.home_logs_body = ctk.CTkFrame(logs_frame, fg_color="transparent")
+        self.home_logs_body.pack(fill="x")
+        self.home_lists_shown = None
+        self.refresh_home_lists()
+        self.live_refresh = self.refresh_home_lists
+
+        # Refresh from the shared sampler on every new snapshot
+        self.resource_updater = self.update_home_resources
+        self.set_live_updates(True)
+        self.update_home_resources()
+
+    def refresh_home_lists(self):
+        """Redraw the Home page's recent alerts and logs if they changed."""
+        alerts = self.engine.alerts[:3]  # Show only the 3 most recent alerts
+        logs = self.engine.logs[:3]  # Show only the 3 most recent logs
+        if self.home_lists_shown == (alerts, logs) or not self.home_alerts_body.winfo_exists():
+            return
+        self.home_lists_shown = (alerts, logs)
+
+        body = self.home_alerts_body
+        for widget in body.winfo_children():
+            widget.destroy()
+        if not alerts:
             ctk.CTkLabel(
-                alerts_frame,
+                body,
                 text="No alerts found.",
                 font=("Helvetica", 12),
                 text_color="gray"
             ).pack(anchor="w", padx=15, pady=5)
         else:
-            for alert in self.alerts[:3]:  # Show only the 3 most recent alerts
-                alert_item = ctk.CTkFrame(alerts_frame, fg_color="transparent")
+            for alert in alerts:
+                alert_item = ctk.CTkFrame(body, fg_color="transparent")
                 alert_item.pack(fill="x", padx=15, pady=5)
                 
-                icon = "🔴" if alert["priority"] == "High" else "🟡"
+                icon = "🔴" if alert.priority == "High" else "🟡"
                 ctk.CTkLabel(
                     alert_item,
-                    text=f"{icon} {alert['priority']} priority alert",
+                    text=f"{icon} {alert.priority} priority alert",
                     font=("Helvetica", 12, "bold")
                 ).pack(anchor="w")
                 
                 ctk.CTkLabel(
                     alert_item,
-                    text=alert["message"],
+                    text=alert.message,
                     font=("Helvetica", 10),
                     text_color="gray"
                 ).pack(anchor="w")
                 
                 ctk.CTkLabel(
                     alert_item,
-                    text=alert["time"],
+                    text=alert.time,
                     font=("Helvetica", 10),
                     text_color="gray"
                 ).pack(anchor="e")
 
-        # Logs Section
-        logs_frame = ctk.CTkFrame(container)
-        logs_frame.pack(fill="x", pady=(0, 20))
-
-        # Title with view details button
-        header_frame = ctk.CTkFrame(logs_frame, fg_color="transparent")
-        header_frame.pack(fill="x", padx=15, pady=(15, 5))
-        
-        ctk.CTkLabel(
-            header_frame,
-            text="Recent Logs",
-            font=("Helvetica", 16, "bold")
-        ).pack(side="left")
-        
-        view_logs_btn = ctk.CTkButton(
-            header_frame,
-            text="View details",
-            command=self.show_logs,
-            font=("Helvetica", 12),
-            height=32
-        )
-        view_logs_btn.pack(side="right")
-
         # Display recent logs in a table format
-        if not self.logs:
+        body = self.home_logs_body
+        for widget in body.winfo_children():
+            widget.destroy()
+        if not logs:
             ctk.CTkLabel(
-                logs_frame,
+                body,
                 text="No logs found.",
                 font=("Helvetica", 12),
                 text_color="gray"
@@ -517,7 +609,7 @@ class IntrusionDetectionApp(ctk.CTk):
         else:
             # Create table headers
             headers = ["Timestamp", "Event", "Severity"]
-            header_row = ctk.CTkFrame(logs_frame, fg_color="gray25")
+            header_row = ctk.CTkFrame(body, fg_color="gray25")
             header_row.pack(fill="x", padx=15, pady=(5, 2))
             for header in headers:
                 ctk.CTkLabel(
@@ -528,134 +620,123 @@ class IntrusionDetectionApp(ctk.CTk):
                 ).pack(side="left", padx=5, pady=5, expand=True)
 
             # Display log entries
-            for i, log in enumerate(self.logs[:3]):  # Show only the 3 most recent logs
+            for i, log in enumerate(logs):
                 row_color = "gray17" if i % 2 == 0 else "gray20"
-                log_row = ctk.CTkFrame(logs_frame, fg_color=row_color)
+                log_row = ctk.CTkFrame(body, fg_color=row_color)
                 log_row.pack(fill="x", padx=15, pady=2)
                 
                 ctk.CTkLabel(
                     log_row,
-                    text=log['timestamp'],
+                    text=log.timestamp,
                     font=("Helvetica", 10),
                     text_color="white"
                 ).pack(side="left", padx=5, pady=5, expand=True)
                 
                 ctk.CTkLabel(
                     log_row,
-                    text=log['event'],
+                    text=log.event,
                     font=("Helvetica", 10),
                     text_color="white"
                 ).pack(side="left", padx=5, pady=5, expand=True)
                 
-                severity_color = "red" if log['severity'] == "High" else "orange"
+                severity_color = "red" if log.severity == "High" else "orange"
                 ctk.CTkLabel(
                     log_row,
-                    text=log['severity'],
+                    text=log.severity,
                     font=("Helvetica", 10),
                     text_color=severity_color
                 ).pack(side="left", padx=5, pady=5, expand=True)
 
-        # Start resource updates
-        self.update_home_resources()
-
-    def update_home_resources(self):
-        """Update resource information on home page."""
+    def update_home_resources(self, snapshot=None):
+        """Update resource information on home page from the latest snapshot."""
         try:
             # Check if the frame exists and we're still on the home page
-            if not hasattr(self, 'current_frame') or not self.current_frame.winfo_exists():
+            if not hasattr(self, 'current_frame') or not self.current_frame or not self.current_frame.winfo_exists():
                 return False
 
+            if snapshot is None:
+                snapshot = self.engine.latest_snapshot
+            if snapshot is None:
+                return True
+
             # Update CPU usage if labels exist
             if hasattr(self, 'cpu_percent_label') and self.cpu_percent_label.winfo_exists():
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                self.cpu_percent_label.configure(text=f"{cpu_percent}%")
+                cpu_percent = snapshot.cpu_percent
+                self.widgets.text(self.cpu_percent_label, f"{cpu_percent}%")
                 if hasattr(self, 'cpu_progress') and self.cpu_progress.winfo_exists():
-                    self.cpu_progress.set(cpu_percent / 100)
+                    self.widgets.progress(self.cpu_progress, cpu_percent / 100)
             
             # Update CPU frequency if label exists
             if hasattr(self, 'cpu_freq_label') and self.cpu_freq_label.winfo_exists():
-                try:
-                    cpu_freq = psutil.cpu_freq()
-                    if cpu_freq:
-                        current_freq = cpu_freq.current / 1000.0
-                        self.cpu_freq_label.configure(text=f"{current_freq:.2f} GHz")
-                except Exception:
-                    self.cpu_freq_label.configure(text="CPU frequency unavailable")
+                if snapshot.cpu_freq:
+                    current_freq = snapshot.cpu_freq / 1000.0
+                    self.widgets.text(self.cpu_freq_label, f"{current_freq:.2f} GHz")
+                else:
+                    self.widgets.text(self.cpu_freq_label, "CPU frequency unavailable")
 
             # Update Memory usage if labels exist
             if hasattr(self, 'memory_percent_label') and self.memory_percent_label.winfo_exists():
-                memory = psutil.virtual_memory()
-                self.memory_percent_label.configure(text=f"{memory.percent}%")
+                memory = snapshot.memory
+                self.widgets.text(self.memory_percent_label, f"{memory.percent}%")
                 
                 if hasattr(self, 'memory_progress') and self.memory_progress.winfo_exists():
-                    self.memory_progress.set(memory.percent / 100)
+                    self.widgets.progress(self.memory_progress, memory.percent / 100)
                 
                 if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
                     total_gb = memory.total / (1024**3)
                     used_gb = (memory.used) / (1024**3)  # Corrected to show used memory
-                    self.memory_label.configure(text=f"{used_gb:.1f} GB of {total_gb:.1f} GB")
+                    self.widgets.text(self.memory_label, f"{used_gb:.1f} GB of {total_gb:.1f} GB")
 
             # Update Disk usage
             if hasattr(self, 'disk_frames'):
-                for partition in psutil.disk_partitions():
-                    if partition.fstype and partition.device in self.disk_frames:
-                        try:
-                            usage = psutil.disk_usage(partition.mountpoint)
-                            label, progress = self.disk_frames[partition.device]
-                            if label.winfo_exists() and progress.winfo_exists():
-                                total_gb = usage.total / (1024**3)
-                                used_gb = usage.used / (1024**3)
-                                label.configure(text=f"{used_gb:.1f}/{total_gb:.1f}GB ({usage.percent}%)")
-                                progress.set(usage.percent / 100)
-                        except Exception:
-                            continue
+                for disk in snapshot.disks:
+                    if disk.device in self.disk_frames:
+                        label, progress = self.disk_frames[disk.device]
+                        if label.winfo_exists() and progress.winfo_exists():
+                            total_gb = disk.total / (1024**3)
+                            used_gb = disk.used / (1024**3)
+                            self.widgets.text(label, f"{used_gb:.1f}/{total_gb:.1f}GB ({disk.percent}%)")
+                            self.widgets.progress(progress, disk.percent / 100)
 
             # Update Network usage
-            if hasattr(self, 'network_frames') and hasattr(self, 'prev_net_io'):
-                current_net_io = psutil.net_io_counters(pernic=True)
-                for interface, stats in current_net_io.items():
-                    if interface in self.network_frames and interface in self.prev_net_io:
-                        if self.network_frames[interface].winfo_exists():
-                            bytes_sent = stats.bytes_sent - self.prev_net_io[interface].bytes_sent
-                            bytes_recv = stats.bytes_recv - self.prev_net_io[interface].bytes_recv
+            if hasattr(self, 'network_frames'):
+                for nic in snapshot.network:
+                    if nic.interface in self.network_frames:
+                        if self.network_frames[nic.interface].winfo_exists():
+                            upload_speed = self.format_bytes(nic.sent_rate) + "/s"
+                            download_speed = self.format_bytes(nic.recv_rate) + "/s"
                             
-                            upload_speed = self.format_bytes(bytes_sent) + "/s"
-                            download_speed = self.format_bytes(bytes_recv) + "/s"
-                            
-                            self.network_frames[interface].configure(
-                                text=f"↑{upload_speed}  ↓{download_speed}"
+                            self.widgets.text(
+                                self.network_frames[nic.interface],
+                                f"↑{upload_speed}  ↓{download_speed}"
                             )
-                
-                self.prev_net_io = current_net_io
 
             # Update GPU usage
             if hasattr(self, 'gpu_frames'):
-                try:
-                    gpus = GPUtil.getGPUs()
-                    for i, gpu in enumerate(gpus):
-                        if i < len(self.gpu_frames):
-                            frame = self.gpu_frames[i]
-                            if all(widget.winfo_exists() for widget in frame.values()):
-                                # Update GPU usage
-                                frame['usage_label'].configure(text=f"{gpu.load*100:.1f}%")
-                                frame['usage_progress'].set(gpu.load)
-                                
-                                # Update GPU memory
-                                memory_total = gpu.memoryTotal / 1024
-                                memory_used = gpu.memoryUsed / 1024
-                                memory_percent = (memory_used / memory_total) * 100
-                                frame['memory_label'].configure(
-                                    text=f"{memory_used:.1f}/{memory_total:.1f}GB ({memory_percent:.1f}%)"
-                                )
-                                
-                                # Update GPU temperature
-                                frame['temp_label'].configure(text=f"Temp: {gpu.temperature}°C")
-                except Exception as e:
-                    print(f"Error updating GPU info: {e}")
-
-            # Schedule next update if frame still exists
-            if self.current_frame.winfo_exists():
-                self.after(1000, self.update_home_resources)
+                for i, gpu in enumerate(snapshot.gpus):
+                    if i < len(self.gpu_frames):
+                        frame = self.gpu_frames[i]
+                        if all(widget.winfo_exists() for widget in frame.values()):
+                            # Update GPU usage
+                            self.widgets.text(frame['usage_label'], f"{gpu.load*100:.1f}%")
+                            self.widgets.progress(frame['usage_progress'], gpu.load)
+                            
+                            # Update GPU memory
+                            memory_total = gpu.memory_total / 1024
+                            memory_used = gpu.memory_used / 1024
+                            memory_percent = (memory_used / memory_total) * 100
+                            self.widgets.text(
+                                frame['memory_label'],
+                                f"{memory_used:.1f}/{memory_total:.1f}GB ({memory_percent:.1f}%)"
+                            )
+                            
+                            # Update GPU temperature
+                            self.widgets.text(frame['temp_label'], f"Temp: {gpu.temperature}°C")
+
+            # One new segment per chart
+            for chart in self.charts:
+                chart.update()
+
             return True
 
         except Exception as e:
@@ -672,7 +753,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_anomaly_detection(self):
         """Display the anomaly detection page."""
-        self.navigate_to(lambda: self._show_anomaly_detection())
+        self.navigate_to(self._show_anomaly_detection)
 
     def _show_anomaly_detection(self):
         """Internal method to show anomaly detection page."""
@@ -743,7 +824,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_admin_panel(self):
         """Display the admin panel."""
-        self.navigate_to(lambda: self._show_admin_panel())
+        self.navigate_to(self._show_admin_panel)
 
     def _show_admin_panel(self):
         """Internal method to show admin panel."""
@@ -784,6 +865,16 @@ class IntrusionDetectionApp(ctk.CTk):
         )
         manage_limits_btn.pack(pady=10, padx=20, fill="x")
 
+        # Manage Monitoring Settings Button
+        manage_monitoring_btn = ctk.CTkButton(
+            buttons_frame,
+            text="Manage Monitoring Settings",
+            command=self.show_monitor_settings_manager,
+            font=("Helvetica", 14),
+            height=40
+        )
+        manage_monitoring_btn.pack(pady=10, padx=20, fill="x")
+
         # Display current settings
         self.display_current_settings(container)
 
@@ -806,6 +897,23 @@ class IntrusionDetectionApp(ctk.CTk):
                 font=("Helvetica", 12)
             ).pack(pady=5)
 
+        # Display Monitoring Settings
+        monitoring_frame = ctk.CTkFrame(container)
+        monitoring_frame.pack(fill="x", pady=10)
+        
+        ctk.CTkLabel(
+            monitoring_frame,
+            text="Current Monitoring Settings",
+            font=("Helvetica", 16, "bold")
+        ).pack(pady=10)
+
+        for key, label, unit in self.MONITOR_SETTING_FIELDS:
+            ctk.CTkLabel(
+                monitoring_frame,
+                text=f"{label}: {self.monitor_settings[key]:g}{unit}",
+                font=("Helvetica", 12)
+            ).pack(pady=5)
+
         # Display Whitelisted Processes
         whitelist_frame = ctk.CTkFrame(container)
         whitelist_frame.pack(fill="x", pady=10)
@@ -1065,6 +1173,112 @@ class IntrusionDetectionApp(ctk.CTk):
             height=35
         ).pack(fill="x", pady=(20, 0))
 
+    # Editable monitoring settings: (key, label, unit)
+    MONITOR_SETTING_FIELDS = [
+        ('min_interval', "Min Sample Interval", "s"),
+        ('max_interval', "Max Sample Interval", "s"),
+        ('hot_set_size', "Hot Set Size", " processes"),
+        ('full_scan_every', "Full Scan Every", " ticks"),
+        ('spike_threshold', "Full Scan On Rise Of", "%"),
+    ]
+
+    def show_monitor_settings_manager(self):
+        """Show monitoring settings management window."""
+        manager_window = ctk.CTkToplevel(self)
+        manager_window.title("Monitoring Settings Manager")
+        
+        # Make the window modal (user must interact with it before using main window)
+        manager_window.transient(self)
+        manager_window.grab_set()
+        
+        # Set size
+        popup_width = 400
+        popup_height = 560
+        
+        # Get the main window's position and size
+        main_x = self.winfo_x()
+        main_y = self.winfo_y()
+        main_width = self.winfo_width()
+        
+        # Calculate position for the popup (centered horizontally, 50px from top)
+        popup_x = main_x + (main_width - popup_width) // 2
+        popup_y = main_y + 50
+        
+        # Set the position and size
+        manager_window.geometry(f"{popup_width}x{popup_height}+{popup_x}+{popup_y}")
+        
+        # Prevent resizing
+        manager_window.resizable(False, False)
+        
+        # Create main frame with padding
+        form_frame = ctk.CTkFrame(manager_window)
+        form_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        # Title
+        ctk.CTkLabel(
+            form_frame,
+            text="Set Monitoring Settings",
+            font=("Helvetica", 18, "bold")
+        ).pack(pady=(0, 20))
+        
+        # One labelled input per setting
+        entries = {}
+        for key, label, unit in self.MONITOR_SETTING_FIELDS:
+            field_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+            field_frame.pack(fill="x", pady=(0, 10))
+            
+            ctk.CTkLabel(
+                field_frame,
+                text=f"{label} ({unit.strip()}):",
+                font=("Helvetica", 12)
+            ).pack(anchor="w", pady=(0, 5))
+            
+            entry = ctk.CTkEntry(field_frame, height=35, font=("Helvetica", 12))
+            entry.insert(0, f"{self.monitor_settings[key]:g}")
+            entry.pack(fill="x")
+            entries[key] = entry
+        
+        def update_settings():
+            try:
+                values = {key: float(entry.get()) for key, entry in entries.items()}
+                
+                if any(value <= 0 for value in values.values()):
+                    messagebox.showerror("Error", "Settings must be greater than 0")
+                elif values['min_interval'] > values['max_interval']:
+                    messagebox.showerror("Error", "Min interval cannot exceed max interval")
+                else:
+                    self.update_monitor_settings(values)
+                    self._show_admin_panel()
+                    manager_window.destroy()
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid numbers")
+        
+        # Update button
+        ctk.CTkButton(
+            form_frame,
+            text="Update Settings",
+            command=update_settings,
+            font=("Helvetica", 13),
+            height=35
+        ).pack(fill="x", pady=(10, 0))
+
+    def update_monitor_settings(self, values):
+        """Update monitoring settings and save to file."""
+        # The collector reads the same dict, so tier changes apply on its next tick
+        self.monitor_settings.update(values)
+        collector = self.engine.collector
+        if collector is not None and collector.scheduler is not None:
+            collector.scheduler.min_interval = self.monitor_settings['min_interval']
+            collector.scheduler.max_interval = self.monitor_settings['max_interval']
+        
+        try:
+            with open('monitor_settings.txt', 'w') as f:
+                for key, value in self.monitor_settings.items():
+                    f.write(f"{key},{value}\n")
+            print("Monitoring settings updated successfully")
+        except Exception as e:
+            print(f"Error saving monitoring settings: {e}")
+
     def update_resource_limits(self, cpu, memory):
         """Update resource limits and save to file."""
         self.resource_limits['cpu'] = cpu
@@ -1093,37 +1307,6 @@ class IntrusionDetectionApp(ctk.CTk):
         except Exception as e:
             print(f"Error adding process to whitelist: {e}")
 
-    def load_process_whitelist(self):
-        """Load process whitelist from file."""
-        try:
-            whitelist = []
-            with open('process_whitelist.txt', 'r') as f:
-                for line in f:
-                    process = line.strip()
-                    if process:  # Skip empty lines
-                        whitelist.append(process)
-            print(f"Loaded {len(whitelist)} processes in whitelist")
-            return whitelist
-        except FileNotFoundError:
-            print("Whitelist file not found, creating default whitelist")
-            # Create default whitelist
-            default_whitelist = [
-                "chrome.exe",
-                "code.exe",
-                "python.exe",
-                "explorer.exe",
-                "discord.exe",
-                "whatsapp.exe"
-            ]
-            # Save default whitelist
-            with open('process_whitelist.txt', 'w') as f:
-                for process in default_whitelist:
-                    f.write(f"{process}\n")
-            return default_whitelist
-        except Exception as e:
-            print(f"Error loading whitelist: {e}")
-            return []
-
     def remove_from_whitelist(self, process_name):
         """Remove a process from the whitelist."""
         try:
@@ -1136,7 +1319,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_users(self):
         """Display the users page."""
-        self.navigate_to(lambda: self._show_users())
+        self.navigate_to(self._show_users)
 
     def _show_users(self):
         """Internal method to show users page."""
@@ -1153,7 +1336,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_statistics(self):
         """Display the statistics page."""
-        self.navigate_to(lambda: self._show_statistics())
+        self.navigate_to(self._show_statistics)
 
     def _show_statistics(self):
         """Internal method to show statistics page."""
@@ -1170,7 +1353,7 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_system_resources(self):
         """Display the system resources page."""
-        self.navigate_to(lambda: self._show_system_resources())
+        self.navigate_to(self._show_system_resources)
 
     def _show_system_resources(self):
         """Internal method to show system resources page."""
@@ -1180,6 +1363,7 @@ class IntrusionDetectionApp(ctk.CTk):
         container = ctk.CTkScrollableFrame(self.main_frame)
         container.pack(fill="both", expand=True, padx=20, pady=20)
         self.current_frame = container
+        self.charts = []
 
         # Title
         ctk.CTkLabel(
@@ -1209,6 +1393,7 @@ class IntrusionDetectionApp(ctk.CTk):
         self.cpu_progress = ctk.CTkProgressBar(cpu_frame, height=6)
         self.cpu_progress.pack(fill="x", pady=(5, 2))
         self.cpu_progress.set(0)
+        self.add_chart(cpu_frame, 'cpu', 100.0, "#1f6aa5")
         
         self.cpu_freq_label = ctk.CTkLabel(
             cpu_frame,
@@ -1239,6 +1424,7 @@ class IntrusionDetectionApp(ctk.CTk):
         self.memory_progress = ctk.CTkProgressBar(memory_frame, height=6)
         self.memory_progress.pack(fill="x", pady=(5, 2))
         self.memory_progress.set(0)
+        self.add_chart(memory_frame, 'memory', 100.0, "#2fa572")
         
         self.memory_label = ctk.CTkLabel(
             memory_frame,
@@ -1248,37 +1434,39 @@ class IntrusionDetectionApp(ctk.CTk):
         )
         self.memory_label.pack(anchor="w")
 
+        # Lay out one row per device reported by the shared sampler
+        snapshot = self.engine.latest_snapshot
+
         # Disk Usage
         self.disk_frames = {}
-        for partition in psutil.disk_partitions():
-            if partition.fstype:
-                disk_frame = ctk.CTkFrame(container, fg_color="transparent")
-                disk_frame.pack(fill="x", padx=15, pady=5)
-                
-                disk_label_frame = ctk.CTkFrame(disk_frame, fg_color="transparent")
-                disk_label_frame.pack(fill="x")
-                ctk.CTkLabel(
-                    disk_label_frame,
-                    text=f"Disk usage ({partition.device})",
-                    font=("Helvetica", 12)
-                ).pack(side="left")
-                disk_percent_label = ctk.CTkLabel(
-                    disk_label_frame,
-                    text="0%",
-                    font=("Helvetica", 12)
-                )
-                disk_percent_label.pack(side="right")
-                
-                disk_progress = ctk.CTkProgressBar(disk_frame, height=6)
-                disk_progress.pack(fill="x", pady=(5, 2))
-                disk_progress.set(0)
-                
-                self.disk_frames[partition.device] = (disk_percent_label, disk_progress)
+        for disk in (snapshot.disks if snapshot else ()):
+            disk_frame = ctk.CTkFrame(container, fg_color="transparent")
+            disk_frame.pack(fill="x", padx=15, pady=5)
+            
+            disk_label_frame = ctk.CTkFrame(disk_frame, fg_color="transparent")
+            disk_label_frame.pack(fill="x")
+            ctk.CTkLabel(
+                disk_label_frame,
+                text=f"Disk usage ({disk.device})",
+                font=("Helvetica", 12)
+            ).pack(side="left")
+            disk_percent_label = ctk.CTkLabel(
+                disk_label_frame,
+                text="0%",
+                font=("Helvetica", 12)
+            )
+            disk_percent_label.pack(side="right")
+            
+            disk_progress = ctk.CTkProgressBar(disk_frame, height=6)
+            disk_progress.pack(fill="x", pady=(5, 2))
+            disk_progress.set(0)
+            self.add_chart(disk_frame, f'disk:{disk.device}', 100.0, "#FFA500")
+            
+            self.disk_frames[disk.device] = (disk_percent_label, disk_progress)
 
         # Network Usage
         self.network_frames = {}
-        self.prev_net_io = psutil.net_io_counters(pernic=True)
-        for interface in self.prev_net_io.keys():
+        for interface in (nic.interface for nic in (snapshot.network if snapshot else ())):
             network_frame = ctk.CTkFrame(container, fg_color="transparent")
             network_frame.pack(fill="x", padx=15, pady=5)
             
@@ -1295,13 +1483,14 @@ class IntrusionDetectionApp(ctk.CTk):
                 text_color="gray"
             )
             network_label.pack(anchor="w")
+            self.add_chart(network_frame, f'net:{interface}', None, "#9b59b6")
             
             self.network_frames[interface] = network_label
 
         # GPU Usage
         self.gpu_frames = []
         try:
-            gpus = GPUtil.getGPUs()
+            gpus = snapshot.gpus if snapshot else ()
             for gpu in gpus:
                 gpu_frame = ctk.CTkFrame(container, fg_color="transparent")
                 gpu_frame.pack(fill="x", padx=15, pady=5)
@@ -1323,6 +1512,7 @@ class IntrusionDetectionApp(ctk.CTk):
                 gpu_progress = ctk.CTkProgressBar(gpu_frame, height=6)
                 gpu_progress.pack(fill="x", pady=(5, 2))
                 gpu_progress.set(0)
+                self.add_chart(gpu_frame, f'gpu:{gpu.id}', 100.0, "#e74c3c")
                 
                 gpu_memory_label = ctk.CTkLabel(
                     gpu_frame,
@@ -1349,113 +1539,147 @@ class IntrusionDetectionApp(ctk.CTk):
         except Exception as e:
             print(f"Error retrieving GPU information: {e}")
 
-        # Start resource updates
+        # Refresh from the shared sampler on every new snapshot
+        self.system_layout = self.snapshot_layout(snapshot)
+        self.resource_updater = self.update_system_resources
+        self.set_live_updates(True)
         self.update_system_resources()
 
-    def update_system_resources(self):
-        """Update resource information on system resources page."""
+    def update_system_resources(self, snapshot=None):
+        """Update resource information on system resources page from the latest snapshot."""
         try:
-            # Check if the frame exists and we're still on the system resources page
-            if not hasattr(self, 'current_frame') or not self.current_frame.winfo_exists():
+            # Check if the frame exists and we're still on the system page
+            if not hasattr(self, 'current_frame') or not self.current_frame or not self.current_frame.winfo_exists():
                 return False
 
-            # Update CPU usage
+            if snapshot is None:
+                snapshot = self.engine.latest_snapshot
+            if snapshot is None:
+                return True
+
+            # Rebuild the page if devices appeared or disappeared since it was laid out
+            if self.system_layout != self.snapshot_layout(snapshot):
+                self.rebuild_page(self._show_system_resources)
+                return True
+
+            # Update CPU usage if labels exist
             if hasattr(self, 'cpu_percent_label') and self.cpu_percent_label.winfo_exists():
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                self.cpu_percent_label.configure(text=f"{cpu_percent:.1f}%")
-                if hasattr(self, 'cpu_progress'):
-                    self.cpu_progress.set(cpu_percent / 100)
+                cpu_percent = snapshot.cpu_percent
+                self.widgets.text(self.cpu_percent_label, f"{cpu_percent:.1f}%")
+                if hasattr(self, 'cpu_progress') and self.cpu_progress.winfo_exists():
+                    self.widgets.progress(self.cpu_progress, cpu_percent / 100)
             
             # Update CPU frequency if label exists
             if hasattr(self, 'cpu_freq_label') and self.cpu_freq_label.winfo_exists():
-                try:
-                    cpu_freq = psutil.cpu_freq()
-                    if cpu_freq:
-                        current_freq = cpu_freq.current / 1000.0
-                        self.cpu_freq_label.configure(text=f"{current_freq:.2f} GHz")
-                except Exception:
-                    self.cpu_freq_label.configure(text="CPU frequency unavailable")
-
-            # Update Memory usage
+                if snapshot.cpu_freq:
+                    current_freq = snapshot.cpu_freq / 1000.0
+                    self.widgets.text(self.cpu_freq_label, f"{current_freq:.2f} GHz")
+                else:
+                    self.widgets.text(self.cpu_freq_label, "CPU frequency unavailable")
+
+            # Update Memory usage if labels exist
             if hasattr(self, 'memory_percent_label') and self.memory_percent_label.winfo_exists():
-                memory = psutil.virtual_memory()
-                self.memory_percent_label.configure(text=f"{memory.percent:.1f}%")
+                memory = snapshot.memory
+                self.widgets.text(self.memory_percent_label, f"{memory.percent:.1f}%")
                 
                 if hasattr(self, 'memory_progress') and self.memory_progress.winfo_exists():
-                    self.memory_progress.set(memory.percent / 100)
+                    self.widgets.progress(self.memory_progress, memory.percent / 100)
                 
                 if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
                     total_gb = memory.total / (1024**3)
                     used_gb = (memory.used) / (1024**3)  # Corrected to show used memory
-                    self.memory_label.configure(text=f"{used_gb:.1f} GB of {total_gb:.1f} GB")
+                    self.widgets.text(self.memory_label, f"{used_gb:.1f} GB of {total_gb:.1f} GB")
 
             # Update Disk usage
             if hasattr(self, 'disk_frames'):
-                for partition in psutil.disk_partitions():
-                    if partition.fstype and partition.device in self.disk_frames:
-                        try:
-                            usage = psutil.disk_usage(partition.mountpoint)
-                            label, progress = self.disk_frames[partition.device]
-                            if label.winfo_exists() and progress.winfo_exists():
-                                total_gb = usage.total / (1024**3)
-                                used_gb = usage.used / (1024**3)
-                                label.configure(text=f"{used_gb:.1f}/{total_gb:.1f}GB ({usage.percent}%)")
-                                progress.set(usage.percent / 100)
-                        except Exception:
-                            continue
+                for disk in snapshot.disks:
+                    if disk.device in self.disk_frames:
+                        label, progress = self.disk_frames[disk.device]
+                        if label.winfo_exists() and progress.winfo_exists():
+                            total_gb = disk.total / (1024**3)
+                            used_gb = disk.used / (1024**3)
+                            self.widgets.text(label, f"{used_gb:.1f}/{total_gb:.1f}GB ({disk.percent}%)")
+                            self.widgets.progress(progress, disk.percent / 100)
 
             # Update Network usage
-            if hasattr(self, 'network_frames') and hasattr(self, 'prev_net_io'):
-                current_net_io = psutil.net_io_counters(pernic=True)
-                for interface, stats in current_net_io.items():
-                    if interface in self.network_frames and interface in self.prev_net_io:
-                        if self.network_frames[interface].winfo_exists():
-                            bytes_sent = stats.bytes_sent - self.prev_net_io[interface].bytes_sent
-                            bytes_recv = stats.bytes_recv - self.prev_net_io[interface].bytes_recv
+            if hasattr(self, 'network_frames'):
+                for nic in snapshot.network:
+                    if nic.interface in self.network_frames:
+                        if self.network_frames[nic.interface].winfo_exists():
+                            upload_speed = self.format_bytes(nic.sent_rate) + "/s"
+                            download_speed = self.format_bytes(nic.recv_rate) + "/s"
                             
-                            upload_speed = self.format_bytes(bytes_sent) + "/s"
-                            download_speed = self.format_bytes(bytes_recv) + "/s"
-                            
-                            self.network_frames[interface].configure(
-                                text=f"↑{upload_speed}  ↓{download_speed}"
+                            self.widgets.text(
+                                self.network_frames[nic.interface],
+                                f"↑{upload_speed}  ↓{download_speed}"
                             )
-                
-                self.prev_net_io = current_net_io
 
             # Update GPU usage
             if hasattr(self, 'gpu_frames'):
-                try:
-                    gpus = GPUtil.getGPUs()
-                    for i, gpu in enumerate(gpus):
-                        if i < len(self.gpu_frames):
-                            frame = self.gpu_frames[i]
-                            if all(widget.winfo_exists() for widget in frame.values()):
-                                # Update GPU usage
-                                frame['usage_label'].configure(text=f"{gpu.load*100:.1f}%")
-                                frame['usage_progress'].set(gpu.load)
-                                
-                                # Update GPU memory
-                                memory_total = gpu.memoryTotal / 1024
-                                memory_used = gpu.memoryUsed / 1024
-                                memory_percent = (memory_used / memory_total) * 100
-                                frame['memory_label'].configure(
-                                    text=f"{memory_used:.1f}/{memory_total:.1f}GB ({memory_percent:.1f}%)"
-                                )
-                                
-                                # Update GPU temperature
-                                frame['temp_label'].configure(text=f"Temp: {gpu.temperature}°C")
-                except Exception as e:
-                    print(f"Error updating GPU info: {e}")
-
-            # Schedule next update if frame still exists
-            if self.current_frame.winfo_exists():
-                self.after(1000, self.update_system_resources)
+                for i, gpu in enumerate(snapshot.gpus):
+                    if i < len(self.gpu_frames):
+                        frame = self.gpu_frames[i]
+                        if all(widget.winfo_exists() for widget in frame.values()):
+                            # Update GPU usage
+                            self.widgets.text(frame['usage_label'], f"{gpu.load*100:.1f}%")
+                            self.widgets.progress(frame['usage_progress'], gpu.load)
+                            
+                            # Update GPU memory
+                            memory_total = gpu.memory_total / 1024
+                            memory_used = gpu.memory_used / 1024
+                            memory_percent = (memory_used / memory_total) * 100
+                            self.widgets.text(
+                                frame['memory_label'],
+                                f"{memory_used:.1f}/{memory_total:.1f}GB ({memory_percent:.1f}%)"
+                            )
+                            
+                            # Update GPU temperature
+                            self.widgets.text(frame['temp_label'], f"Temp: {gpu.temperature}°C")
+
+            # One new segment per chart
+            for chart in self.charts:
+                chart.update()
+
             return True
 
         except Exception as e:
             print(f"Error updating system resources: {e}")
             return False
 
+    def add_chart(self, parent, key, max_value, color):
+        """Add a scrolling chart of one metric under a resource's progress bar."""
+        chart = Sparkline(parent, self.metric_history, key, max_value=max_value, color=color)
+        chart.pack(fill="x", pady=(2, 4))
+        self.charts.append(chart)
+        return chart
+
+    def record_metrics(self, snapshot):
+        """Append a snapshot's values to the chart history."""
+        history = self.metric_history
+        history.append('cpu', snapshot.cpu_percent)
+        history.append('memory', snapshot.memory.percent)
+        for disk in snapshot.disks:
+            history.append(f'disk:{disk.device}', disk.percent)
+        for nic in snapshot.network:
+            history.append(f'net:{nic.interface}', nic.sent_rate + nic.recv_rate)
+        for gpu in snapshot.gpus:
+            history.append(f'gpu:{gpu.id}', gpu.load * 100)
+
+    def set_live_updates(self, live):
+        """Keep sampling at least every page_refresh_interval while a live page is shown."""
+        if self.engine.collector is not None:
+            self.engine.collector.set_ceiling(self.monitor_settings['page_refresh_interval'] if live else None)
+
+    def snapshot_layout(self, snapshot):
+        """Return the devices a snapshot reports, used to detect layout changes."""
+        if snapshot is None:
+            return None
+        return (
+            tuple(disk.device for disk in snapshot.disks),
+            tuple(nic.interface for nic in snapshot.network),
+            len(snapshot.gpus)
+        )
+
     def format_bytes(self, bytes):
         """Format bytes to human readable format."""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -1466,14 +1690,14 @@ class IntrusionDetectionApp(ctk.CTk):
 
     def show_alerts(self):
         """Display the alerts page."""
-        self.navigate_to(lambda: self._show_alerts())
+        self.navigate_to(self._show_alerts)
 
     def _show_alerts(self):
         """Internal method to show alerts page."""
         self.clear_main_frame()
         
-        # Create main container with scrollable frame
-        container = ctk.CTkScrollableFrame(self.main_frame)
+        # Not a scrollable frame: the alerts grid scrolls its own rows
+        container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         container.pack(fill="both", expand=True, padx=20, pady=20)
         self.current_frame = container
 
@@ -1487,97 +1711,73 @@ class IntrusionDetectionApp(ctk.CTk):
             font=("Helvetica", 24, "bold")
         ).pack(side="left")
 
+        # Alerts held back by the per-process rate limit, kept current by refresh_alerts_page
+        suppressed = self.engine.alert_limiter.total_suppressed
+        self.suppressed_label = ctk.CTkLabel(
+            title_frame,
+            text=f"{suppressed} suppressed" if suppressed else "",
+            font=("Helvetica", 12),
+            text_color="gray"
+        )
+        self.suppressed_label.pack(side="left", padx=15)
+
         # Add refresh button to title frame
         refresh_btn = ctk.CTkButton(
             title_frame,
             text="Refresh Alerts",
-            command=self._show_alerts,
+            command=lambda: self.rebuild_page(self._show_alerts),
             font=("Helvetica", 12),
             height=32
         )
         refresh_btn.pack(side="right", padx=10)
 
-        if not self.alerts:
+        # Alert history, newest first, straight from the event store
+        rows = self.engine.events.alerts(self.ALERT_GRID_LIMIT)
+
+        if not rows:
             ctk.CTkLabel(
                 container,
                 text="No alerts found.",
                 font=("Helvetica", 14),
                 text_color="gray"
             ).pack(anchor="w", padx=15, pady=10)
-        else:
-            # Table container
-            table_frame = ctk.CTkFrame(container)
-            table_frame.pack(fill="x", pady=(0, 2))
-            
-            # Define headers and their widths
-            headers = ["Time", "Process", "Alert Type", "Resource Usage"]
-            widths = [100, 150, 200, 300]  # Adjusted widths
-            
-            # Header row
-            header_row = ctk.CTkFrame(table_frame, fg_color="gray25", height=28)
-            header_row.pack(fill="x")
-            header_row.pack_propagate(False)
-            
-            # Create headers
-            for header, width in zip(headers, widths):
-                header_cell = ctk.CTkFrame(header_row, width=width, fg_color="transparent")
-                header_cell.pack(side="left", padx=3)
-                header_cell.pack_propagate(False)
-                
-                ctk.CTkLabel(
-                    header_cell,
-                    text=header,
-                    font=("Helvetica", 12, "bold"),
-                    text_color=("gray10", "gray90")
-                ).pack(expand=True, pady=3)
+            self.live_refresh = lambda: self.rebuild_page(self._show_alerts)  # nothing to add to yet
+            return
+
+        # Drawn on one canvas; click a header to sort by that column
+        table = CanvasTable(
+            container,
+            [("Time", 100), ("Priority", 80), ("Process", 150), ("Alert Type", 200), ("Resource Usage", 300)],
+            self.alert_cells,
+            sort_keys=[
+                None,  # id order is time order
+                lambda alert: self.PRIORITY_RANK.get(alert.priority, len(self.PRIORITY_RANK)),
+                lambda alert: (alert.process_name or "").lower(),
+                lambda alert: alert.message or "",
+                self.usage_value,
+            ],
+            fetch_newer=lambda after: self.engine.events.alerts(self.ALERT_GRID_LIMIT, after=after),
+            limit=self.ALERT_GRID_LIMIT
+        )
+        table.load(rows)
+        self.live_refresh = lambda: self.refresh_alerts_page(table)
 
-            # Create alert entries
-            for i, alert in enumerate(self.alerts):
-                row_color = "gray17" if i % 2 == 0 else "gray20"
-                row_frame = ctk.CTkFrame(table_frame, fg_color=row_color, height=26)
-                row_frame.pack(fill="x", pady=1)
-                row_frame.pack_propagate(False)
-                
-                # Get process name from alert
-                process_name = alert.get("process_name", "System")
-                
-                # Get resource usage from details
-                details = alert.get("details", "")
-                resource_usage = ""
-                if "Resource Usage -" in details:
-                    resource_usage = details.split("Resource Usage -")[1].split("\n")[0].strip()
-                elif "usage is" in details:
-                    resource_usage = details.split("usage is")[1].split(".")[0].strip()
-                
-                # Prepare cell data
-                cells_data = [
-                    (alert["time"], widths[0]),
-                    (process_name, widths[1]),
-                    (alert["message"], widths[2]),
-                    (resource_usage, widths[3])
-                ]
-                
-                for text, width in cells_data:
-                    cell = ctk.CTkFrame(row_frame, width=width, fg_color="transparent")
-                    cell.pack(side="left", padx=3)
-                    cell.pack_propagate(False)
-                    
-                    label = ctk.CTkLabel(
-                        cell,
-                        text=text,
-                        font=("Helvetica", 11)
-                    )
-                    label.pack(expand=True, pady=3)
+    def refresh_alerts_page(self, table):
+        """Bring the Alerts page's suppressed count and grid up to date."""
+        suppressed = self.engine.alert_limiter.total_suppressed
+        self.widgets.text(self.suppressed_label, f"{suppressed} suppressed" if suppressed else "")
+        table.refresh()
 
     def show_logs(self):
         """Display logs page."""
-        self.navigate_to(lambda: self._show_logs())
+        self.navigate_to(self._show_logs)
 
     def _show_logs(self):
         """Internal method to show logs page."""
         self.clear_main_frame()
         
-        container = ctk.CTkScrollableFrame(self.main_frame)
+        # Not a scrollable frame: the log table scrolls its own rows
+        container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         container.pack(fill="both", expand=True, padx=20, pady=20)
         self.current_frame = container
 
@@ -1600,87 +1800,77 @@ class IntrusionDetectionApp(ctk.CTk):
         refresh_btn = ctk.CTkButton(
             title_container,
             text="Refresh Logs",
-            command=self._show_logs,
+            command=lambda: self.rebuild_page(self._show_logs),
             font=("Helvetica", 12),
             height=32
         )
         refresh_btn.pack(side="right")
 
-        if not self.logs:
+        if self.engine.events.empty():
             ctk.CTkLabel(
                 container,
                 text="No logs found.",
                 font=("Helvetica", 14),
                 text_color="gray"
             ).pack(anchor="w", padx=15, pady=10)
+            self.live_refresh = lambda: self.rebuild_page(self._show_logs)  # nothing to scroll yet
+            return
+
+        # The whole history in one scrollable table; only the rows in view exist
+        # as widgets, and their entries are read from the event store on demand
+        table = VirtualTable(
+            container,
+            [("Time", 80), ("IP", 120), ("Event", 240), ("Level", 70),
+             ("Status", 80), ("Action", 100), ("User", 100)],
+            self.log_cells,
+            fetch_count=lambda after: self.engine.events.count('logs', after=after),
+            fetch_rows=self.engine.events.logs
+        )
+        self.live_refresh = table.refresh
+
+    def resource_usage(self, alert):
+        """Return the resource usage quoted in an alert's details."""
+        details = alert.details or ""
+        if "Resource Usage -" in details:
+            return details.split("Resource Usage -")[1].split("\n")[0].strip()
+        elif "usage is" in details:
+            return details.split("usage is")[1].split(",")[0].strip()
+        return ""
+
+    def usage_value(self, alert):
+        """Return the first percentage in an alert's resource usage as a number, for sorting."""
+        match = re.search(r"(\d+(?:\.\d+)?)%", self.resource_usage(alert))
+        return float(match.group(1)) if match else -1.0
+
+    def alert_cells(self, alert):
+        """Return the Alerts grid cells, (text, text_color), for one alert."""
+        # Severity colouring, as on the Logs page
+        if alert.priority == "High":
+            priority_color = "#FF4444"
+        elif alert.priority in ["Medium", "Med"]:
+            priority_color = "#FFA500"
         else:
-            # Table container
-            table_frame = ctk.CTkFrame(container)
-            table_frame.pack(fill="x", pady=(0, 2))
-            
-            # Added 2 more columns: Status and Action
-            headers = ["Time", "IP", "Event", "Level", "Status", "Action", "User"]
-            widths = [80, 120, 240, 70, 80, 100, 100]  # Adjusted widths to fit new columns
-            
-            # Header row
-            header_row = ctk.CTkFrame(table_frame, fg_color="gray25", height=28)
-            header_row.pack(fill="x")
-            header_row.pack_propagate(False)
-            
-            # Create headers
-            for header, width in zip(headers, widths):
-                header_cell = ctk.CTkFrame(header_row, width=width, fg_color="transparent")
-                header_cell.pack(side="left", padx=3)
-                header_cell.pack_propagate(False)
-                
-                ctk.CTkLabel(
-                    header_cell,
-                    text=header,
-                    font=("Helvetica", 12, "bold"),
-                    text_color=("gray10", "gray90")
-                ).pack(expand=True, pady=3)
-
-            # Create log entries
-            for i, log in enumerate(self.logs):
-                row_color = "gray17" if i % 2 == 0 else "gray20"
-                row_frame = ctk.CTkFrame(table_frame, fg_color=row_color, height=26)
-                row_frame.pack(fill="x", pady=1)
-                row_frame.pack_propagate(False)
-                
-                cells_data = [
-                    (log["timestamp"], widths[0]),
-                    (log["source_ip"], widths[1]),
-                    (log["event"], widths[2]),
-                    (log["severity"], widths[3]),
-                    (log["status"], widths[4]),
-                    (log["action"], widths[5]),
-                    (log["user"], widths[6])
-                ]
-                
-                for text, width in cells_data:
-                    cell = ctk.CTkFrame(row_frame, width=width, fg_color="transparent")
-                    cell.pack(side="left", padx=3)
-                    cell.pack_propagate(False)
-                    
-                    # Special color coding for severity and status
-                    if text in ["High", "Med"]:
-                        text_color = "#FF4444" if text == "High" else "#FFA500"
-                    elif text in ["Blocked", "Failed", "Alert"]:
-                        text_color = "#FF4444"
-                    elif text in ["Success", "Allowed"]:
-                        text_color = "#00CC00"
-                    elif text in ["Pending"]:
-                        text_color = "#FFA500"
-                    else:
-                        text_color = None
-                    
-                    label = ctk.CTkLabel(
-                        cell,
-                        text=text,
-                        font=("Helvetica", 11),
-                        text_color=text_color if text_color else None
-                    )
-                    label.pack(expand=True, pady=3)
+            priority_color = None
+        return [(alert.time, None), (alert.priority, priority_color), (alert.process_name, None),
+                (alert.message, None), (self.resource_usage(alert), None)]
+
+    def log_cells(self, log):
+        """Return the Logs table cells, (text, text_color), for one log entry."""
+        cells = []
+        for text in (log.timestamp, log.source_ip, log.event, log.severity, log.status, log.action, log.user):
+            # Special color coding for severity and status
+            if text in ["High", "Med"]:
+                text_color = "#FF4444" if text == "High" else "#FFA500"
+            elif text in ["Blocked", "Failed", "Alert"]:
+                text_color = "#FF4444"
+            elif text in ["Success", "Allowed"]:
+                text_color = "#00CC00"
+            elif text in ["Pending"]:
+                text_color = "#FFA500"
+            else:
+                text_color = None
+            cells.append((text, text_color))
+        return cells
 
     def on_window_resize(self, event):
         """Handle window resize events."""
@@ -1709,76 +1899,11 @@ class IntrusionDetectionApp(ctk.CTk):
             self.is_hamburger_visible = False
             self.menu_visible = True
 
-    def handle_alert(self, resource_type, value):
-        """Handle alerts and log events when resource limits are exceeded."""
-        try:
-            # Strictly check if the value exceeds the limit
-            threshold = float(self.resource_limits.get(resource_type.lower(), 90))
-            if value <= threshold:
-                return  # Exit if limit is not exceeded
-            
-            print(f"Generating alert for {resource_type}: {value}% > {threshold}%")
-            
-            current_time = datetime.now()
-            formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
-            alert_message = f"System {resource_type} usage exceeded"
-
-            # Create alert entry
-            alert = {
-                "priority": "High",
-                "message": alert_message,
-                "details": f"System {resource_type} usage is {value:.1f}%, which is above the threshold of {threshold}%.",
-                "time": current_time.strftime("%H:%M:%S"),
-                "process_name": "System"  # Mark as system alert
-            }
-
-            # Create log entry
-            log_entry = {
-                "timestamp": formatted_time,
-                "source_ip": "localhost",
-                "event": alert_message,
-                "severity": "High",
-                "status": "Alert",
-                "action": "System Monitoring",
-                "user": "system",
-                "process": "System"  # Mark as system alert
-            }
-
-            # Add to in-memory lists
-            self.alerts.insert(0, alert)
-            self.logs.insert(0, log_entry)
-
-            # Keep only the last 100 entries
-            if len(self.alerts) > 100:
-                self.alerts.pop()
-            if len(self.logs) > 100:
-                self.logs.pop()
-
-            # Write to log file
-            with open(self.log_file, 'a') as f:
-                f.write(f"{formatted_time},{resource_type},{alert_message},High,Alert,System Monitoring,system\n")
-
-            # Save alerts and logs to a file
-            self.save_alerts_and_logs()
-
-            # Force refresh of displays
-            self.update_displays()
-
-        except Exception as e:
-            print(f"Error in handle_alert: {e}")
-
-    def save_alerts_and_logs(self):
-        """Save alerts and logs to a file."""
-        with open('alerts_logs.json', 'w') as f:
-            json.dump({'alerts': self.alerts, 'logs': self.logs}, f)
-
     def update_displays(self):
-        """Force refresh of alerts and logs displays"""
+        """Bring the visible Alerts or Logs table up to date with the event store."""
         try:
-            if self.current_page == self._show_alerts:
-                self._show_alerts()
-            elif self.current_page == self._show_logs:
-                self._show_logs()
+            if self.live_refresh:
+                self.live_refresh()
         except Exception as e:
             print(f"Error updating displays: {e}")
 
@@ -1791,113 +1916,46 @@ class IntrusionDetectionApp(ctk.CTk):
         if self.monitoring_task:
             self.after_cancel(self.monitoring_task)
         
+        # Sampling runs on a background thread so the mainloop never blocks on psutil
+        self.engine.start()
+        
         # Start the monitoring loop
         self.monitor_resources()
 
     def monitor_resources(self):
-        """Continuous monitoring loop with process checking."""
+        """Let the engine check pending snapshots and refresh the visible page."""
         try:
-            # Get accurate CPU and Memory usage
-            cpu_total = psutil.cpu_percent(interval=1)  # Get overall CPU usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent  # Get actual memory percentage
-            
-            print("\n=== Current System Status ===")
-            print(f"Current Usage - CPU: {cpu_total:.1f}%, Memory: {memory_percent:.1f}%")
-            print(f"Current Limits - CPU: {self.resource_limits['cpu']}%, Memory: {self.resource_limits['memory']}%")
-            print("\nWhitelisted Processes:", [p.lower() for p in self.process_whitelist])
-            
-            print("\n=== Running Processes ===")
-            # Track if any non-whitelisted process is causing high usage
-            high_usage_detected = False
-            
-            # Check all running processes
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    proc_info = proc.info
-                    proc_name = proc_info['name'].lower()
-                    
-                    # Get accurate process usage
-                    process = psutil.Process(proc_info['pid'])
-                    # Get process CPU percentage relative to total CPU
-                    proc_cpu = process.cpu_percent() / psutil.cpu_count()
-                    # Get process memory percentage relative to total memory
-                    proc_memory = (process.memory_info().rss / memory.total) * 100
-                    
-                    # Print all processes with significant resource usage (above 1%)
-                    if proc_cpu > 1 or proc_memory > 1:
-                        print(f"\nProcess: {proc_name}")
-                        print(f"  PID: {proc_info['pid']}")
-                        print(f"  CPU: {proc_cpu:.1f}%")
-                        print(f"  Memory: {proc_memory:.1f}%")
-                        print(f"  In Whitelist: {proc_name in [p.lower() for p in self.process_whitelist]}")
-                    
-                    # Check if process exceeds limits
-                    cpu_exceeded = proc_cpu > float(self.resource_limits['cpu'])
-                    mem_exceeded = proc_memory > float(self.resource_limits['memory'])
-                    
-                    if cpu_exceeded or mem_exceeded:
-                        print(f"\n=== High Usage Process Detected ===")
-                        print(f"Process: {proc_name}")
-                        print(f"  CPU: {proc_cpu:.1f}% (Limit: {self.resource_limits['cpu']}%)")
-                        print(f"  Memory: {proc_memory:.1f}% (Limit: {self.resource_limits['memory']}%)")
-                        
-                        # Check if process is in whitelist (case-insensitive)
-                        is_whitelisted = any(whitelisted.lower() == proc_name for whitelisted in self.process_whitelist)
-                        print(f"  Is Whitelisted: {is_whitelisted}")
-                        
-                        if not is_whitelisted:
-                            high_usage_detected = True
-                            self.handle_process_alert(
-                                proc_name, 
-                                proc_cpu, 
-                                proc_memory, 
-                                "Process exceeding resource limits"
-                            )
-                        else:
-                            print(f"  Status: Ignoring (whitelisted)")
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+            snapshot = self.engine.poll()
+
+            # Charts keep their history whichever page is shown
+            if snapshot is not None:
+                self.record_metrics(snapshot)
 
-            # Only generate system-wide alerts if no specific process was identified as the cause
-            if not high_usage_detected:
-                if cpu_total > float(self.resource_limits['cpu']):
-                    print(f"\nSystem CPU Alert: {cpu_total:.1f}% > {self.resource_limits['cpu']}%")
-                    self.handle_alert("CPU", cpu_total)
+            # Every page reads the same snapshot instead of sampling on its own
+            if snapshot is not None and self.resource_updater:
+                self.resource_updater(snapshot)
 
-                if memory_percent > float(self.resource_limits['memory']):
-                    print(f"\nSystem Memory Alert: {memory_percent:.1f}% > {self.resource_limits['memory']}%")
-                    self.handle_alert("Memory", memory_percent)
+            # Suppressed alerts reach no listener, so watch the rate limiter's count too
+            suppressed = self.engine.alert_limiter.total_suppressed
+            if suppressed != self.suppressed_seen:
+                self.suppressed_seen = suppressed
+                self.displays_stale = True
 
-            # Update UI regardless of alerts
-            if hasattr(self, 'current_page'):
-                if self.current_page == self._show_system_resources or self.current_page == self._show_home:
-                    self.update_resource_displays(cpu_total, memory)
+            # One refresh however many alerts arrived since the last poll
+            if self.displays_stale:
+                self.displays_stale = False
+                self.update_displays()
 
         except Exception as e:
             print(f"Error in monitor_resources: {e}")
 
         finally:
             if self.monitoring_active:
-                self.monitoring_task = self.after(2000, self.monitor_resources)  # Check every 2 seconds
+                self.monitoring_task = self.after(200, self.monitor_resources)  # Poll the snapshot queue
 
-    def update_resource_displays(self, cpu_total, memory):
-        """Update system resource displays if they exist."""
-        try:
-            if hasattr(self, 'cpu_percent_label') and self.cpu_percent_label.winfo_exists():
-                self.cpu_percent_label.configure(text=f"{cpu_total:.1f}%")
-                if hasattr(self, 'cpu_progress'):
-                    self.cpu_progress.set(cpu_total / 100)
-            
-            if hasattr(self, 'memory_label') and self.memory_label.winfo_exists():
-                total_gb = memory.total / (1024**3)
-                used_gb = (memory.used) / (1024**3)  # Corrected to show used memory
-                self.memory_label.configure(text=f"{used_gb:.1f} GB of {total_gb:.1f} GB")
-                if hasattr(self, 'memory_progress'):
-                    self.memory_progress.set(memory.percent / 100)
-        except Exception as e:
-            print(f"Error updating resource displays: {e}")
+    def on_engine_alert(self, alert, log_entry):
+        """Mark the alerts and logs displays for a refresh after the engine records an alert."""
+        self.displays_stale = True
 
     def stop_monitoring(self):
         """Stop monitoring system resources."""
@@ -1906,90 +1964,14 @@ class IntrusionDetectionApp(ctk.CTk):
         if self.monitoring_task:
             self.after_cancel(self.monitoring_task)
             self.monitoring_task = None
+        self.engine.stop()
 
-    def handle_process_alert(self, process_name, cpu_usage, memory_usage, reason):
-        """Handle alerts for suspicious process activity."""
-        try:
-            # Strictly check if either CPU or memory usage exceeds limits
-            if (cpu_usage <= float(self.resource_limits['cpu']) and 
-                memory_usage <= float(self.resource_limits['memory'])):
-                return  # Exit if no limits are exceeded
-            
-            print(f"Generating process alert for {process_name}")
-            print(f"CPU: {cpu_usage}% > {self.resource_limits['cpu']}%")
-            print(f"Memory: {memory_usage}% > {self.resource_limits['memory']}%")
-            
-            current_time = datetime.now()
-            formatted_time = current_time.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Create more specific alert message
-            exceeded_resources = []
-            if cpu_usage > float(self.resource_limits['cpu']):
-                exceeded_resources.append(f"CPU: {cpu_usage:.1f}% > {self.resource_limits['cpu']}%")
-            if memory_usage > float(self.resource_limits['memory']):
-                exceeded_resources.append(f"Memory: {memory_usage:.1f}% > {self.resource_limits['memory']}%")
-            
-            alert_message = f"Process {process_name} exceeded limits"
-            
-            # Create detailed alert
-            alert = {
-                "priority": "High",
-                "message": alert_message,
-                "details": (f"Process: {process_name}\n"
-                          f"Resource Usage - {', '.join(exceeded_resources)}\n"
-                          f"Reason: {reason}"),
-                "time": current_time.strftime("%H:%M:%S"),
-                "process_name": process_name  # Add process name for filtering
-            }
-
-            # Create log entry
-            log_entry = {
-                "timestamp": formatted_time,
-                "source_ip": "localhost",
-                "event": alert_message,
-                "severity": "High",
-                "status": "Alert",
-                "action": "Process Monitoring",
-                "user": "system",
-                "process": process_name  # Add process name for filtering
-            }
-
-            # Add to in-memory lists
-            self.alerts.insert(0, alert)
-            self.logs.insert(0, log_entry)
-
-            # Maintain list size
-            if len(self.alerts) > 100:
-                self.alerts.pop()
-            if len(self.logs) > 100:
-                self.logs.pop()
-
-            # Write to log file
-            with open(self.log_file, 'a') as f:
-                f.write(f"{formatted_time},Process,{alert_message},High,Alert,Process Monitoring,system\n")
-
-            # Save alerts and logs
-            self.save_alerts_and_logs()
-            
-            # Force refresh of displays if on alerts or logs page
-            if self.current_page in [self._show_alerts, self._show_logs]:
-                self.current_page()
-
-        except Exception as e:
-            print(f"Error in handle_process_alert: {e}")
+    def on_closing(self):
+        """Stop monitoring, write out pending alerts and close the window."""
+        self.stop_monitoring()
+        self.engine.close()
+        self.destroy()
 
-    def load_resource_limits(self):
-        """Load resource limits from file."""
-        try:
-            with open('resource_limits.txt', 'r') as f:
-                limits = {}
-                for line in f:
-                    resource, limit = line.strip().split(',')
-                    limits[resource] = float(limit)
-                return limits
-        except FileNotFoundError:
-            # Return default limits
-            return {'cpu': 50, 'memory': 70}
 
 
 if __name__ == "__main__":
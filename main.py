@@ -6,6 +6,7 @@ import GPUtil
 from datetime import datetime
 from PIL import Image
 import json
+from monitoring import AdaptiveInterval, usage_ratio
 
 
 class IntrusionDetectionApp(ctk.CTk):
@@ -37,6 +38,14 @@ class IntrusionDetectionApp(ctk.CTk):
         self.monitoring_active = False
         self.monitoring_task = None
 
+        # Sample slowly while idle and quickly near a limit
+        self.monitor_settings = self.load_monitor_settings()
+        self.monitor_interval = AdaptiveInterval(
+            min_interval=self.monitor_settings['min_interval'],
+            max_interval=self.monitor_settings['max_interval']
+        )
+        self.limit_ratio = 0.0
+
         # CustomTkinter global appearance settings
         ctk.set_appearance_mode("Dark")  # Options: "Dark", "Light", "System"
         ctk.set_default_color_theme("dark-blue")  # Options: "blue", "green", "dark-blue"
@@ -1334,7 +1343,7 @@ class IntrusionDetectionApp(ctk.CTk):
             
             # Get Memory usage
             memory = psutil.virtual_memory()
-            
+
             # Check limits and generate alerts
             if cpu_total > self.resource_limits['cpu']:
                 self.handle_alert("CPU", cpu_total)
@@ -1343,15 +1352,20 @@ class IntrusionDetectionApp(ctk.CTk):
                 self.handle_alert("Memory", memory.percent)
 
             # Check disk usage
+            disk_percents = []
             for partition in psutil.disk_partitions():
                 if partition.fstype:
                     try:
                         usage = psutil.disk_usage(partition.mountpoint)
+                        disk_percents.append(usage.percent)
                         if usage.percent > self.resource_limits['disk']:
                             self.handle_alert(f"Disk ({partition.device})", usage.percent)
                     except Exception:
                         continue
 
+            # How close the closest metric is to its limit, for the adaptive interval
+            self.limit_ratio = usage_ratio(self.resource_limits, cpu_total, memory.percent, disk_percents)
+
             # Update UI for any page that shows resource info
             if hasattr(self, 'current_page'):
                 if self.current_page == self._show_system_resources or self.current_page == self._show_home:
@@ -1363,7 +1377,8 @@ class IntrusionDetectionApp(ctk.CTk):
         finally:
             # Schedule next update if monitoring is still active
             if self.monitoring_active:
-                self.monitoring_task = self.after(1000, self.monitor_resources)
+                delay = self.monitor_interval.next_interval(self.limit_ratio)
+                self.monitoring_task = self.after(int(delay * 1000), self.monitor_resources)
 
     def update_resource_displays(self, cpu_total, memory):
         """Update system resource displays if they exist."""
@@ -1390,6 +1405,22 @@ class IntrusionDetectionApp(ctk.CTk):
             self.after_cancel(self.monitoring_task)
             self.monitoring_task = None
 
+    def load_monitor_settings(self):
+        """Load the sampling interval bounds from file."""
+        settings = {'min_interval': 0.5, 'max_interval': 10.0}
+        try:
+            with open('monitor_settings.txt', 'r') as f:
+                for line in f:
+                    if line.strip():
+                        key, value = line.strip().split(',')
+                        if key in settings:
+                            settings[key] = float(value)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading monitor settings: {e}")
+        return settings
+
 
 if __name__ == "__main__":
     app = IntrusionDetectionApp()
@@ -0,0 +1,593 @@
+"""Background resource sampling for the intrusion detection system."""
+import concurrent.futures
+import multiprocessing
+import queue
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import psutil
+
+import procfs
+
+try:
+    import GPUtil
+except ImportError:  # GPU stats are optional
+    GPUtil = None
+
+
+# forkserver where the platform has it; spawn everywhere else
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Immutable records handed from the collector thread to the UI thread
+ProcessSample = namedtuple('ProcessSample', [
+    'pid', 'name', 'cpu_percent', 'memory_percent', 'rss', 'num_threads', 'status'
+])
+DiskSample = namedtuple('DiskSample', ['device', 'mountpoint', 'total', 'used', 'percent'])
+NetworkSample = namedtuple('NetworkSample', ['interface', 'sent_rate', 'recv_rate'])
+GpuSample = namedtuple('GpuSample', ['id', 'load', 'memory_used', 'memory_total', 'temperature'])
+
+# `processes` is a ProcessColumns table rather than a tuple of ProcessSample
+Snapshot = namedtuple('Snapshot', [
+    'timestamp', 'cpu_percent', 'cpu_freq', 'memory', 'disks', 'network', 'gpus', 'processes'
+])
+
+
+class ResourceSampler:
+    """Produce one Snapshot of every monitored counter per call to sample()."""
+
+    def __init__(self, use_procfs=True, settings=None):
+        self.prev_net_io = None
+        self.prev_time = None
+        self.process_table = ProcessTable()
+        # Linux fast path; psutil is used wherever /proc can't be read
+        self.procfs = procfs.ProcfsReader() if use_procfs and procfs.available() else None
+        # Last /proc readings per process, sorted by pid, for vectorized CPU deltas
+        self.procfs_baseline = None  # (pids, start_times, cpu_times, wall_times)
+        self.names = NameIndex()
+        # Tier sizes and scan periods; read on every tick so edits apply live
+        self.settings = settings if settings is not None else {}
+        self.hot_pids = None
+        self.ticks_since_full_scan = 0
+        self.prev_usage = None  # (cpu_percent, memory_percent) of the previous tick
+        # Optional process pool for sharded full scans (collector_workers setting)
+        self.pool = None
+        self.pool_size = 0
+        self.pool_failed = False
+        # Prime the system-wide counter so the first non-blocking reading is meaningful
+        psutil.cpu_percent(interval=None)
+
+    def sample(self):
+        """Take one snapshot of system and per-process usage."""
+        now = time.time()
+        # Non-blocking: measured since the previous tick instead of sleeping
+        cpu_total = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+
+        return Snapshot(
+            now,
+            cpu_total,
+            self.sample_cpu_freq(),
+            memory,
+            self.sample_disks(),
+            self.sample_network(now),
+            self.sample_gpus(),
+            self.sample_processes(memory, cpu_total)
+        )
+
+    def sample_cpu_freq(self):
+        """Return the current CPU frequency in MHz, or None if unavailable."""
+        try:
+            cpu_freq = psutil.cpu_freq()
+            return cpu_freq.current if cpu_freq else None
+        except Exception:
+            return None
+
+    def sample_disks(self):
+        """Return usage for every mounted partition with a filesystem."""
+        disks = []
+        for partition in psutil.disk_partitions():
+            if not partition.fstype:
+                continue
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+            except Exception:
+                continue
+            disks.append(DiskSample(
+                partition.device, partition.mountpoint, usage.total, usage.used, usage.percent
+            ))
+        return tuple(disks)
+
+    def sample_network(self, now):
+        """Return per-interface transfer rates in bytes per second."""
+        current_net_io = psutil.net_io_counters(pernic=True)
+        elapsed = now - self.prev_time if self.prev_time else 0
+
+        network = []
+        for interface, stats in current_net_io.items():
+            prev = self.prev_net_io.get(interface) if self.prev_net_io else None
+            if prev is not None and elapsed > 0:
+                sent_rate = (stats.bytes_sent - prev.bytes_sent) / elapsed
+                recv_rate = (stats.bytes_recv - prev.bytes_recv) / elapsed
+            else:
+                sent_rate = recv_rate = 0.0
+            network.append(NetworkSample(interface, sent_rate, recv_rate))
+
+        self.prev_net_io = current_net_io
+        self.prev_time = now
+        return tuple(network)
+
+    def sample_gpus(self):
+        """Return load, memory and temperature for every GPU GPUtil can see."""
+        if GPUtil is None:
+            return ()
+        try:
+            return tuple(
+                GpuSample(gpu.id, gpu.load, gpu.memoryUsed, gpu.memoryTotal, gpu.temperature)
+                for gpu in GPUtil.getGPUs()
+            )
+        except Exception as e:
+            print(f"Error retrieving GPU information: {e}")
+            return ()
+
+    def sample_processes(self, memory, cpu_total=0.0):
+        """Return usage for the hot set, or for every process on a full-scan tick."""
+        full_scan = self.full_scan_due(cpu_total, memory.percent)
+        pids = None if full_scan else self.hot_pids
+
+        columns = None
+        if self.procfs is not None:
+            try:
+                # Only full scans are big enough to be worth sharding across processes
+                if full_scan and self.workers() > 1 and not self.pool_failed:
+                    try:
+                        columns = self.read_sharded(memory.total)
+                    except Exception as e:
+                        # A broken pool only costs the sharding; /proc is still read in-thread
+                        print(f"Error in collector worker pool, reading /proc in-thread: {e}")
+                        self.close()
+                        self.pool_failed = True
+                if columns is None:
+                    columns = self.read_procfs(memory.total, pids)
+            except Exception as e:
+                print(f"Error reading /proc, falling back to psutil: {e}")
+                self.procfs = None
+        if columns is None:
+            if full_scan:
+                entries = self.process_table.refresh()
+            else:
+                entries = self.process_table.select(pids)
+            columns = self.read_processes(entries, memory.total)
+
+        columns.full_scan = full_scan
+        if full_scan:
+            self.hot_pids = self.top_consumers(columns)
+            self.ticks_since_full_scan = 0
+        else:
+            self.ticks_since_full_scan += 1
+        return columns
+
+    def full_scan_due(self, cpu_total, memory_percent):
+        """Return True if this tick should scan every process instead of the hot set."""
+        every = int(self.settings.get('full_scan_every', 10))
+        spike = float(self.settings.get('spike_threshold', 10.0))
+        prev_usage = self.prev_usage
+        self.prev_usage = (cpu_total, memory_percent)
+
+        if self.hot_pids is None or every <= 1:
+            return True
+        if self.ticks_since_full_scan + 1 >= every:
+            return True
+        # A sharp system-wide rise may come from a process outside the hot set
+        return prev_usage is not None and (
+            cpu_total - prev_usage[0] >= spike or memory_percent - prev_usage[1] >= spike
+        )
+
+    def top_consumers(self, columns):
+        """Return the pids of the top CPU and top memory consumers, which form the next hot set."""
+        size = int(self.settings.get('hot_set_size', 50))
+        if size <= 0 or not len(columns):
+            return []
+        if size >= len(columns):
+            return sorted(int(pid) for pid in columns.pids)
+        top_cpu = np.argpartition(columns.cpu_percent, -size)[-size:]
+        top_memory = np.argpartition(columns.memory_percent, -size)[-size:]
+        return sorted(int(pid) for pid in np.unique(columns.pids[np.concatenate((top_cpu, top_memory))]))
+
+    def read_procfs(self, memory_total, pids=None):
+        """Read processes (default: all of them) straight from /proc into a ProcessColumns table."""
+        reader = self.procfs
+        n = reader.read(pids)
+        return self.build_columns(
+            np.frombuffer(reader.pids, dtype=np.int64, count=n).copy(),
+            np.frombuffer(reader.start_times, dtype=np.uint64, count=n).copy(),
+            np.frombuffer(reader.cpu_times, dtype=np.float64, count=n).copy(),
+            np.frombuffer(reader.rss, dtype=np.uint64, count=n).astype(np.int64),
+            np.frombuffer(reader.num_threads, dtype=np.int64, count=n).astype(np.int32),
+            reader.names[:n],
+            reader.states[:n],
+            memory_total,
+            full_scan=pids is None
+        )
+
+    def read_sharded(self, memory_total, pids=None):
+        """Read processes from /proc across the worker pool and merge the shards into one table."""
+        if pids is None:
+            pids = self.procfs.list_pids()
+        workers = self.workers()
+        if self.pool is None or self.pool_size != workers:
+            self.close()
+            # Never fork: this runs on the collector thread while the UI thread holds Tk state
+            self.pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(POOL_START_METHOD)
+            )
+            self.pool_size = workers
+
+        # Contiguous slices of the PID list, one per worker
+        chunk = -(-len(pids) // workers) or 1
+        shards = [pids[i:i + chunk] for i in range(0, len(pids), chunk)]
+        results = list(self.pool.map(procfs.read_shard, shards))
+
+        def merge(column, dtype):
+            return np.concatenate([np.frombuffer(result[column], dtype=dtype) for result in results] or
+                                  [np.empty(0, dtype=dtype)])
+
+        return self.build_columns(
+            merge(0, np.int64),
+            merge(1, np.uint64),
+            merge(2, np.float64),
+            merge(3, np.uint64).astype(np.int64),
+            merge(4, np.int64).astype(np.int32),
+            [name for result in results for name in result[5]],
+            [state for result in results for state in result[6]],
+            memory_total,
+            full_scan=True
+        )
+
+    def workers(self):
+        """Return the configured number of collector processes (0 or 1 means in-thread)."""
+        return int(self.settings.get('collector_workers', 0))
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def build_columns(self, pid_column, start_times, cpu_times, rss, num_threads, names, states,
+                      memory_total, full_scan):
+        """Turn raw /proc readings into a ProcessColumns table with CPU deltas from the baseline."""
+        n = len(pid_column)
+        cpu_count = psutil.cpu_count() or 1
+        now = time.monotonic()
+
+        # Match each row to the last reading for the same (pid, start_time)
+        cpu_percent = np.zeros(n)
+        baseline = self.procfs_baseline
+        idx = matched = None
+        if baseline is not None and n and len(baseline[0]):
+            prev_pids, prev_starts, prev_cpu, prev_walls = baseline
+            idx = np.minimum(np.searchsorted(prev_pids, pid_column), len(prev_pids) - 1)
+            elapsed = now - prev_walls[idx]
+            matched = (prev_pids[idx] == pid_column) & (prev_starts[idx] == start_times) & (elapsed > 0)
+            delta = np.divide(cpu_times - prev_cpu[idx], elapsed, out=np.zeros(n), where=matched)
+            cpu_percent = np.maximum(delta * 100 / cpu_count, 0.0)
+
+        if full_scan or baseline is None:
+            # Full scan: the new readings replace the baseline, dropping exited PIDs
+            order = np.argsort(pid_column, kind='stable')
+            self.procfs_baseline = (
+                pid_column[order], start_times[order], cpu_times[order], np.full(n, now)
+            )
+        elif matched is not None:
+            # Hot-set scan: only the rows just read move forward
+            rows = idx[matched]
+            baseline[2][rows] = cpu_times[matched]
+            baseline[3][rows] = now
+
+        return ProcessColumns(
+            pid_column,
+            cpu_percent,
+            rss / memory_total * 100,
+            rss,
+            num_threads,
+            self.names.intern_all(name.lower() for name in names),
+            tuple(states),
+            self.names
+        )
+
+    def read_processes(self, entries, memory_total):
+        """Read each (pid, Process) pair in a single oneshot() pass into a ProcessColumns table."""
+        # Constant for the whole tick, so computed once instead of per process
+        cpu_count = psutil.cpu_count() or 1
+        now = time.monotonic()
+        table = self.process_table
+
+        pids, cpu_percent, rss, num_threads, names, statuses = [], [], [], [], [], []
+        for pid, proc in entries:
+            try:
+                with proc.oneshot():
+                    name = proc.name()
+                    cpu_times = proc.cpu_times()
+                    memory_info = proc.memory_info()
+                    threads = proc.num_threads()
+                    status = proc.status()
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            except psutil.NoSuchProcess:
+                table.evict(pid)
+                continue
+
+            pids.append(pid)
+            # CPU share of the whole machine since the previous tick
+            cpu_percent.append(table.cpu_percent(pid, cpu_times.user + cpu_times.system, now) / cpu_count)
+            rss.append(memory_info.rss)
+            num_threads.append(threads)
+            names.append((name or '').lower())
+            statuses.append(status)
+
+        rss = np.array(rss, dtype=np.int64)
+        return ProcessColumns(
+            np.array(pids, dtype=np.int64),
+            np.array(cpu_percent, dtype=np.float64),
+            rss / memory_total * 100,
+            rss,
+            np.array(num_threads, dtype=np.int32),
+            self.names.intern_all(names),
+            tuple(statuses),
+            self.names
+        )
+
+
+class NameIndex:
+    """Intern process names to small integer ids shared by every snapshot."""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def intern_all(self, names):
+        """Return an int32 array with the id of each name, adding unseen names."""
+        ids = self.ids
+        result = []
+        for name in names:
+            name_id = ids.get(name)
+            if name_id is None:
+                name_id = ids[name] = len(self.names)
+                self.names.append(name)
+            result.append(name_id)
+        return np.array(result, dtype=np.int32)
+
+    def mask(self, names):
+        """Return a boolean lookup table, indexed by name id, that is True for the given names."""
+        # Sized from the current list; ids are only ever appended, never reused
+        lookup = np.zeros(len(self.names), dtype=bool)
+        for name in names:
+            name_id = self.ids.get(name.lower())
+            if name_id is not None:
+                lookup[name_id] = True
+        return lookup
+
+
+class ProcessColumns:
+    """Read-only columnar table of per-process usage for one tick."""
+
+    def __init__(self, pids, cpu_percent, memory_percent, rss, num_threads, name_ids, statuses, names):
+        self.pids = pids
+        self.cpu_percent = cpu_percent
+        self.memory_percent = memory_percent
+        self.rss = rss
+        self.num_threads = num_threads
+        self.name_ids = name_ids
+        self.statuses = statuses
+        self.names = names
+        # False when only the hot set was read this tick
+        self.full_scan = True
+        for column in (pids, cpu_percent, memory_percent, rss, num_threads, name_ids):
+            column.flags.writeable = False
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self.pids)))
+
+    def name(self, i):
+        """Return the process name of row i."""
+        return self.names.names[self.name_ids[i]]
+
+    def row(self, i):
+        """Return row i as a ProcessSample."""
+        return ProcessSample(
+            int(self.pids[i]),
+            self.name(i),
+            float(self.cpu_percent[i]),
+            float(self.memory_percent[i]),
+            int(self.rss[i]),
+            int(self.num_threads[i]),
+            self.statuses[i]
+        )
+
+    def whitelisted(self, whitelist):
+        """Return a boolean mask of rows whose name is in the whitelist (case-insensitive)."""
+        return self.names.mask(whitelist)[self.name_ids]
+
+    def named(self, name):
+        """Return a boolean mask of rows whose (lower-case) name is name."""
+        return self.name_ids == self.names.ids.get(name, -1)
+
+    def exceeding(self, cpu_limit, memory_limit):
+        """Return a boolean mask of rows above either limit."""
+        return (self.cpu_percent > cpu_limit) | (self.memory_percent > memory_limit)
+
+
+class ProcessTable:
+    """Keep psutil.Process objects alive across ticks, keyed by (pid, create_time).
+
+    A fresh psutil.Process has no CPU-time baseline, so its cpu_percent() is
+    always 0.0. Keeping one object and the last CPU time per process gives
+    real per-tick deltas and avoids allocating one object per process per tick.
+    """
+
+    def __init__(self):
+        self.entries = {}  # (pid, create_time) -> [psutil.Process, cpu_time, wall_time]
+        self.keys = {}  # pid -> (pid, create_time) of the process currently holding it
+
+    def __len__(self):
+        return len(self.entries)
+
+    def refresh(self):
+        """Sync the table with the running processes and return (pid, Process) pairs."""
+        entries, keys = {}, {}
+        # process_iter re-checks each cached Process's create_time, so a reused PID
+        # comes back as a new Process with a new key and a fresh CPU baseline
+        for proc in psutil.process_iter(['create_time']):
+            create_time = proc.info['create_time']
+            if create_time is None:
+                continue
+            key = (proc.pid, create_time)
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = [proc, None, None]
+            entries[key] = entry
+            keys[proc.pid] = key
+
+        # Anything not seen this tick has exited and is dropped
+        self.entries, self.keys = entries, keys
+        return [(pid, entries[key][0]) for pid, key in keys.items()]
+
+    def select(self, pids):
+        """Return (pid, Process) pairs for the given pids that are still in the table."""
+        entries, keys = self.entries, self.keys
+        return [(pid, entries[keys[pid]][0]) for pid in pids if pid in keys]
+
+    def cpu_percent(self, pid, cpu_time, now):
+        """Return CPU usage since the last call for pid (per core, like psutil) and store the new baseline."""
+        entry = self.entries.get(self.keys.get(pid))
+        if entry is None:
+            return 0.0
+        prev_cpu_time, prev_now = entry[1], entry[2]
+        entry[1], entry[2] = cpu_time, now
+        if prev_cpu_time is None or now <= prev_now:
+            return 0.0
+        return max(0.0, (cpu_time - prev_cpu_time) / (now - prev_now) * 100)
+
+    def evict(self, pid):
+        """Forget a process that has exited mid-tick."""
+        self.entries.pop(self.keys.pop(pid, None), None)
+
+
+def limit_ratio(snapshot, limits):
+    """Return how close the snapshot is to its limits: 1.0 means a limit is reached."""
+    cpu_percent = snapshot.cpu_percent
+    memory_percent = snapshot.memory.percent
+    processes = snapshot.processes
+    if len(processes):
+        cpu_percent = max(cpu_percent, float(processes.cpu_percent.max()))
+        memory_percent = max(memory_percent, float(processes.memory_percent.max()))
+    return usage_ratio(limits, cpu_percent, memory_percent, [disk.percent for disk in snapshot.disks])
+
+
+def usage_ratio(limits, cpu_percent, memory_percent, disk_percents=()):
+    """Return the highest usage-to-limit ratio; a limit of 0 counts as 1."""
+    cpu_limit = float(limits.get('cpu', 90)) or 1.0
+    memory_limit = float(limits.get('memory', 90)) or 1.0
+    disk_limit = float(limits.get('disk', 90)) or 1.0
+    return max(cpu_percent / cpu_limit, memory_percent / memory_limit,
+               *(percent / disk_limit for percent in disk_percents))
+
+
+class AdaptiveInterval:
+    """Pick the next sampling delay from how close the metrics are to their limits.
+
+    Below `idle` of a limit the delay doubles each tick up to max_interval; at
+    `approach` of a limit or above it drops straight to min_interval.
+    """
+
+    def __init__(self, min_interval=0.5, max_interval=10.0, base_interval=1.0,
+                 approach=0.8, idle=0.5, backoff=2.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.base_interval = base_interval
+        self.approach = approach
+        self.idle = idle
+        self.backoff = backoff
+        self.current = base_interval
+
+    def next_interval(self, ratio, ceiling=None):
+        """Return the delay in seconds before the next sample."""
+        if ratio >= self.approach:
+            self.current = self.min_interval
+        elif ratio < self.idle:
+            self.current = min(self.max_interval, max(self.current, self.base_interval) * self.backoff)
+        else:
+            self.current = max(self.min_interval, min(self.base_interval, self.max_interval))
+
+        if ceiling is not None:
+            return max(self.min_interval, min(self.current, ceiling))
+        return self.current
+
+
+class ResourceCollector(threading.Thread):
+    """Sample system resources on a worker thread and publish snapshots to a queue."""
+
+    def __init__(self, interval=1.0, max_pending=4, scheduler=None, limits=None, settings=None):
+        super().__init__(name="ResourceCollector", daemon=True)
+        self.settings = settings
+        self.interval = interval
+        # With a scheduler the delay adapts to how close the host is to `limits`
+        self.scheduler = scheduler
+        self.limits = limits if limits is not None else {}
+        self.ceiling = None
+        self.sampler = None
+        self.snapshots = queue.Queue(maxsize=max_pending)
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def stop(self):
+        """Ask the collector to exit after the current tick."""
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def set_ceiling(self, ceiling):
+        """Cap the adaptive delay (e.g. while a live page is visible) and sample right away."""
+        if ceiling != self.ceiling:
+            self.ceiling = ceiling
+            self._wake_event.set()
+
+    def stopped(self):
+        """Return True once stop() has been requested."""
+        return self._stop_event.is_set()
+
+    def run(self):
+        self.sampler = ResourceSampler(settings=self.settings)
+
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            delay = self.interval
+            try:
+                snapshot = self.sampler.sample()
+                self.publish(snapshot)
+                if self.scheduler is not None:
+                    delay = self.scheduler.next_interval(limit_ratio(snapshot, self.limits), self.ceiling)
+            except Exception as e:
+                print(f"Error in resource collector: {e}")
+
+            elapsed = time.monotonic() - started
+            self._wake_event.wait(max(0.0, delay - elapsed))
+            self._wake_event.clear()
+
+        self.sampler.close()
+
+    def publish(self, snapshot):
+        """Queue a snapshot, discarding the oldest one if the consumer falls behind."""
+        while True:
+            try:
+                self.snapshots.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self.snapshots.get_nowait()
+                except queue.Empty:
+                    pass
@@ -0,0 +1,159 @@
+"""Linux-only process reader that parses /proc directly, bypassing psutil."""
+import os
+import sys
+from array import array
+
+
+PROC_ROOT = '/proc'
+
+# /proc/[pid]/stat state letters, mapped to psutil's status names
+STATUS_NAMES = {
+    'R': 'running',
+    'S': 'sleeping',
+    'D': 'disk-sleep',
+    'Z': 'zombie',
+    'T': 'stopped',
+    't': 'tracing-stop',
+    'X': 'dead',
+    'x': 'dead',
+    'K': 'wake-kill',
+    'W': 'waking',
+    'I': 'idle',
+    'P': 'parked',
+}
+
+# The kernel truncates comm to 15 characters
+COMM_LENGTH = 15
+
+
+def available():
+    """Return True if /proc can be read the way ProcfsReader expects."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(os.path.join(PROC_ROOT, 'self', 'stat'), 'rb') as f:
+            f.read()
+        with open(os.path.join(PROC_ROOT, 'self', 'statm'), 'rb') as f:
+            f.read()
+        return True
+    except OSError:
+        return False
+
+
+class ProcfsReader:
+    """Read every process's stat and statm files into reusable column arrays.
+
+    After read() returns n, rows 0..n-1 of pids, start_times, cpu_times, rss,
+    num_threads, states and names hold one process each. The arrays are only
+    reallocated when the process count outgrows them.
+    """
+
+    def __init__(self, capacity=4096):
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """(Re)allocate the column arrays for capacity rows."""
+        self.capacity = capacity
+        self.pids = array('q', bytes(array('q').itemsize * capacity))
+        self.start_times = array('Q', bytes(array('Q').itemsize * capacity))  # clock ticks after boot
+        self.cpu_times = array('d', bytes(array('d').itemsize * capacity))  # user + system seconds
+        self.rss = array('Q', bytes(array('Q').itemsize * capacity))  # bytes
+        self.num_threads = array('q', bytes(array('q').itemsize * capacity))
+        self.states = [''] * capacity
+        self.names = [''] * capacity
+
+    def grow(self):
+        """Double the capacity, keeping the rows already read."""
+        old = (self.pids, self.start_times, self.cpu_times, self.rss, self.num_threads,
+               self.states, self.names)
+        self.allocate(self.capacity * 2)
+        for new_column, old_column in zip(
+                (self.pids, self.start_times, self.cpu_times, self.rss, self.num_threads,
+                 self.states, self.names), old):
+            new_column[:len(old_column)] = old_column
+
+    def list_pids(self):
+        """Return the numeric entries of /proc."""
+        return [int(entry) for entry in os.listdir(PROC_ROOT) if entry.isdigit()]
+
+    def read(self, pids=None):
+        """Fill the column arrays for pids (default: all of /proc) and return the row count."""
+        if pids is None:
+            pids = self.list_pids()
+
+        clock_ticks = self.clock_ticks
+        page_size = self.page_size
+        n = 0
+        for pid in pids:
+            try:
+                with open(f'{PROC_ROOT}/{pid}/stat', 'rb') as f:
+                    stat = f.read()
+                with open(f'{PROC_ROOT}/{pid}/statm', 'rb') as f:
+                    statm = f.read()
+            except OSError:
+                continue  # exited between listing and reading
+
+            try:
+                # comm may itself contain spaces or parentheses, so split on the last ')'
+                rpar = stat.rindex(b')')
+                name = stat[stat.index(b'(') + 1:rpar].decode('utf-8', 'replace')
+                fields = stat[rpar + 2:].split()
+                state = fields[0].decode()
+                if state == 'Z':
+                    continue  # zombies have no memory or CPU left to report
+                # stat fields 14/15 (utime/stime), 20 (num_threads), 22 (starttime)
+                cpu_time = (int(fields[11]) + int(fields[12])) / clock_ticks
+                num_threads = int(fields[17])
+                start_time = int(fields[19])
+                # statm field 2 is resident pages
+                rss = int(statm.split()[1]) * page_size
+            except (ValueError, IndexError):
+                continue  # a truncated or malformed row; skip this process, not the scan
+            if len(name) >= COMM_LENGTH:
+                name = self.full_name(pid, name)
+
+            if n == self.capacity:
+                self.grow()
+            self.pids[n] = pid
+            self.cpu_times[n] = cpu_time
+            self.num_threads[n] = num_threads
+            self.start_times[n] = start_time
+            self.rss[n] = rss
+            self.states[n] = STATUS_NAMES.get(state, state)
+            self.names[n] = name
+            n += 1
+        return n
+
+    def full_name(self, pid, comm):
+        """Recover a name the kernel truncated, from the first cmdline argument (as psutil does)."""
+        try:
+            with open(f'{PROC_ROOT}/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            return comm
+        executable = os.path.basename(cmdline.split(b'\0', 1)[0].decode('utf-8', 'replace'))
+        return executable if executable.startswith(comm) else comm
+
+
+# One reader per pool worker, reused across shards
+_shard_reader = None
+
+
+def read_shard(pids):
+    """Pool worker: read one shard of PIDs and return its columns as compact bytes."""
+    global _shard_reader
+    if _shard_reader is None:
+        _shard_reader = ProcfsReader()
+    reader = _shard_reader
+    n = reader.read(pids)
+    return (
+        reader.pids[:n].tobytes(),
+        reader.start_times[:n].tobytes(),
+        reader.cpu_times[:n].tobytes(),
+        reader.rss[:n].tobytes(),
+        reader.num_threads[:n].tobytes(),
+        reader.names[:n],
+        reader.states[:n],
+    )
@@ -0,0 +1,392 @@
+"""Table widgets for the Alerts and Logs pages."""
+from bisect import bisect
+from collections import OrderedDict, deque
+
+import customtkinter as ctk
+
+
+class ScrolledRows:
+    """Scrolling shared by the tables that only draw the rows in view.
+
+    Subclasses keep a fixed pool of drawn rows (self.pool) and implement
+    row_count() and render(); scrolling only moves self.top, the index of
+    the first row in view, and re-renders the pool.
+    """
+
+    def __init__(self):
+        self.top = 0
+        self.pool = []
+
+    def row_count(self):
+        raise NotImplementedError
+
+    def render(self):
+        raise NotImplementedError
+
+    def bind_wheel(self, widget):
+        """Scroll the table with the mouse wheel over widget."""
+        widget.bind("<MouseWheel>", self.on_wheel)  # Windows and macOS
+        widget.bind("<Button-4>", self.on_wheel)  # X11
+        widget.bind("<Button-5>", self.on_wheel)
+
+    def scroll_to(self, top):
+        """Show the rows starting at index top."""
+        top = max(0, min(top, self.row_count() - len(self.pool)))
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * self.row_count()))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= len(self.pool)
+            self.scroll_to(self.top + amount)
+
+    def on_wheel(self, event):
+        up = getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0
+        self.scroll_to(self.top + (-3 if up else 3))
+
+    def update_scrollbar(self):
+        total = self.row_count()
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + len(self.pool)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class VirtualTable(ScrolledRows):
+    """Scrollable table that only has widgets for the rows in view.
+
+    Only the number of records is known up front. Records are pulled in
+    pages of fetch_size around the rows being shown and kept in a bounded
+    LRU cache; a page is numbered from the oldest record, so new records
+    never shift the pages already fetched. A page next to a cached one is
+    read by keyset (ids after or before it), any other with an offset.
+    Scrolling only re-labels the same pool of row widgets, so it costs the
+    same for 100 rows or 1M.
+    """
+
+    ROW_HEIGHT = 28
+    STRIPES = ("gray17", "gray20")
+
+    def __init__(self, parent, columns, row_cells, fetch_count, fetch_rows, cache_size=5000, fetch_size=256):
+        # columns: [(header, width)]; row_cells(record) -> [(text, text_color or None)]
+        # fetch_count(after_id) -> (records newer than after_id, newest id)
+        # fetch_rows(limit, before=, after=, offset=, oldest_first=) -> [(id, record)], like EventStore.logs
+        super().__init__()
+        self.columns = columns
+        self.row_cells = row_cells
+        self.fetch_count = fetch_count
+        self.fetch_rows = fetch_rows
+        self.fetch_size = fetch_size
+        self.max_pages = max(2, cache_size // fetch_size)
+        self.total = 0
+        self.newest_id = 0
+        self.pages = OrderedDict()  # page number -> [(id, record)] oldest first
+        # self.pool: [[row_frame, labels, shown]], shown = (stripe, cells) last drawn
+
+        self.frame = ctk.CTkFrame(parent)
+        self.frame.pack(fill="both", expand=True)
+
+        header_row = ctk.CTkFrame(self.frame, fg_color="gray25", height=28)
+        header_row.pack(fill="x")
+        header_row.pack_propagate(False)
+        for header, width in columns:
+            header_cell = ctk.CTkFrame(header_row, width=width, fg_color="transparent")
+            header_cell.pack(side="left", padx=3)
+            header_cell.pack_propagate(False)
+
+            ctk.CTkLabel(
+                header_cell,
+                text=header,
+                font=("Helvetica", 12, "bold"),
+                text_color=("gray10", "gray90")
+            ).pack(expand=True, pady=3)
+
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = ctk.CTkFrame(self.frame, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.body.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.body)
+
+        self.refresh()
+
+    def row_count(self):
+        return self.total
+
+    def refresh(self):
+        """Pick up records added since the last refresh; returns how many there were."""
+        count, self.newest_id = self.fetch_count(self.newest_id)
+        if count:
+            self.total += count
+            # A short page was the newest one and may have grown
+            for page in [page for page, rows in self.pages.items() if len(rows) < self.fetch_size]:
+                del self.pages[page]
+            if self.top > 0:
+                self.top += count  # keep the same rows in view unless following the newest
+            self.render()
+        return count
+
+    def on_resize(self, event):
+        """Grow or shrink the row pool to fill the viewport."""
+        count = max(1, event.height // self.ROW_HEIGHT)
+        while len(self.pool) < count:
+            self.pool.append(self.build_row())
+        while len(self.pool) > count:
+            self.pool.pop()[0].destroy()
+        self.render()
+
+    def build_row(self):
+        """Create one reusable row of empty cells."""
+        row_frame = ctk.CTkFrame(self.body, fg_color=self.STRIPES[0], height=self.ROW_HEIGHT - 2)
+        row_frame.pack(fill="x", pady=1)
+        row_frame.pack_propagate(False)
+        self.bind_wheel(row_frame)
+        labels = []
+        for _, width in self.columns:
+            cell = ctk.CTkFrame(row_frame, width=width, fg_color="transparent")
+            cell.pack(side="left", padx=3)
+            cell.pack_propagate(False)
+            label = ctk.CTkLabel(cell, text="", font=("Helvetica", 11))
+            label.pack(expand=True, pady=3)
+            self.bind_wheel(cell)
+            self.bind_wheel(label)
+            labels.append(label)
+        return [row_frame, labels, None]
+
+    def record(self, index):
+        """Return the record at newest-first index, fetching its page if needed."""
+        page, slot = divmod(self.total - 1 - index, self.fetch_size)
+        rows = self.page(page)
+        return rows[slot][1] if slot < len(rows) else None
+
+    def page(self, page):
+        """Return the rows of a page (oldest first), from the cache or the store."""
+        rows = self.pages.get(page)
+        if rows is not None:
+            self.pages.move_to_end(page)
+            return rows
+        older = self.pages.get(page - 1)
+        newer = self.pages.get(page + 1)
+        if older is not None and len(older) == self.fetch_size:
+            rows = self.fetch_rows(self.fetch_size, after=older[-1][0], oldest_first=True)
+        elif newer is not None:
+            rows = self.fetch_rows(self.fetch_size, before=newer[0][0])[::-1]
+        else:
+            rows = self.fetch_rows(self.fetch_size, offset=page * self.fetch_size, oldest_first=True)
+        self.pages[page] = rows
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+        return rows
+
+    def render(self):
+        """Re-label the row pool for the current scroll position."""
+        total = self.total
+        for k, row in enumerate(self.pool):
+            row_frame, labels, shown = row
+            index = self.top + k
+            record = self.record(index) if index < total else None
+            cells = self.row_cells(record) if record is not None else [("", None)] * len(labels)
+            stripe = self.STRIPES[index % 2]
+            if shown == (stripe, cells):
+                continue  # only touch widgets whose content changed
+            if shown is None or shown[0] != stripe:
+                row_frame.configure(fg_color=stripe)
+            for i, (label, (text, text_color)) in enumerate(zip(labels, cells)):
+                if shown is None or shown[1][i] != (text, text_color):
+                    label.configure(text=text, text_color=text_color or self.default_text_color(label))
+            row[2] = (stripe, cells)
+        self.update_scrollbar()
+
+    @staticmethod
+    def default_text_color(label):
+        """Return the theme's label colour (for cells without their own)."""
+        return ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+
+
+class CanvasTable(ScrolledRows):
+    """Sortable grid drawn on a single Canvas.
+
+    Each row in view is one rectangle plus one text item per column; the
+    items are created once per viewport row and only itemconfigure()d when
+    the table scrolls, sorts or gets new records. Clicking a header sorts
+    by that column (again to reverse); sort_keys gives one key(record) per
+    column, None meaning id order. Rows are kept as (key, id, record) in
+    ascending order, so a key is computed once per record per sort and new
+    records are bisected into place. At most `limit` of the newest records
+    are kept (trimmed in steps of a tenth of it).
+    """
+
+    ROW_HEIGHT = 26
+    HEADER_HEIGHT = 28
+    STRIPES = ("gray17", "gray20")
+    HEADER_COLOR = "gray25"
+    TEXT_COLOR = "gray90"
+    CHAR_WIDTH = 7  # rough width of a row-font character, for truncating long cells
+
+    def __init__(self, parent, columns, row_cells, sort_keys=None, fetch_newer=None, limit=None):
+        # columns: [(header, width)]; row_cells(record) -> [(text, text_color or None)]
+        # fetch_newer(after_id) -> [(id, record)] newer than after_id
+        super().__init__()
+        self.columns = columns
+        self.row_cells = row_cells
+        self.sort_keys = sort_keys or [None] * len(columns)
+        self.fetch_newer = fetch_newer
+        self.limit = limit
+        self.rows = []  # [(sort key, id, record)], ascending
+        self.ids = deque()  # ids held, oldest first, for trimming
+        self.newest_id = 0
+        self.sort_column = None  # None = newest first
+        self.descending = True
+        # self.pool: [[rect, texts, shown]], shown = (stripe, cells) last drawn
+
+        self.frame = ctk.CTkFrame(parent)
+        self.frame.pack(fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self.frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas = ctk.CTkCanvas(self.frame, bg=self.STRIPES[0], highlightthickness=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.canvas)
+
+        # Column x positions, then the header row
+        self.lefts = []
+        x = 0
+        for _, width in columns:
+            self.lefts.append(x)
+            x += width
+        self.canvas.create_rectangle(0, 0, x, self.HEADER_HEIGHT, fill=self.HEADER_COLOR, width=0)
+        self.headers = []
+        for i, ((header, width), left) in enumerate(zip(columns, self.lefts)):
+            text = self.canvas.create_text(
+                left + 6, self.HEADER_HEIGHT // 2,
+                text=header, anchor="w", fill=self.TEXT_COLOR, font=("Helvetica", 12, "bold")
+            )
+            self.canvas.tag_bind(text, "<Button-1>", lambda event, column=i: self.sort_by(column))
+            self.headers.append(text)
+
+    def row_count(self):
+        return len(self.rows)
+
+    def record_at(self, index):
+        """Return the record shown at display index."""
+        return self.rows[len(self.rows) - 1 - index if self.descending else index][2]
+
+    def load(self, records):
+        """Replace the table's contents with (id, record) pairs."""
+        self.ids = deque(sorted(record_id for record_id, _ in records))
+        self.newest_id = self.ids[-1] if self.ids else 0
+        self.top = 0
+        self.sort(records)
+        self.trim()
+        self.render()
+
+    def refresh(self):
+        """Add records newer than any shown; returns how many there were."""
+        if self.fetch_newer is None:
+            return 0
+        records = self.fetch_newer(self.newest_id)
+        if records:
+            key = self.sort_key()
+            for record_id, record in sorted(records, key=lambda pair: pair[0]):
+                row = (key(record) if key else 0, record_id, record)
+                index = bisect(self.rows, row)
+                self.rows.insert(index, row)
+                self.ids.append(record_id)
+                # Keep the same rows in view unless following the top
+                position = len(self.rows) - 1 - index if self.descending else index
+                if self.top > 0 and position <= self.top:
+                    self.top += 1
+            self.newest_id = self.ids[-1]
+            if self.limit and len(self.ids) > self.limit + max(1, self.limit // 10):
+                self.trim()
+            self.render()
+        return len(records)
+
+    def trim(self):
+        """Drop the oldest records beyond the limit."""
+        if not self.limit or len(self.ids) <= self.limit:
+            return
+        cutoff = self.ids[len(self.ids) - self.limit]
+        while self.ids[0] < cutoff:
+            self.ids.popleft()
+        self.rows = [row for row in self.rows if row[1] >= cutoff]
+        self.top = max(0, min(self.top, len(self.rows) - len(self.pool)))
+
+    def sort_by(self, column):
+        """Sort by column, reversing the order if it is already the sort column."""
+        if column == self.sort_column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+            self.sort([(record_id, record) for _, record_id, record in self.rows])
+        for i, ((header, _), text) in enumerate(zip(self.columns, self.headers)):
+            arrow = (" ▼" if self.descending else " ▲") if i == column else ""
+            self.canvas.itemconfigure(text, text=header + arrow)
+        self.top = 0
+        self.render()
+
+    def sort_key(self):
+        return self.sort_keys[self.sort_column] if self.sort_column is not None else None
+
+    def sort(self, records):
+        """Order (id, record) pairs by the sort column, computing each key once."""
+        key = self.sort_key()
+        self.rows = sorted((key(record) if key else 0, record_id, record) for record_id, record in records)
+
+    def on_resize(self, event):
+        """Grow or shrink the pool of drawn rows to fill the canvas."""
+        count = max(1, (event.height - self.HEADER_HEIGHT) // self.ROW_HEIGHT)
+        while len(self.pool) < count:
+            self.pool.append(self.build_row(len(self.pool)))
+        while len(self.pool) > count:
+            rect, texts, _ = self.pool.pop()
+            self.canvas.delete(rect, *texts)
+        self.render()
+
+    def build_row(self, slot):
+        """Create the (empty) canvas items for viewport row `slot`."""
+        top = self.HEADER_HEIGHT + slot * self.ROW_HEIGHT
+        right = self.lefts[-1] + self.columns[-1][1]
+        rect = self.canvas.create_rectangle(0, top, right, top + self.ROW_HEIGHT, width=0,
+                                            fill=self.STRIPES[0])
+        texts = [
+            self.canvas.create_text(left + 6, top + self.ROW_HEIGHT // 2, text="", anchor="w",
+                                    fill=self.TEXT_COLOR, font=("Helvetica", 11))
+            for left in self.lefts
+        ]
+        return [rect, texts, None]
+
+    def fit(self, text, width):
+        """Cut text to what fits in a column of width pixels."""
+        text = "" if text is None else str(text)
+        room = max(1, (width - 12) // self.CHAR_WIDTH)
+        return text if len(text) <= room else text[:room - 1] + "…"
+
+    def render(self):
+        """Re-text the drawn rows for the current scroll position and order."""
+        total = len(self.rows)
+        for k, row in enumerate(self.pool):
+            rect, texts, shown = row
+            index = self.top + k
+            if index < total:
+                cells = self.row_cells(self.record_at(index))
+                stripe = self.STRIPES[index % 2]
+            else:
+                cells = [("", None)] * len(texts)
+                stripe = self.STRIPES[0]
+            if shown == (stripe, cells):
+                continue  # only touch items whose content changed
+            if shown is None or shown[0] != stripe:
+                self.canvas.itemconfigure(rect, fill=stripe)
+            for i, (text, (cell, text_color)) in enumerate(zip(texts, cells)):
+                if shown is None or shown[1][i] != (cell, text_color):
+                    self.canvas.itemconfigure(text, text=self.fit(cell, self.columns[i][1]),
+                                              fill=text_color or self.TEXT_COLOR)
+            row[2] = (stripe, cells)
+        self.update_scrollbar()
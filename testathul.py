@@ -6,6 +6,7 @@ import GPUtil
 from datetime import datetime
 from PIL import Image
 import json
+from monitoring import AdaptiveInterval, usage_ratio
 
 
 class IntrusionDetectionApp(ctk.CTk):
@@ -46,6 +47,14 @@ class IntrusionDetectionApp(ctk.CTk):
         self.monitoring_active = False
         self.monitoring_task = None
 
+        # Sample slowly while idle and quickly near a limit
+        self.monitor_settings = self.load_monitor_settings()
+        self.monitor_interval = AdaptiveInterval(
+            min_interval=self.monitor_settings['min_interval'],
+            max_interval=self.monitor_settings['max_interval']
+        )
+        self.limit_ratio = 0.0
+
         # CustomTkinter global appearance settings
         ctk.set_appearance_mode("Dark")  # Options: "Dark", "Light", "System"
         ctk.set_default_color_theme("dark-blue")  # Options: "blue", "green", "dark-blue"
@@ -1651,7 +1660,10 @@ class IntrusionDetectionApp(ctk.CTk):
             # Get CPU and Memory usage
             cpu_total = psutil.cpu_percent(interval=0.1)
             memory = psutil.virtual_memory()
-            
+
+            # Busiest process, for the adaptive interval
+            top_cpu = top_memory = 0.0
+
             # Check for high-usage processes
             for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
                 try:
@@ -1659,6 +1671,8 @@ class IntrusionDetectionApp(ctk.CTk):
                     proc_name = proc_info['name'].lower()
                     proc_cpu = proc_info['cpu_percent']
                     proc_memory = proc_info['memory_percent']
+                    top_cpu = max(top_cpu, proc_cpu)
+                    top_memory = max(top_memory, proc_memory)
                     
                     # Check if process is using high resources
                     if proc_cpu > self.resource_limits['cpu'] or proc_memory > self.resource_limits['memory']:
@@ -1673,6 +1687,11 @@ class IntrusionDetectionApp(ctk.CTk):
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
+            # How close the closest metric is to its limit, for the adaptive interval
+            self.limit_ratio = usage_ratio(
+                self.resource_limits, max(cpu_total, top_cpu), max(memory.percent, top_memory)
+            )
+
             # System-wide resource checks
             if cpu_total > self.resource_limits['cpu']:
                 self.handle_alert("CPU", cpu_total)
@@ -1690,7 +1709,8 @@ class IntrusionDetectionApp(ctk.CTk):
 
         finally:
             if self.monitoring_active:
-                self.monitoring_task = self.after(1000, self.monitor_resources)
+                delay = self.monitor_interval.next_interval(self.limit_ratio)
+                self.monitoring_task = self.after(int(delay * 1000), self.monitor_resources)
 
     def update_resource_displays(self, cpu_total, memory):
         """Update system resource displays if they exist."""
@@ -1784,6 +1804,22 @@ class IntrusionDetectionApp(ctk.CTk):
             # Return default limits
             return {'cpu': 50, 'memory': 70}
 
+    def load_monitor_settings(self):
+        """Load the sampling interval bounds from file."""
+        settings = {'min_interval': 0.5, 'max_interval': 10.0}
+        try:
+            with open('monitor_settings.txt', 'r') as f:
+                for line in f:
+                    if line.strip():
+                        key, value = line.strip().split(',')
+                        if key in settings:
+                            settings[key] = float(value)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading monitor settings: {e}")
+        return settings
+
 
 if __name__ == "__main__":
     app = IntrusionDetectionApp()
@@ -0,0 +1,142 @@
+"""Unit tests for the alert sinks in alertbus.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alertbus import AlertBus, AlertSink, PolledSink  # noqa: E402
+
+
+class RecordingSink(AlertSink):
+    """Keep every batch written and count flushes and closes."""
+
+    def __init__(self, fail_on=None, **options):
+        options.setdefault('flush_interval', 60.0)  # only sync()/stop() flush during a test
+        super().__init__('recording', **options)
+        self.fail_on = fail_on
+        self.batches = []
+        self.flushes = 0
+        self.closed = False
+        self.written_when_flushed = []
+
+    def write(self, events):
+        if self.fail_on in events:
+            raise RuntimeError("write failed")
+        self.batches.append(list(events))
+
+    def flush(self):
+        self.flushes += 1
+        self.written_when_flushed.append(self.written())
+
+    def close(self):
+        self.closed = True
+
+    def written(self):
+        return [event for batch in self.batches for event in batch]
+
+
+class AlertSinkTest(unittest.TestCase):
+    def start(self, **options):
+        sink = RecordingSink(**options)
+        sink.start()
+        self.addCleanup(sink.stop)
+        return sink
+
+    def test_sync_writes_and_flushes_a_partial_batch(self):
+        sink = self.start(batch_size=64)
+        for event in range(5):
+            sink.offer(event)
+        started = time.monotonic()
+        sink.sync(timeout=5)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(sink.written(), list(range(5)))
+        self.assertEqual(sink.written_when_flushed[-1], list(range(5)))
+
+    def test_stop_drains_flushes_and_closes(self):
+        sink = self.start(batch_size=64, max_batch=10)
+        for event in range(95):
+            sink.offer(event)
+        sink.stop()
+        self.assertFalse(sink.is_alive())
+        self.assertEqual(sink.written(), list(range(95)))
+        self.assertTrue(all(len(batch) <= 10 for batch in sink.batches))
+        # One flush, after the last batch
+        self.assertEqual(sink.written_when_flushed, [list(range(95))])
+        self.assertTrue(sink.closed)
+
+    def test_full_batch_is_written_without_sync(self):
+        sink = self.start(batch_size=4)
+        for event in range(4):
+            sink.offer(event)
+        deadline = time.monotonic() + 5
+        while not sink.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sink.batches, [[0, 1, 2, 3]])
+
+    def test_failed_write_does_not_stop_the_worker(self):
+        sink = self.start(batch_size=1, fail_on=1)
+        for event in range(3):
+            sink.offer(event)
+        sink.sync(timeout=5)
+        self.assertTrue(sink.is_alive())
+        self.assertEqual(sink.written(), [0, 2])
+
+    def test_sync_and_stop_without_a_worker(self):
+        sink = RecordingSink()
+        sink.offer(1)
+        sink.sync()
+        sink.stop()
+        self.assertEqual(sink.batches, [])
+
+    def test_block_policy_waits_for_the_worker(self):
+        sink = self.start(batch_size=2, max_pending=2, policy='block')
+        publisher = threading.Thread(target=lambda: [sink.offer(event) for event in range(20)])
+        publisher.start()
+        publisher.join(5)
+        self.assertFalse(publisher.is_alive())
+        sink.sync(timeout=5)
+        self.assertEqual(sink.written(), list(range(20)))
+        self.assertEqual(sink.dropped, 0)
+
+
+class PolledSinkTest(unittest.TestCase):
+    def test_drop_oldest(self):
+        sink = PolledSink('ui', max_pending=3, policy='drop_oldest')
+        for event in range(5):
+            self.assertTrue(sink.offer(event))
+        self.assertEqual(sink.drain(), [2, 3, 4])
+        self.assertEqual(sink.dropped, 2)
+
+    def test_drop_newest(self):
+        sink = PolledSink('ui', max_pending=3, policy='drop_newest')
+        results = [sink.offer(event) for event in range(5)]
+        self.assertEqual(results, [True, True, True, False, False])
+        self.assertEqual(sink.drain(limit=2), [0, 1])
+        self.assertEqual(sink.drain(), [2])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            PolledSink('ui', policy='spill')
+
+
+class AlertBusTest(unittest.TestCase):
+    def test_publish_reaches_every_sink(self):
+        bus = AlertBus()
+        polled = bus.add(PolledSink('ui'))
+        worker = bus.add(RecordingSink())
+        for event in range(3):
+            bus.publish(event)
+        bus.sync()
+        self.assertEqual(worker.written(), [0, 1, 2])
+        self.assertEqual(polled.drain(), [0, 1, 2])
+        bus.close()
+        self.assertFalse(worker.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()
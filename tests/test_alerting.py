@@ -0,0 +1,158 @@
+"""Unit tests for the alert pipeline building blocks in alerting.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alerting import AlertRateLimiter, IncidentTracker, RingBuffer  # noqa: E402
+
+KEY = ('CPU', 'python')
+
+
+class RingBufferTest(unittest.TestCase):
+    def test_reads_newest_first(self):
+        ring = RingBuffer(5)
+        ring.extend_oldest_first([1, 2, 3])
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(list(ring), [3, 2, 1])
+        self.assertEqual(ring[0], 3)
+        self.assertEqual(ring[-1], 1)
+        self.assertEqual(ring[:2], [3, 2])
+
+    def test_wraparound_drops_oldest(self):
+        ring = RingBuffer(3)
+        ring.extend_oldest_first(range(1, 8))
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(list(ring), [7, 6, 5])
+        self.assertEqual([ring[i] for i in range(3)], [7, 6, 5])
+        self.assertEqual(ring[-1], 5)
+        self.assertEqual(ring[1:], [6, 5])
+
+    def test_index_out_of_range(self):
+        ring = RingBuffer(3)
+        with self.assertRaises(IndexError):
+            ring[0]
+        ring.extend_oldest_first(range(4))
+        with self.assertRaises(IndexError):
+            ring[3]
+
+    def test_clear(self):
+        ring = RingBuffer(2)
+        ring.extend_oldest_first(range(5))
+        ring.clear()
+        self.assertFalse(ring)
+        ring.append('a')
+        self.assertEqual(list(ring), ['a'])
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+class IncidentTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker = IncidentTracker(raise_samples=3, raise_seconds=0.0, clear_samples=2)
+
+    def sample(self, value, now):
+        return self.tracker.sample(KEY, value, now, raise_at=90, clear_at=85)
+
+    def test_pending_then_open(self):
+        self.assertIsNone(self.sample(95, 0))
+        self.assertEqual(self.tracker.incidents[KEY].state, 'pending')
+        self.assertIsNone(self.sample(96, 1))
+        transition, incident = self.sample(97, 2)
+        self.assertEqual(transition, 'opened')
+        self.assertEqual(incident.state, 'open')
+        self.assertEqual(incident.count, 3)
+        self.assertEqual(incident.peak, 97)
+        # Further breaches fold into the same incident without a new transition
+        self.assertIsNone(self.sample(99, 3))
+        self.assertEqual(incident.peak, 99)
+
+    def test_short_breach_is_dropped(self):
+        self.sample(95, 0)
+        self.assertIsNone(self.sample(80, 1))
+        self.assertEqual(self.tracker.tracked(), [])
+
+    def test_raise_seconds(self):
+        tracker = IncidentTracker(raise_samples=2, raise_seconds=10.0)
+        self.assertIsNone(tracker.sample(KEY, 95, 0, 90, 85))
+        self.assertIsNone(tracker.sample(KEY, 95, 5, 90, 85))
+        self.assertEqual(tracker.sample(KEY, 95, 10, 90, 85)[0], 'opened')
+
+    def test_clear_needs_consecutive_samples(self):
+        for now in range(3):
+            self.sample(95, now)
+        self.assertIsNone(self.sample(80, 3))
+        # Back between the thresholds resets the clear count
+        self.assertIsNone(self.sample(88, 4))
+        self.assertIsNone(self.sample(80, 5))
+        transition, incident = self.sample(80, 6)
+        self.assertEqual(transition, 'closed')
+        self.assertIs(incident.key, KEY)
+        self.assertEqual(self.tracker.tracked(), [])
+
+    def test_close_unseen(self):
+        other = ('Memory', 'System')
+        for now in range(3):
+            self.sample(95, now)
+        self.tracker.sample(other, 95, 0, 90, 85)  # still pending
+        self.tracker.close_unseen()
+
+        # Neither key is sampled this tick: only the open one is reported
+        closed = self.tracker.close_unseen()
+        self.assertEqual([incident.key for incident in closed], [KEY])
+        self.assertEqual(self.tracker.tracked(), [])
+
+    def test_close_unseen_keep(self):
+        for now in range(3):
+            self.sample(95, now)
+        self.tracker.close_unseen()
+        self.assertEqual(self.tracker.close_unseen(keep=lambda key: key == KEY), [])
+        self.assertEqual(self.tracker.tracked(), [KEY])
+
+
+class AlertRateLimiterTest(unittest.TestCase):
+    def test_burst_then_suppress(self):
+        limiter = AlertRateLimiter(burst=3, refill_seconds=60.0)
+        self.assertEqual([limiter.allow(KEY, now=0) for _ in range(5)], [True, True, True, False, False])
+        self.assertEqual(limiter.total_suppressed, 2)
+        self.assertEqual(limiter.take_suppressed(KEY), 2)
+        self.assertEqual(limiter.take_suppressed(KEY), 0)
+        # The running total is not reset by take_suppressed
+        self.assertEqual(limiter.total_suppressed, 2)
+
+    def test_refill(self):
+        limiter = AlertRateLimiter(burst=2, refill_seconds=10.0)
+        self.assertTrue(limiter.allow(KEY, now=0))
+        self.assertTrue(limiter.allow(KEY, now=0))
+        self.assertFalse(limiter.allow(KEY, now=5))  # half a token
+        self.assertTrue(limiter.allow(KEY, now=15))  # 0.5 + 1.0 tokens
+        self.assertFalse(limiter.allow(KEY, now=15))
+
+    def test_refill_is_capped_at_burst(self):
+        limiter = AlertRateLimiter(burst=2, refill_seconds=1.0)
+        limiter.allow(KEY, now=0)
+        self.assertEqual([limiter.allow(KEY, now=1000) for _ in range(3)], [True, True, False])
+
+    def test_keys_are_independent(self):
+        limiter = AlertRateLimiter(burst=1, refill_seconds=60.0)
+        self.assertTrue(limiter.allow(KEY, now=0))
+        self.assertFalse(limiter.allow(KEY, now=0))
+        self.assertTrue(limiter.allow(('CPU', 'node'), now=0))
+        self.assertEqual(limiter.suppressed, {KEY: 1})
+
+    def test_prune_keeps_suppressed_keys(self):
+        limiter = AlertRateLimiter(burst=1, refill_seconds=1.0, max_keys=2)
+        limiter.allow('a', now=0)
+        limiter.allow('b', now=0)
+        limiter.allow('b', now=0)  # suppressed, so it survives the prune
+        limiter.allow('c', now=10)
+        self.assertEqual(set(limiter.buckets), {'b', 'c'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Unit tests for the legacy history import in engine.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alerting import Alert, LogEntry  # noqa: E402
+from engine import legacy_event_rows, legacy_resource  # noqa: E402
+
+
+def old_alert(message, time):
+    return Alert('High', message, '', time, 'System')
+
+
+def old_log(event, timestamp):
+    return LogEntry(timestamp, 'localhost', event, 'High', 'Alert', 'Monitoring', 'system', 'System')
+
+
+def unix(timestamp):
+    return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").timestamp()
+
+
+class LegacyImportTest(unittest.TestCase):
+    def test_resource(self):
+        self.assertEqual(legacy_resource("CPU usage exceeded: 95.0%"), "CPU")
+        self.assertEqual(legacy_resource("System Memory usage exceeded"), "Memory")
+        self.assertEqual(legacy_resource("Disk (C:\\) usage exceeded: 90.9%"), "Disk (C:\\)")
+        self.assertEqual(legacy_resource("Process chrome.exe exceeded limits"), "Process")
+        self.assertIsNone(legacy_resource("User logged in"))
+
+    def test_alerts_share_their_log_row_and_time(self):
+        logs = [old_log("CPU usage exceeded: 95.0%", "2025-01-26 12:00:00"),
+                old_log("Memory usage exceeded: 91.0%", "2025-01-26 12:00:05")]
+        alerts = [old_alert("CPU usage exceeded: 95.0%", "12:00:00"),
+                  old_alert("Memory usage exceeded: 91.0%", "12:00:05")]
+        rows = legacy_event_rows(alerts, logs)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual([row[0] for row in rows], [unix("2025-01-26 12:00:00"), unix("2025-01-26 12:00:05")])
+        self.assertEqual([row[1] for row in rows], ["CPU", "Memory"])
+        self.assertEqual([(row[4], row[9]) for row in rows], [(alert.message, log.event)
+                                                              for alert, log in zip(alerts, logs)])
+
+    def test_repeated_events_pair_in_order(self):
+        logs = [old_log("CPU usage exceeded: 95.0%", "2025-01-26 12:00:00") for _ in range(3)]
+        alerts = [Alert('High', "CPU usage exceeded: 95.0%", str(i), "12:00:00", 'System') for i in range(3)]
+        rows = legacy_event_rows(alerts, logs)
+        self.assertEqual([row[5] for row in rows], ['0', '1', '2'])
+
+    def test_unpaired_entries_keep_their_place(self):
+        logs = [old_log("User logged in", "2025-01-26 11:59:00"),
+                old_log("CPU usage exceeded: 95.0%", "2025-01-26 12:00:00")]
+        alerts = [old_alert("Disk (C:\\) usage exceeded: 90.9%", "11:58:00"),
+                  old_alert("CPU usage exceeded: 95.0%", "12:00:00"),
+                  old_alert("Process x exceeded limits", "12:00:02")]
+        rows = legacy_event_rows(alerts, logs)
+        # (alert message, log event, created) in insertion order
+        self.assertEqual([(row[4], row[9], row[0]) for row in rows], [
+            ("Disk (C:\\) usage exceeded: 90.9%", None, unix("2025-01-26 11:59:00")),
+            (None, "User logged in", unix("2025-01-26 11:59:00")),
+            ("CPU usage exceeded: 95.0%", "CPU usage exceeded: 95.0%", unix("2025-01-26 12:00:00")),
+            ("Process x exceeded limits", None, unix("2025-01-26 12:00:00")),
+        ])
+
+    def test_no_logs(self):
+        rows = legacy_event_rows([old_alert("CPU usage exceeded: 95.0%", "12:00:00")], [])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][1], "CPU")
+
+
+if __name__ == "__main__":
+    unittest.main()
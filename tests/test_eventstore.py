@@ -0,0 +1,119 @@
+"""Unit tests for the SQLite event store in eventstore.py.
+
+    python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from alerting import Alert, LogEntry  # noqa: E402
+from eventstore import EventStore, event_row  # noqa: E402
+
+
+def make_alert(i, process='python'):
+    return Alert('High', f"alert {i}", f"details {i}", f"12:00:{i % 60:02d}", process)
+
+
+def make_log(i, process='python'):
+    return LogEntry(f"2025-01-01 12:00:{i % 60:02d}", 'localhost', f"log {i}", 'High', 'Alert',
+                    'Monitoring', 'system', process)
+
+
+class EventStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.store = EventStore(os.path.join(directory, 'events.db'))
+        self.addCleanup(self.store.close)
+
+    def fill(self, count):
+        """Insert count events, oldest first; every third has no alert and every fifth no log."""
+        rows = []
+        for i in range(count):
+            process = 'node' if i % 2 else 'python'
+            alert = make_alert(i, process) if i % 3 else None
+            log = make_log(i, process) if i % 5 or alert is None else None
+            rows.append(event_row(float(i), 'CPU' if i % 4 else 'Memory', alert, log))
+        self.store.insert(rows)
+
+    def test_empty(self):
+        self.assertTrue(self.store.empty())
+        self.fill(1)
+        self.assertFalse(self.store.empty())
+
+    def test_keyset_pages_cover_everything_once(self):
+        self.fill(100)
+        expected = self.store.alerts(1000)
+        pages = []
+        before = None
+        while True:
+            page = self.store.alerts(7, before=before)
+            if not page:
+                break
+            pages.append(page)
+            before = page[-1][0]
+        self.assertTrue(all(len(page) == 7 for page in pages[:-1]))
+        self.assertEqual([row for page in pages for row in page], expected)
+        ids = [record_id for record_id, _ in expected]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+        self.assertTrue(all(alert.message for _, alert in expected))
+
+    def test_after_and_before(self):
+        self.fill(30)
+        ids = [record_id for record_id, _ in self.store.logs(1000)]
+        middle = self.store.logs(1000, before=ids[5], after=ids[-5])
+        self.assertEqual([record_id for record_id, _ in middle], ids[6:-5])
+        newer = self.store.logs(1000, after=ids[3])
+        self.assertEqual([record_id for record_id, _ in newer], ids[:3])
+
+    def test_alerts_and_logs_are_separate(self):
+        self.fill(30)
+        alerts = self.store.alerts(1000)
+        logs = self.store.logs(1000)
+        self.assertEqual(len(alerts), len([i for i in range(30) if i % 3]))
+        self.assertEqual(len(logs), len([i for i in range(30) if i % 5 or not i % 3]))
+        self.assertEqual(alerts[0][1], make_alert(29, 'node'))
+        self.assertEqual(logs[0][1], make_log(29, 'node'))
+
+    def test_filters(self):
+        self.fill(40)
+        python = self.store.alerts(1000, process='python')
+        self.assertTrue(python)
+        self.assertTrue(all(alert.process_name == 'python' for _, alert in python))
+        memory = self.store.logs(1000, resource='Memory')
+        self.assertEqual(len(memory), len([i for i in range(40) if not i % 4 and (i % 5 or not i % 3)]))
+        # Filters and keyset pagination combine
+        page = self.store.alerts(3, before=python[2][0], process='python')
+        self.assertEqual(page, python[3:6])
+
+    def test_offset_and_oldest_first(self):
+        self.fill(50)
+        newest_first = self.store.logs(1000)
+        self.assertEqual(self.store.logs(5, offset=10), newest_first[10:15])
+        self.assertEqual(self.store.logs(1000, oldest_first=True), newest_first[::-1])
+
+    def test_count(self):
+        self.assertEqual(self.store.count('logs'), (0, 0))
+        self.fill(20)
+        logs = self.store.logs(1000)
+        self.assertEqual(self.store.count('logs'), (len(logs), logs[0][0]))
+        self.assertEqual(self.store.count('logs', after=logs[4][0]), (4, logs[0][0]))
+        self.assertEqual(self.store.count('logs', after=logs[0][0]), (0, logs[0][0]))
+        alerts = self.store.alerts(1000)
+        self.assertEqual(self.store.count('alerts')[0], len(alerts))
+
+    def test_insert_from_another_thread(self):
+        self.fill(3)
+        worker = threading.Thread(target=lambda: (self.store.insert([event_row(9.0, 'CPU', make_alert(9), None)]),
+                                                  self.store.close()))
+        worker.start()
+        worker.join()
+        self.assertEqual(self.store.alerts(1)[0][1], make_alert(9))
+
+
+if __name__ == "__main__":
+    unittest.main()
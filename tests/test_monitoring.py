@@ -0,0 +1,73 @@
+"""Unit tests for the sampling schedule in monitoring.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from monitoring import AdaptiveInterval, DiskSample, Snapshot, limit_ratio, usage_ratio  # noqa: E402
+
+Memory = namedtuple('Memory', ['percent'])
+
+
+class AdaptiveIntervalTest(unittest.TestCase):
+    def setUp(self):
+        self.interval = AdaptiveInterval(min_interval=0.5, max_interval=10.0, base_interval=1.0)
+
+    def test_idle_backs_off_to_max(self):
+        delays = [self.interval.next_interval(0.1) for _ in range(6)]
+        self.assertEqual(delays, [2.0, 4.0, 8.0, 10.0, 10.0, 10.0])
+
+    def test_near_a_limit_drops_to_min(self):
+        for _ in range(4):
+            self.interval.next_interval(0.1)
+        self.assertEqual(self.interval.next_interval(0.8), 0.5)
+        self.assertEqual(self.interval.next_interval(1.5), 0.5)
+
+    def test_in_between_returns_to_base(self):
+        self.interval.next_interval(0.9)
+        self.assertEqual(self.interval.next_interval(0.6), 1.0)
+        for _ in range(3):
+            self.interval.next_interval(0.1)
+        self.assertEqual(self.interval.next_interval(0.6), 1.0)
+
+    def test_ceiling(self):
+        for _ in range(4):
+            self.interval.next_interval(0.1)
+        self.assertEqual(self.interval.next_interval(0.1, ceiling=1.0), 1.0)
+        # The ceiling never goes below min_interval
+        self.assertEqual(self.interval.next_interval(0.1, ceiling=0.1), 0.5)
+        # And does not change the backed-off delay itself
+        self.assertEqual(self.interval.next_interval(0.1), 10.0)
+
+    def test_min_above_base(self):
+        interval = AdaptiveInterval(min_interval=2.0, max_interval=10.0, base_interval=1.0)
+        self.assertEqual(interval.next_interval(0.6), 2.0)
+
+
+class UsageRatioTest(unittest.TestCase):
+    def test_closest_metric_wins(self):
+        limits = {'cpu': 50, 'memory': 80, 'disk': 90}
+        self.assertEqual(usage_ratio(limits, 25, 40), 0.5)
+        self.assertEqual(usage_ratio(limits, 25, 40, [45, 81]), 0.9)
+        self.assertEqual(usage_ratio(limits, 60, 40), 1.2)
+
+    def test_zero_limit_counts_as_one(self):
+        limits = {'cpu': 0, 'memory': 0, 'disk': 0}
+        self.assertEqual(usage_ratio(limits, 5, 3, [2]), 5.0)
+
+    def test_missing_limits_default_to_90(self):
+        self.assertEqual(usage_ratio({}, 45, 9), 0.5)
+
+    def test_limit_ratio_of_a_snapshot(self):
+        snapshot = Snapshot(0.0, 10.0, None, Memory(20.0), (DiskSample('/dev/sda1', '/', 100, 95, 95.0),),
+                            (), (), ())
+        self.assertAlmostEqual(limit_ratio(snapshot, {'cpu': 0, 'memory': 50, 'disk': 100}), 10.0)
+        self.assertAlmostEqual(limit_ratio(snapshot, {'cpu': 50, 'memory': 50, 'disk': 100}), 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
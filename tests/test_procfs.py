@@ -0,0 +1,81 @@
+"""Unit tests for the /proc fast-path reader in procfs.py (Linux only).
+
+    python -m pytest tests
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import psutil
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import procfs  # noqa: E402
+
+
+@unittest.skipUnless(procfs.available(), "/proc is not available")
+class ProcfsReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.reader = procfs.ProcfsReader()
+
+    def test_reads_this_process(self):
+        pid = os.getpid()
+        self.assertEqual(self.reader.read([pid]), 1)
+        proc = psutil.Process(pid)
+        self.assertEqual(self.reader.pids[0], pid)
+        self.assertEqual(self.reader.names[0], proc.name())
+        self.assertEqual(self.reader.states[0], 'running')
+        self.assertEqual(self.reader.num_threads[0], proc.num_threads())
+        rss = proc.memory_info().rss
+        self.assertLess(abs(self.reader.rss[0] - rss), 8 * 1024 * 1024)
+        cpu_times = proc.cpu_times()
+        self.assertAlmostEqual(self.reader.cpu_times[0], cpu_times.user + cpu_times.system, delta=0.5)
+
+    def test_start_time_is_stable(self):
+        pid = os.getpid()
+        self.reader.read([pid])
+        start_time = self.reader.start_times[0]
+        self.assertGreater(start_time, 0)
+        self.reader.read([pid])
+        self.assertEqual(self.reader.start_times[0], start_time)
+
+    def test_missing_pids_are_skipped(self):
+        self.assertEqual(self.reader.read([2 ** 22 + 1, os.getpid()]), 1)
+        self.assertEqual(self.reader.pids[0], os.getpid())
+
+    def test_full_scan_grows_past_capacity(self):
+        reader = procfs.ProcfsReader(capacity=1)
+        n = reader.read()
+        self.assertGreaterEqual(n, 1)
+        self.assertIn(os.getpid(), list(reader.pids[:n]))
+
+    def test_malformed_rows_are_skipped(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        rows = {
+            1: (None, None),  # a good copy of /proc/self
+            2: (b'garbage', None),
+            3: (None, b'12'),
+            4: (b'4 (short) S 1', None),
+        }
+        for pid, (stat, statm) in rows.items():
+            os.mkdir(os.path.join(root, str(pid)))
+            for name, content in (('stat', stat), ('statm', statm)):
+                if content is None:
+                    with open(f'/proc/self/{name}', 'rb') as f:
+                        content = f.read()
+                with open(os.path.join(root, str(pid), name), 'wb') as f:
+                    f.write(content)
+
+        proc_root = procfs.PROC_ROOT
+        procfs.PROC_ROOT = root
+        try:
+            n = self.reader.read()
+        finally:
+            procfs.PROC_ROOT = proc_root
+        self.assertEqual(list(self.reader.pids[:n]), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Unit tests for the Alerts grid in tables.py (needs customtkinter and a display).
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+try:
+    import customtkinter as ctk
+    from tables import CanvasTable
+except ImportError:
+    ctk = None
+
+COLUMNS = [("Id", 60), ("Name", 120)]
+
+
+def cells(record):
+    return [(str(record[0]), None), (record[1], None)]
+
+
+@unittest.skipIf(ctk is None, "customtkinter is not installed")
+class CanvasTableTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = ctk.CTk()
+        except Exception as e:  # no display
+            self.skipTest(f"cannot open a window: {e}")
+        self.addCleanup(self.root.destroy)
+        self.records = []  # (id, record) in the "store", oldest first
+
+    def make_table(self, rows_in_view=5, **options):
+        table = CanvasTable(self.root, COLUMNS, cells, sort_keys=[None, lambda record: record[1]],
+                            fetch_newer=self.newer, **options)
+        table.on_resize(SimpleNamespace(height=CanvasTable.HEADER_HEIGHT + rows_in_view * CanvasTable.ROW_HEIGHT))
+        return table
+
+    def add(self, *names):
+        start = self.records[-1][0] + 1 if self.records else 1
+        for record_id, name in enumerate(names, start):
+            self.records.append((record_id, (record_id, name)))
+
+    def newer(self, after_id):
+        return [pair for pair in self.records if pair[0] > after_id]
+
+    def shown(self, table):
+        return [table.record_at(index)[0] for index in range(table.row_count())]
+
+    def test_refresh_bisects_in_id_order(self):
+        table = self.make_table()
+        self.add('c', 'a', 'b')
+        table.load(list(self.records))
+        self.add('e', 'd')
+        self.assertEqual(table.refresh(), 2)
+        self.assertEqual(self.shown(table), [5, 4, 3, 2, 1])
+        self.assertEqual(table.newest_id, 5)
+        self.assertEqual(table.refresh(), 0)
+
+    def test_refresh_bisects_under_a_sort_column(self):
+        table = self.make_table()
+        self.add('c', 'a', 'e')
+        table.load(list(self.records))
+        table.sort_by(1)
+        self.add('d', 'b', 'a')
+        table.refresh()
+        self.assertEqual([table.record_at(index)[1] for index in range(6)], ['a', 'a', 'b', 'c', 'd', 'e'])
+        # Equal keys stay in id order
+        self.assertEqual([table.record_at(index)[0] for index in range(2)], [2, 6])
+        table.sort_by(1)
+        self.assertEqual([table.record_at(index)[1] for index in range(6)], ['e', 'd', 'c', 'b', 'a', 'a'])
+
+    def test_refresh_keeps_the_rows_in_view(self):
+        table = self.make_table(rows_in_view=3)
+        self.add(*'abcdefghij')
+        table.load(list(self.records))
+        table.scroll_to(4)
+        in_view = [table.record_at(table.top + k) for k in range(3)]
+        self.add('k', 'l')
+        table.refresh()
+        self.assertEqual(table.top, 6)
+        self.assertEqual([table.record_at(table.top + k) for k in range(3)], in_view)
+
+    def test_refresh_follows_the_newest(self):
+        table = self.make_table(rows_in_view=3)
+        self.add(*'abcde')
+        table.load(list(self.records))
+        self.add('f')
+        table.refresh()
+        self.assertEqual(table.top, 0)
+        self.assertEqual(table.record_at(0), (6, 'f'))
+
+    def test_load_trims_to_the_limit(self):
+        table = self.make_table(limit=10)
+        self.add(*'abcdefghijklmno')
+        table.load(list(self.records))
+        self.assertEqual(self.shown(table), list(range(15, 5, -1)))
+        self.assertEqual(list(table.ids), list(range(6, 16)))
+
+    def test_refresh_trims_in_steps(self):
+        table = self.make_table(limit=10)
+        self.add(*'abcdefghij')
+        table.load(list(self.records))
+        # One record over the limit is within the slack of a tenth
+        self.add('k')
+        table.refresh()
+        self.assertEqual(table.row_count(), 11)
+        self.add('l')
+        table.refresh()
+        self.assertEqual(self.shown(table), list(range(12, 2, -1)))
+        self.assertEqual(list(table.ids), list(range(3, 13)))
+
+    def test_trim_under_a_sort_column_drops_the_oldest(self):
+        table = self.make_table(limit=4)
+        self.add('a', 'z', 'b', 'y')
+        table.load(list(self.records))
+        table.sort_by(1)
+        self.add('c', 'x')
+        table.refresh()
+        self.assertEqual([table.record_at(index)[1] for index in range(4)], ['b', 'c', 'x', 'y'])
+
+    def test_trim_clamps_the_scroll_position(self):
+        table = self.make_table(rows_in_view=3, limit=5)
+        self.add(*'abcde')
+        table.load(list(self.records))
+        table.sort_by(0)  # oldest first, so new records land below the view
+        table.scroll_to(2)
+        self.add(*'fgh')
+        table.refresh()
+        self.assertEqual(table.row_count(), 5)
+        self.assertLessEqual(table.top, table.row_count() - len(table.pool))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests for the batched widget writes in widgets.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from widgets import WidgetWriter  # noqa: E402
+
+
+class FakeRoot:
+    """Hold after_idle callbacks until run() is called."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after_idle(self, callback):
+        self.callbacks.append(callback)
+        return f"after#{len(self.callbacks)}"
+
+    def run(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class FakeWidget:
+    """Record configure() and set() calls like a label or progress bar."""
+
+    def __init__(self):
+        self.calls = []
+        self.exists = True
+
+    def configure(self, **options):
+        self.calls.append(('configure', options))
+
+    def set(self, value):
+        self.calls.append(('set', value))
+
+    def winfo_exists(self):
+        return self.exists
+
+
+class WidgetWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.writer = WidgetWriter(self.root)
+        self.label = FakeWidget()
+        self.bar = FakeWidget()
+
+    def test_one_flush_per_tick(self):
+        self.writer.text(self.label, "CPU: 10%")
+        self.writer.progress(self.bar, 0.1)
+        self.writer.text(self.label, "CPU: 11%")
+        self.assertEqual(len(self.root.callbacks), 1)
+        self.root.run()
+        self.assertEqual(self.label.calls, [('configure', {'text': "CPU: 11%"})])
+        self.assertEqual(self.bar.calls, [('set', 0.1)])
+        self.writer.text(self.label, "CPU: 12%")
+        self.assertEqual(len(self.root.callbacks), 1)
+
+    def test_unchanged_values_are_skipped(self):
+        self.writer.text(self.label, "CPU: 10%")
+        self.writer.progress(self.bar, 0.5)
+        self.root.run()
+        self.writer.text(self.label, "CPU: 10%")
+        self.writer.progress(self.bar, 0.5)
+        self.assertEqual(self.writer.skipped, 2)
+        self.assertEqual(self.root.callbacks, [])
+        self.assertEqual(len(self.label.calls), 1)
+        self.assertEqual(len(self.bar.calls), 1)
+
+    def test_change_undone_within_a_tick(self):
+        self.writer.text(self.label, "CPU: 10%")
+        self.root.run()
+        self.writer.text(self.label, "CPU: 20%")
+        self.writer.text(self.label, "CPU: 10%")
+        self.root.run()
+        self.assertEqual(self.label.calls, [('configure', {'text': "CPU: 10%"})])
+
+    def test_progress_is_rounded(self):
+        self.writer.progress(self.bar, 0.12341)
+        self.root.run()
+        self.writer.progress(self.bar, 0.12349)
+        self.assertEqual(self.writer.skipped, 1)
+        self.assertEqual(self.bar.calls, [('set', 0.123)])
+        writer = WidgetWriter(self.root, progress_step=0.01)
+        writer.progress(self.bar, 0.456)
+        self.assertEqual(writer.pending[self.bar], {'set': 0.46})
+
+    def test_options_of_one_widget_are_configured_together(self):
+        self.writer.write(self.label, 'text', "Disk")
+        self.writer.write(self.label, 'text_color', "red")
+        self.root.run()
+        self.assertEqual(self.label.calls, [('configure', {'text': "Disk", 'text_color': "red"})])
+        self.writer.write(self.label, 'text_color', "red")
+        self.writer.write(self.label, 'text', "Disk (C:)")
+        self.root.run()
+        self.assertEqual(self.label.calls[-1], ('configure', {'text': "Disk (C:)"}))
+
+    def test_destroyed_widgets_are_skipped(self):
+        self.label.exists = False
+        self.writer.text(self.label, "CPU: 10%")
+        self.writer.text(self.bar, "GPU")
+        self.root.run()
+        self.assertEqual(self.label.calls, [])
+        self.assertEqual(self.bar.calls, [('configure', {'text': "GPU"})])
+
+    def test_rendered_values_do_not_keep_widgets_alive(self):
+        self.writer.text(self.label, "CPU: 10%")
+        self.root.run()
+        self.assertEqual(len(self.writer.rendered), 1)
+        del self.label
+        self.assertEqual(len(self.writer.rendered), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Change-detecting, batched writes to the live resource widgets."""
+import weakref
+
+UNSET = object()  # no value rendered yet
+
+
+class WidgetWriter:
+    """Queue widget updates for a tick and apply them in one idle callback.
+
+    text() and progress() record the value a widget should show; flush()
+    runs once per tick from after_idle and only touches a widget when the
+    value differs from the last one it rendered, so unchanged labels and
+    progress bars cost no configure call and no redraw. Progress values
+    are rounded to `progress_step`, well below a pixel of bar.
+    """
+
+    def __init__(self, root, progress_step=0.001):
+        self.root = root
+        self.progress_digits = len(f"{progress_step:f}".rstrip("0").split(".")[1])
+        self.rendered = weakref.WeakKeyDictionary()  # widget -> {option: last value written}
+        self.pending = {}  # widget -> {option: value}, in the order they were queued
+        self.after_id = None
+        self.skipped = 0  # writes dropped because nothing changed
+
+    def text(self, widget, text):
+        """Show text on a label."""
+        self.write(widget, 'text', text)
+
+    def progress(self, widget, value):
+        """Set a progress bar to value (0-1)."""
+        self.write(widget, 'set', round(value, self.progress_digits))
+
+    def write(self, widget, option, value):
+        """Queue one option of widget to be set to value on the next flush."""
+        options = self.pending.get(widget)
+        if self.rendered.get(widget, {}).get(option, UNSET) == value:
+            self.skipped += 1
+            if options is not None:
+                options.pop(option, None)  # a change earlier in this tick was undone
+            return
+        if options is None:
+            options = self.pending[widget] = {}
+        options[option] = value
+        if self.after_id is None:
+            self.after_id = self.root.after_idle(self.flush)
+
+    def flush(self):
+        """Apply every queued change, one configure call per widget."""
+        self.after_id = None
+        pending, self.pending = self.pending, {}
+        for widget, options in pending.items():
+            if not options:
+                continue
+            try:
+                if not widget.winfo_exists():
+                    continue
+                options = dict(options)
+                value = options.pop('set', None)
+                if value is not None:
+                    widget.set(value)
+                if options:
+                    widget.configure(**options)
+                rendered = self.rendered.setdefault(widget, {})
+                rendered.update(options)
+                if value is not None:
+                    rendered['set'] = value
+            except Exception as e:
+                print(f"Error updating widget: {e}")